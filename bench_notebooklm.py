@@ -0,0 +1,313 @@
+"""
+NotebookLM Benchmark - 로컬 NotebookLM stand-in으로 브라우저 단계 end-to-end 측정
+
+notebooklm.google.com에 접속하지 않고 notebooklm_agent의 run()을 그대로
+실행하여 (접속 → 노트북 삭제/생성 또는 동기화 → 소스 추가 → 오디오 개요 생성/다운로드)
+단계별 소요 시간과 대기 조건별 시간을 보고한다. 셀렉터/대기 로직을 바꾼 뒤
+실제 계정 없이 회귀를 잡는 용도.
+
+동작 방식:
+- notebooklm_standin.NotebookLMStandin을 로컬 포트에 띄우고, 같은 이름의 노트북
+  (처리 완료된 소스 일부 + 목록에서 빠진 오래된 소스)과 다른 노트북 몇 개를 미리 만든다
+- 프로필 없는 Chromium에서 https://notebooklm.google.com 요청을 전부 stand-in으로
+  돌려보내고, 그 밖의 요청은 차단한다 (리소스 차단 프로필은 적용하지 않음)
+- 오디오 다운로드용 공유 세션(http_session)에도 같은 주소 변환 어댑터를 붙인다
+- 셀렉터 통계/매니페스트/디버그 스냅샷/오디오 파일은 임시 디렉토리를 사용 (data/ 오염 없음)
+- 단계 시간은 에이전트의 상위 메서드를 감싸서, 대기 시간은 WAIT_TRACKER 기록으로 잰다
+
+사용법:
+    python bench_notebooklm.py                                   # 영상 12개, 소스 처리 3초
+    python bench_notebooklm.py --download-audio --audio-latency-ms 8000
+    python bench_notebooklm.py --sync --rounds 2                  # 동기화 모드 (2회차는 변경 없음)
+    python bench_notebooklm.py --videos 60                        # 소스 한도 초과 → 추가 노트북
+    python bench_notebooklm.py --source-error-rate 0.1 --submit-error-rate 0.2 --lock-while-processing
+    python bench_notebooklm.py --visible --verbose --json bench_nlm.json
+
+종료 코드: 0 모든 회차 성공 / 1 실패한 회차 있음 / 2 브라우저를 띄울 수 없음 (회차 실행 안 함)
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+# Windows 콘솔 인코딩 문제 방지 (cp949 → utf-8)
+if sys.platform == "win32":
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+    sys.stderr.reconfigure(encoding="utf-8", errors="replace")
+
+sys.path.insert(0, str(Path(__file__).parent))
+import notebooklm_agent
+from lib import debug_snapshots
+from lib.debug_snapshots import SnapshotStore
+from lib.http_session import DEFAULT_RETRY, POOL_SIZE, get_session
+from lib.notebook_sync import NotebookManifest
+from lib.selector_registry import SelectorRegistry
+from notebooklm_agent import NotebookLMAgent
+from notebooklm_standin import NotebookLMStandin, standin_video_title
+from patchright.sync_api import Error as PlaywrightError
+from patchright.sync_api import sync_playwright
+from requests.adapters import HTTPAdapter
+
+NOTEBOOKLM_ORIGIN = "https://notebooklm.google.com"
+
+
+class _StandinAdapter(HTTPAdapter):
+    """https://notebooklm.google.com 요청(오디오 다운로드)을 stand-in 서버로 돌려보내는 어댑터."""
+
+    def __init__(self, base_url: str):
+        super().__init__(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=DEFAULT_RETRY)
+        self.base_url = base_url
+
+    def send(self, request, **kwargs):
+        if request.url.startswith(NOTEBOOKLM_ORIGIN):
+            request.url = self.base_url + request.url[len(NOTEBOOKLM_ORIGIN):]
+        return super().send(request, **kwargs)
+
+
+class StandinAgent(NotebookLMAgent):
+    """stand-in에 붙는 NotebookLMAgent — 상위 단계마다 소요 시간을 기록한다."""
+
+    def __init__(self, base_url: str, executable_path: str | None = None, **kwargs):
+        super().__init__(**kwargs)
+        self.base_url = base_url
+        self.executable_path = executable_path
+        self.phases: list[tuple[str, float]] = []
+
+    def start(self):
+        # 로그인 프로필/쿠키가 필요 없으므로 영구 프로필 대신 빈 컨텍스트를 쓴다
+        self.playwright = sync_playwright().start()
+        browser = self.playwright.chromium.launch(headless=self.headless, executable_path=self.executable_path)
+        self.context = browser.new_context(locale="ko-KR", accept_downloads=True)
+        self.context.route("**/*", self._route)
+        self.page = self.context.new_page()
+        notebooklm_agent.WAIT_TRACKER.reset()
+
+    def _route(self, route):
+        url = route.request.url
+        if not url.startswith(NOTEBOOKLM_ORIGIN):
+            # stand-in 밖으로는 나가지 않는다
+            route.abort()
+            return
+        try:
+            route.fulfill(response=route.fetch(url=self.base_url + url[len(NOTEBOOKLM_ORIGIN):]))
+        except Exception:
+            # 페이지가 닫히는 중이면 요청도 이미 사라졌다
+            with contextlib.suppress(Exception):
+                route.abort()
+
+    def _timed(self, name: str, method, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            self.phases.append((name, time.perf_counter() - started))
+
+    def navigate_to_notebooklm(self):
+        return self._timed("navigate", super().navigate_to_notebooklm)
+
+    def recreate_notebook(self):
+        return self._timed("recreate_notebook", super().recreate_notebook)
+
+    def sync_notebook(self, *args, **kwargs):
+        return self._timed("sync_notebook", super().sync_notebook, *args, **kwargs)
+
+    def add_sources(self, *args, **kwargs):
+        return self._timed("add_sources", super().add_sources, *args, **kwargs)
+
+    def generate_audio_overview(self, *args, **kwargs):
+        return self._timed("generate_audio_overview", super().generate_audio_overview, *args, **kwargs)
+
+    def generate_and_download_audio(self, *args, **kwargs):
+        return self._timed("generate_and_download_audio", super().generate_and_download_audio, *args, **kwargs)
+
+
+def _video_urls(count: int, prefix: str = "sb") -> list[str]:
+    # 11자 영상 ID (SourceTracker가 응답 본문에서 찾는 형식)
+    return [f"https://www.youtube.com/watch?v={prefix}{n:09d}" for n in range(count)]
+
+
+def _browser_error(executable_path: str | None, headless: bool) -> str | None:
+    """브라우저를 한 번 띄워 본다 — 실행 환경 문제를 회차 실패(회귀)와 구분하기 위해."""
+    try:
+        with sync_playwright() as playwright:
+            playwright.chromium.launch(headless=headless, executable_path=executable_path).close()
+    except PlaywrightError as e:
+        lines = str(e).splitlines()
+        # 실행 파일은 있는데 바로 죽으면 원인(빠진 공유 라이브러리)은 브라우저 로그 안에 있다
+        cause = next((line.strip() for line in lines if "shared libraries" in line), None)
+        return f"{lines[0]} ({cause})" if cause else lines[0]
+    return None
+
+
+def _isolate_agent_state(workdir: Path):
+    """notebooklm_agent의 파일 기반 상태를 임시 디렉토리로 교체."""
+    notebooklm_agent.SELECTOR_REGISTRY = SelectorRegistry(workdir / "selector_stats.json")
+    notebooklm_agent.NOTEBOOK_MANIFEST = NotebookManifest(workdir / "notebook_manifest.json")
+    notebooklm_agent.AUDIO_DIR = workdir / "audio"
+    debug_snapshots._default_store = SnapshotStore(workdir / "debug")
+
+
+def _run_round(agent: StandinAgent, urls: list[str], titles: dict | None, args) -> dict:
+    output = io.StringIO()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(sys.stdout if args.verbose else output):
+        result = agent.run(urls, titles=titles, sync=args.sync, download_audio=args.download_audio)
+    wall = time.perf_counter() - started
+
+    phases = defaultdict(lambda: [0, 0.0])
+    for name, seconds in agent.phases:
+        phases[name][0] += 1
+        phases[name][1] += seconds
+    waits = defaultdict(lambda: [0, 0.0, 0.0, 0])
+    for step, baseline, actual, ok in notebooklm_agent.WAIT_TRACKER.records:
+        row = waits[step]
+        row[0] += 1
+        row[1] += baseline
+        row[2] += actual
+        row[3] += 0 if ok else 1
+    audio = result.get("audio_file") or {}
+    return {
+        "wall_seconds": round(wall, 3),
+        "success": result["success"],
+        "sources_added": result["sources_added"],
+        "failed_urls": len(result["failed_urls"]),
+        "spillover_notebooks": len(result.get("spillover", [])),
+        "audio_generated": result["audio_generated"],
+        "audio_bytes": audio.get("bytes", 0),
+        "phases": {name: {"calls": n, "seconds": round(s, 3)} for name, (n, s) in phases.items()},
+        "waits": {step: {"count": n, "baseline_seconds": round(b, 3), "seconds": round(a, 3), "timeouts": t}
+                  for step, (n, b, a, t) in waits.items()},
+        "log_tail": output.getvalue().splitlines()[-15:] if not args.verbose else [],
+    }
+
+
+def _print_round(round_no: int, result: dict, total_urls: int):
+    status = "✅" if result["success"] else "❌"
+    audio = f"{result['audio_bytes'] // 1024}KB" if result["audio_bytes"] else ("생성" if result["audio_generated"] else "없음")
+    print(f"\n▶ round {round_no} {status}")
+    print(f"  소요: {result['wall_seconds']:.2f}초 | 소스 {result['sources_added']}/{total_urls} "
+          f"(실패 {result['failed_urls']}) | 추가 노트북 {result['spillover_notebooks']}개 | 오디오: {audio}")
+    print(f"  {'단계':<30} {'호출':>4} {'시간':>8}")
+    for name, stats in result["phases"].items():
+        print(f"  {name:<30} {stats['calls']:>4} {stats['seconds']:>7.2f}s")
+    print(f"  {'대기 조건':<30} {'횟수':>4} {'실제':>8} {'기존 sleep':>10}")
+    for step, stats in sorted(result["waits"].items(), key=lambda kv: -kv[1]["seconds"]):
+        if stats["seconds"] < 0.01 and not stats["timeouts"]:
+            continue
+        flag = f"  ⚠️ 타임아웃 {stats['timeouts']}회" if stats["timeouts"] else ""
+        print(f"  {step:<30} {stats['count']:>4} {stats['seconds']:>7.2f}s {stats['baseline_seconds']:>9.1f}s{flag}")
+    if not result["success"] and result["log_tail"]:
+        print("  --- 에이전트 로그 (마지막 15줄, 전체는 --verbose) ---")
+        for line in result["log_tail"]:
+            print(f"  | {line}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="브라우저 단계 오프라인 벤치마크 (로컬 NotebookLM stand-in)")
+    parser.add_argument("--videos", type=int, default=12, help="추가할 영상 URL 수")
+    parser.add_argument("--notebook", default="Daily new", help="노트북 이름")
+    parser.add_argument("--existing-sources", type=int, default=4, help="기존 노트북에 이미 들어 있는 (목록의) 소스 수")
+    parser.add_argument("--stale-sources", type=int, default=2, help="기존 노트북에 남아 있는 목록 밖 소스 수")
+    parser.add_argument("--other-notebooks", type=int, default=3, help="홈 화면의 다른 노트북 수")
+    parser.add_argument("--source-latency-ms", type=float, default=3000, help="소스 처리 시간(ms)")
+    parser.add_argument("--source-jitter-ms", type=float, default=1000, help="소스 처리 시간 편차(ms)")
+    parser.add_argument("--source-error-rate", type=float, default=0.0, help="소스 처리 실패 비율 (0~1)")
+    parser.add_argument("--submit-error-rate", type=float, default=0.0, help="소스 추가 대화상자 오류 비율 (0~1)")
+    parser.add_argument("--lock-while-processing", action="store_true", help="처리 중에는 소스 추가 버튼 비활성화")
+    parser.add_argument("--audio-latency-ms", type=float, default=5000, help="오디오 개요 생성 시간(ms)")
+    parser.add_argument("--audio-error-rate", type=float, default=0.0, help="오디오 개요 생성 실패 비율 (0~1)")
+    parser.add_argument("--page-latency-ms", type=float, default=50, help="페이지/RPC 응답 지연(ms)")
+    parser.add_argument("--seed", type=int, default=0, help="오류 주입 난수 시드")
+    parser.add_argument("--sync", action="store_true", help="재생성 대신 동기화 모드로 실행")
+    parser.add_argument("--download-audio", action="store_true", help="오디오 개요 생성 완료까지 기다려 다운로드")
+    parser.add_argument("--no-titles", action="store_true", help="예상 제목 없이 실행 (행 매칭을 순서로만)")
+    parser.add_argument("--rounds", type=int, default=1, help="반복 횟수 (같은 stand-in 상태에서 이어서)")
+    parser.add_argument("--visible", action="store_true", help="브라우저 창 표시")
+    parser.add_argument("--executable-path", help="Chromium 실행 파일 (기본: patchright가 설치한 브라우저)")
+    parser.add_argument("--json", type=Path, help="결과를 JSON 파일로 저장")
+    parser.add_argument("--verbose", action="store_true", help="notebooklm_agent 로그 출력")
+    args = parser.parse_args()
+    if args.visible and not args.download_audio:
+        print("ℹ️ --visible에서 --download-audio가 없으면 에이전트가 마지막에 Enter 입력을 기다립니다")
+
+    launch_error = _browser_error(args.executable_path, headless=not args.visible)
+    if launch_error:
+        print(f"❌ 브라우저를 띄울 수 없어 벤치마크를 건너뜀: {launch_error}")
+        print("   patchright install chromium 또는 --executable-path로 실행 가능한 Chromium을 지정하세요")
+        sys.exit(2)
+
+    standin = NotebookLMStandin(
+        source_latency_ms=args.source_latency_ms,
+        source_jitter_ms=args.source_jitter_ms,
+        source_error_rate=args.source_error_rate,
+        submit_error_rate=args.submit_error_rate,
+        lock_while_processing=args.lock_while_processing,
+        audio_latency_ms=args.audio_latency_ms,
+        audio_error_rate=args.audio_error_rate,
+        page_latency_ms=args.page_latency_ms,
+        seed=args.seed,
+    )
+    urls = _video_urls(args.videos)
+    titles = None if args.no_titles else {url: standin_video_title(url) for url in urls}
+    for n in range(args.other_notebooks):
+        standin.add_notebook(f"Other notebook {n + 1}", _video_urls(3, prefix=f"o{n:01d}"))
+    standin.add_notebook(args.notebook, urls[:args.existing_sources] + _video_urls(args.stale_sources, prefix="st"))
+    base_url = standin.start()
+
+    print("=" * 60)
+    print("🧪 NotebookLM Benchmark")
+    print(f"   stand-in: {base_url} | 영상 {args.videos}개 | 모드: {'동기화' if args.sync else '재생성'}"
+          f" | 오디오: {'다운로드' if args.download_audio else '패널만'}")
+    print(f"   소스 처리 {args.source_latency_ms:.0f}±{args.source_jitter_ms:.0f}ms (실패 {args.source_error_rate:.0%},"
+          f" 제출 오류 {args.submit_error_rate:.0%}) | 오디오 {args.audio_latency_ms:.0f}ms"
+          f" | 응답 지연 {args.page_latency_ms:.0f}ms")
+    print("=" * 60)
+
+    session = get_session()
+    session.mount(NOTEBOOKLM_ORIGIN, _StandinAdapter(base_url))
+    results = []
+    try:
+        with tempfile.TemporaryDirectory(prefix="bench_notebooklm_") as tmp:
+            with contextlib.redirect_stdout(io.StringIO()):
+                _isolate_agent_state(Path(tmp))
+            for round_no in range(1, args.rounds + 1):
+                agent = StandinAgent(base_url, args.executable_path, notebook_name=args.notebook, headless=not args.visible)
+                result = _run_round(agent, urls, titles, args)
+                _print_round(round_no, result, len(urls))
+                results.append(result)
+    finally:
+        session.adapters.pop(NOTEBOOKLM_ORIGIN, None)
+        standin.stop()
+
+    notebooks = standin.notebooks()
+    print(f"\n📚 stand-in 최종 상태 (노트북 {len(notebooks)}개)")
+    for notebook in notebooks:
+        states = defaultdict(int)
+        for source in notebook["sources"]:
+            states[source["state"]] += 1
+        summary = ", ".join(f"{state} {n}" for state, n in sorted(states.items())) or "소스 없음"
+        print(f"  {notebook['title']:<30} {summary} | 오디오: {notebook['audio'] or '-'}")
+    print(f"\n📊 stand-in 요청 수: {dict(sorted(standin.requests.items()))}")
+
+    if args.json:
+        report = {
+            "config": {k: (str(v) if isinstance(v, Path) else v) for k, v in vars(args).items()},
+            "results": results,
+            "notebooks": notebooks,
+            "server_requests": dict(standin.requests),
+        }
+        args.json.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"  💾 결과 저장: {args.json}")
+
+    # 실패한 회차가 있으면 CI에서 알 수 있게 (브라우저를 못 띄우면 위에서 2로 끝남)
+    sys.exit(0 if results and all(r["success"] for r in results) else 1)
+
+
+if __name__ == "__main__":
+    main()
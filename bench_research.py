@@ -0,0 +1,246 @@
+"""
+Research Benchmark - 로컬 YouTube stand-in으로 연구 단계 성능 측정
+
+youtube.com에 접속하지 않고 research_agent의
+get_recent_video_urls / get_recent_videos_with_transcripts를 실행하여
+처리량과 요청 지연(p50/p95)을 보고한다. 06:00 실행 전에 확장성 회귀를 잡는 용도.
+
+동작 방식:
+- youtube_standin.YouTubeStandin을 로컬 포트에 띄운다
+- research_agent의 공유 세션(http)에 https://www.youtube.com → stand-in 주소로
+  바꿔 보내는 어댑터를 붙인다 (RSS, 채널 페이지, 자막 모두 포함)
+- 채널 목록/캐시/인덱스/자막 저장소는 임시 디렉토리를 사용 (data/ 오염 없음)
+
+사용법:
+    python bench_research.py                                # 200채널, 50ms 지연
+    python bench_research.py --channels 500 --latency-ms 100 --error-rate 0.02
+    python bench_research.py --rounds 2                     # 2회차부터 조건부 GET(304) 효과
+    python bench_research.py --resolve-ratio 0.5            # 절반은 핸들 → ID 조회부터
+    python bench_research.py --skip-transcripts --json bench.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from urllib.parse import urlsplit
+
+# Windows 콘솔 인코딩 문제 방지 (cp949 → utf-8)
+if sys.platform == "win32":
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+    sys.stderr.reconfigure(encoding="utf-8", errors="replace")
+
+sys.path.insert(0, str(Path(__file__).parent))
+import research_agent
+from requests.adapters import HTTPAdapter
+from lib.cache import ChannelIdCache, FeedCache
+from lib.channel_registry import ChannelRegistry
+from lib.http_session import DEFAULT_RETRY, POOL_SIZE
+from lib.transcript_store import TranscriptStore
+from lib.video_index import VideoIndex
+from youtube_standin import YouTubeStandin
+
+YOUTUBE_ORIGIN = "https://www.youtube.com"
+
+
+class _StandinAdapter(HTTPAdapter):
+    """https://www.youtube.com 요청을 stand-in 서버로 돌려보내는 어댑터."""
+
+    def __init__(self, base_url: str):
+        super().__init__(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=DEFAULT_RETRY)
+        self.base_url = base_url
+
+    def send(self, request, **kwargs):
+        if request.url.startswith(YOUTUBE_ORIGIN):
+            request.url = self.base_url + request.url[len(YOUTUBE_ORIGIN):]
+        return super().send(request, **kwargs)
+
+
+class LatencyRecorder:
+    """세션 응답 훅: 엔드포인트 종류별 응답 지연(헤더 수신까지)을 기록."""
+
+    def __init__(self):
+        self.samples: dict[str, list[float]] = defaultdict(list)
+        self.statuses: dict[str, dict[int, int]] = defaultdict(lambda: defaultdict(int))
+        self._lock = threading.Lock()
+
+    def __call__(self, response, *args, **kwargs):
+        path = urlsplit(response.url).path
+        if path.startswith("/@"):
+            kind = "channel"
+        else:
+            kind = {
+                "/feeds/videos.xml": "feed",
+                "/watch": "watch",
+                "/youtubei/v1/player": "player",
+                "/api/timedtext": "timedtext",
+            }.get(path, "other")
+        with self._lock:
+            self.samples[kind].append(response.elapsed.total_seconds() * 1000)
+            self.statuses[kind][response.status_code] += 1
+
+    def reset(self):
+        with self._lock:
+            self.samples.clear()
+            self.statuses.clear()
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    """nearest-rank 백분위수."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+def _write_channels_toml(path: Path, channels: list[dict], resolve_ratio: float):
+    """stand-in 채널로 channels.toml 생성. 앞쪽 resolve_ratio 비율은 channel_id 없이 기록."""
+    unresolved = int(len(channels) * resolve_ratio)
+    lines = []
+    for i, ch in enumerate(channels):
+        lines.append("[[channels]]")
+        lines.append(f'handle = "{ch["handle"]}"')
+        lines.append(f'name = "{ch["name"]}"')
+        if i >= unresolved:
+            lines.append(f'channel_id = "{ch["channel_id"]}"')
+        lines.append(f'group = "bench-{i % 10}"')
+        lines.append("")
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+
+def _isolate_research_state(workdir: Path, channels_file: Path):
+    """research_agent의 파일 기반 상태를 임시 디렉토리로 교체."""
+    research_agent.REGISTRY = ChannelRegistry(channels_file)
+    research_agent.FEED_CACHE = FeedCache(workdir / "feed_cache.json")
+    research_agent.CHANNEL_ID_CACHE = ChannelIdCache(workdir / "channel_ids.json")
+    research_agent.VIDEO_INDEX = VideoIndex(workdir / "video_index.db")
+    research_agent.TRANSCRIPT_STORE = TranscriptStore(workdir / "transcripts")
+
+
+def _run_phase(name: str, func, recorder: LatencyRecorder, unit: str, verbose: bool) -> dict:
+    recorder.reset()
+    output = io.StringIO()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(sys.stdout if verbose else output):
+        items = func()
+    wall = time.perf_counter() - started
+
+    endpoints = {}
+    for kind, samples in sorted(recorder.samples.items()):
+        endpoints[kind] = {
+            "requests": len(samples),
+            "p50_ms": round(_percentile(samples, 50), 1),
+            "p95_ms": round(_percentile(samples, 95), 1),
+            "max_ms": round(max(samples), 1),
+            "statuses": dict(recorder.statuses[kind]),
+        }
+    return {
+        "phase": name,
+        "wall_seconds": round(wall, 3),
+        unit: len(items),
+        "throughput_per_second": round(len(items) / wall, 1) if wall > 0 else 0.0,
+        "endpoints": endpoints,
+    }
+
+
+def _print_phase(result: dict):
+    print(f"\n▶ {result['phase']}")
+    print(f"  소요: {result['wall_seconds']:.2f}초 | 처리량: {result['throughput_per_second']}/초")
+    print(f"  {'endpoint':<10} {'req':>6} {'p50(ms)':>9} {'p95(ms)':>9} {'max(ms)':>9}  status")
+    for kind, stats in result["endpoints"].items():
+        statuses = ", ".join(f"{code}×{n}" for code, n in sorted(stats["statuses"].items()))
+        print(f"  {kind:<10} {stats['requests']:>6} {stats['p50_ms']:>9} {stats['p95_ms']:>9} {stats['max_ms']:>9}  {statuses}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="연구 단계 오프라인 벤치마크 (로컬 YouTube stand-in)")
+    parser.add_argument("--channels", type=int, default=200, help="합성 채널 수")
+    parser.add_argument("--recent-per-feed", type=int, default=2, help="피드당 최근 24시간 영상 수")
+    parser.add_argument("--latency-ms", type=float, default=50, help="응답 지연(ms)")
+    parser.add_argument("--jitter-ms", type=float, default=20, help="지연 편차(ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 오류 주입 비율 (0~1)")
+    parser.add_argument("--resolve-ratio", type=float, default=0.0, help="channel_id 없이 핸들만 주는 채널 비율")
+    parser.add_argument("--rounds", type=int, default=1, help="URL 수집 반복 횟수 (2회차부터 304 캐시 적중)")
+    parser.add_argument("--transcript-rate", type=float, default=None, help="자막 요청 속도 제한 (기본: research_agent 설정)")
+    parser.add_argument("--skip-transcripts", action="store_true", help="자막 추출 단계 생략")
+    parser.add_argument("--json", type=Path, help="결과를 JSON 파일로 저장")
+    parser.add_argument("--verbose", action="store_true", help="research_agent 로그 출력")
+    args = parser.parse_args()
+
+    standin = YouTubeStandin(
+        channels=args.channels,
+        recent_per_feed=args.recent_per_feed,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+    )
+    base_url = standin.start()
+
+    print("=" * 60)
+    print("🧪 Research Benchmark")
+    print(f"   stand-in: {base_url} | 채널 {args.channels}개 | 지연 {args.latency_ms}±{args.jitter_ms}ms"
+          f" | 오류율 {args.error_rate:.0%}")
+    print("=" * 60)
+
+    recorder = LatencyRecorder()
+    session = research_agent.http
+    session.mount(YOUTUBE_ORIGIN, _StandinAdapter(base_url))
+    session.hooks["response"].append(recorder)
+    if args.transcript_rate:
+        research_agent.TRANSCRIPT_RATE = args.transcript_rate
+
+    results = []
+    try:
+        with tempfile.TemporaryDirectory(prefix="bench_research_") as tmp:
+            workdir = Path(tmp)
+            channels_file = workdir / "channels.toml"
+            _write_channels_toml(channels_file, standin.channels(), args.resolve_ratio)
+            with contextlib.redirect_stdout(io.StringIO()):
+                _isolate_research_state(workdir, channels_file)
+
+            for round_no in range(1, args.rounds + 1):
+                result = _run_phase(
+                    f"get_recent_video_urls (round {round_no})",
+                    research_agent.get_recent_video_urls,
+                    recorder, "videos", args.verbose,
+                )
+                result["channels"] = args.channels
+                result["channels_per_second"] = round(args.channels / result["wall_seconds"], 1)
+                _print_phase(result)
+                print(f"  채널 처리량: {result['channels_per_second']}/초 | 영상 {result['videos']}개")
+                results.append(result)
+
+            if not args.skip_transcripts:
+                result = _run_phase(
+                    "get_recent_videos_with_transcripts",
+                    research_agent.get_recent_videos_with_transcripts,
+                    recorder, "videos", args.verbose,
+                )
+                _print_phase(result)
+                print(f"  자막 처리량: {result['throughput_per_second']} 영상/초 "
+                      f"(속도 제한 {research_agent.TRANSCRIPT_RATE}/초)")
+                results.append(result)
+    finally:
+        session.hooks["response"].remove(recorder)
+        standin.stop()
+
+    print(f"\n📊 stand-in 요청 수: {dict(standin.requests)}")
+    if args.json:
+        report = {
+            "config": {k: (str(v) if isinstance(v, Path) else v) for k, v in vars(args).items()},
+            "results": results,
+            "server_requests": dict(standin.requests),
+        }
+        args.json.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"  💾 결과 저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
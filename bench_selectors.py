@@ -0,0 +1,202 @@
+"""
+Selector Benchmark - 저장된 디버그 덤프로 셀렉터를 오프라인 검사
+
+NotebookLM에 접속하지 않고, 커밋된 debug_*.html 덤프와 data/debug/의 스냅샷을
+로컬 headless 페이지에 하나씩 올린 뒤 SELECTORS의 모든 후보와 코드 곳곳의
+인라인 셀렉터 목록을 평가한다. 셀렉터마다 덤프별 매칭 수, 모호성(2개 이상 매칭),
+resolve 시간(locator.count() 왕복, 중앙값)을 보고하여 죽은 셀렉터나 느린
+셀렉터를 실제 실행에서 타임아웃이 나기 전에 잡는 용도.
+
+동작 방식:
+- 자바스크립트를 끈 컨텍스트에 set_content로 덤프를 올리고 모든 네트워크 요청은 차단
+  (스타일시트가 없으므로 가시성은 평가하지 않는다 — DOM 매칭만)
+- 그룹별로 후보 순서대로 처음 매칭되는 셀렉터(resolve_first가 고를 셀렉터)도 표시
+
+사용법:
+    python bench_selectors.py                          # 모든 덤프, 모든 셀렉터
+    python bench_selectors.py --group add_source_btn --group url_textarea
+    python bench_selectors.py --slow-ms 10 --repeat 9
+    python bench_selectors.py debug_audio_tab.html --json selectors.json
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Windows 콘솔 인코딩 문제 방지 (cp949 → utf-8)
+if sys.platform == "win32":
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+    sys.stderr.reconfigure(encoding="utf-8", errors="replace")
+
+sys.path.insert(0, str(Path(__file__).parent))
+from lib.config import DEBUG_DIR, QUERY_INPUT_SELECTORS, RESPONSE_SELECTORS
+from lib.debug_snapshots import load_snapshot
+from lib.wait_conditions import DIALOG, HOME_READY, MENU_PANEL, NOTEBOOK_READY, OVERLAY_BACKDROP, SOURCES_DIALOG
+from notebooklm_agent import NOTEBOOK_CARD_MENU, NOTEBOOK_TITLE_SELECTOR, SELECTORS
+from patchright.sync_api import Error as PlaywrightError
+from patchright.sync_api import sync_playwright
+
+ROOT = Path(__file__).parent
+
+# SELECTORS 밖에서 코드에 직접 적힌 셀렉터 목록
+INLINE_SELECTORS = {
+    "wait.home_ready": HOME_READY,
+    "wait.notebook_ready": NOTEBOOK_READY,
+    "wait.overlay": [OVERLAY_BACKDROP, MENU_PANEL, DIALOG, SOURCES_DIALOG],
+    "home.notebook_title": [NOTEBOOK_TITLE_SELECTOR],
+    "home.card_menu_btn": [NOTEBOOK_CARD_MENU[1]],
+    "sources.row": [".single-source-container", ".source-title", ".source-item-source-icon"],
+    "sources.dialog_error": ['.cdk-overlay-pane :text("오류"), .cdk-overlay-pane :text("Error")'],
+    "audio.entry_component": ["audio-overview button"],
+    "config.query_input": QUERY_INPUT_SELECTORS,
+    "config.response": RESPONSE_SELECTORS,
+}
+
+
+def _default_dumps() -> list[Path]:
+    dumps = sorted(ROOT.glob("debug_*.html"))
+    if DEBUG_DIR.exists():
+        dumps += sorted(DEBUG_DIR.glob("*.html.gz"))
+    return dumps
+
+
+def _time_count(page, selector: str, repeat: int) -> tuple[int, float]:
+    """(매칭 수, resolve 시간 중앙값 ms) — 잘못된 셀렉터면 (-1, 0)"""
+    locator = page.locator(selector)
+    timings = []
+    count = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        try:
+            count = locator.count()
+        except PlaywrightError:
+            return -1, 0.0
+        timings.append((time.perf_counter() - started) * 1000)
+    return count, statistics.median(timings)
+
+
+def bench(dumps: list[Path], groups: dict[str, list[str]], repeat: int) -> dict:
+    results = {name: {sel: {} for sel in selectors} for name, selectors in groups.items()}
+    first_hit = {name: {} for name in groups}
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        context = browser.new_context(java_script_enabled=False)
+        context.route("**/*", lambda route: route.abort())
+        page = context.new_page()
+        try:
+            for dump in dumps:
+                started = time.perf_counter()
+                page.set_content(load_snapshot(dump), wait_until="domcontentloaded")
+                print(f"📄 {dump.name} ({(time.perf_counter() - started) * 1000:.0f}ms 로드)")
+                for name, selectors in groups.items():
+                    for selector in selectors:
+                        count, ms = _time_count(page, selector, repeat)
+                        results[name][selector][dump.name] = {"count": count, "ms": round(ms, 3)}
+                        if count > 0 and dump.name not in first_hit[name]:
+                            first_hit[name][dump.name] = selector
+        finally:
+            context.close()
+            browser.close()
+
+    return {"dumps": [d.name for d in dumps], "selectors": results, "first_hit": first_hit}
+
+
+def summarize(report: dict, slow_ms: float) -> dict:
+    """셀렉터별 요약과 dead / slow / ambiguous / invalid 목록"""
+    summary = {"dead": [], "slow": [], "ambiguous": [], "invalid": []}
+    rows = []
+    for name, selectors in report["selectors"].items():
+        for selector, per_dump in selectors.items():
+            counts = [r["count"] for r in per_dump.values()]
+            times = [r["ms"] for r in per_dump.values()]
+            row = {
+                "group": name,
+                "selector": selector,
+                "matched_dumps": sum(c > 0 for c in counts),
+                "max_count": max(counts, default=0),
+                "median_ms": statistics.median(times) if times else 0.0,
+                "max_ms": max(times, default=0.0),
+            }
+            rows.append(row)
+            key = f"{name}: {selector}"
+            if any(c < 0 for c in counts):
+                summary["invalid"].append(key)
+            elif row["matched_dumps"] == 0:
+                summary["dead"].append(key)
+            if row["max_count"] > 1:
+                summary["ambiguous"].append(f"{key} (최대 {row['max_count']}개)")
+            if row["max_ms"] > slow_ms:
+                summary["slow"].append(f"{key} ({row['max_ms']:.1f}ms)")
+    summary["rows"] = rows
+    return summary
+
+
+def _print_report(report: dict, summary: dict):
+    n_dumps = len(report["dumps"])
+    current = None
+    for row in summary["rows"]:
+        if row["group"] != current:
+            current = row["group"]
+            hits = report["first_hit"][current]
+            print(f"\n🔎 {current}  (덤프 {len(hits)}/{n_dumps}에서 해석됨)")
+        flag = ""
+        if row["max_count"] < 0:
+            flag = "  ❌ 잘못된 셀렉터"
+        elif row["matched_dumps"] == 0:
+            flag = "  💀 dead"
+        elif row["max_count"] > 1:
+            flag = f"  ⚠️ 모호 ({row['max_count']}개)"
+        print(f"  {row['selector'][:60]:<60} {row['matched_dumps']:>2}/{n_dumps}  "
+              f"{row['median_ms']:>6.2f}ms (최대 {row['max_ms']:>6.2f}ms){flag}")
+
+    print(f"\n{'=' * 60}")
+    print(f"📊 덤프 {n_dumps}개, 셀렉터 {len(summary['rows'])}개")
+    for label, key in (("💀 어떤 덤프에도 없음", "dead"), ("🐢 느림", "slow"),
+                       ("❌ 잘못된 셀렉터", "invalid")):
+        items = summary[key]
+        print(f"{label}: {len(items)}개")
+        for item in items:
+            print(f"    - {item}")
+    print(f"⚠️ 모호 (2개 이상 매칭): {len(summary['ambiguous'])}개")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="디버그 덤프 기반 셀렉터 오프라인 벤치마크")
+    parser.add_argument("dumps", nargs="*", type=Path, help="검사할 덤프 (기본: debug_*.html + data/debug/*.html.gz)")
+    parser.add_argument("--group", action="append", help="이 그룹만 검사 (SELECTORS 키 또는 인라인 그룹 이름, 여러 번 지정 가능)")
+    parser.add_argument("--repeat", type=int, default=5, help="셀렉터당 측정 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--slow-ms", type=float, default=20.0, help="이보다 오래 걸리면 느린 셀렉터로 표시")
+    parser.add_argument("--json", type=Path, help="결과를 JSON 파일로 저장")
+    args = parser.parse_args()
+
+    dumps = args.dumps or _default_dumps()
+    if not dumps:
+        print("❌ 검사할 덤프가 없습니다 (debug_*.html 또는 data/debug/*.html.gz)")
+        sys.exit(1)
+
+    groups = {**SELECTORS, **INLINE_SELECTORS}
+    if args.group:
+        unknown = [g for g in args.group if g not in groups]
+        if unknown:
+            print(f"❌ 알 수 없는 그룹: {', '.join(unknown)}")
+            sys.exit(1)
+        groups = {g: groups[g] for g in args.group}
+
+    report = bench(dumps, groups, max(1, args.repeat))
+    summary = summarize(report, args.slow_ms)
+    _print_report(report, summary)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({**report, "summary": summary}, f, indent=2, ensure_ascii=False)
+        print(f"💾 결과 저장: {args.json}")
+
+    sys.exit(1 if summary["invalid"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+DOM Dump Indexer - 디버그 덤프의 인터랙티브 요소 구조 인덱스와 비교
+
+debug_*.html 덤프와 data/debug/의 스냅샷에서 버튼/링크/입력창/role 요소를
+태그, role, aria-label, 텍스트, 클래스, 조상 경로와 함께 뽑아 SQLite
+(data/dom_index.db)에 저장한다. 브라우저 없이 동작하므로 수백 개의 덤프도
+몇 초 안에 인덱싱되고, 두 덤프를 비교하면 UI 배포로 어떤 컨트롤이
+이동/이름 변경/삭제/추가되었는지 바로 보인다.
+
+동작 방식:
+- HTML 트리를 만들지 않고 정규식 한 번으로 훑는다 (script/style/svg는 건너뜀)
+- 덤프는 내용 해시로 식별 — 바뀌지 않은 덤프는 다시 파싱하지 않는다
+- 새 덤프는 프로세스 풀에서 병렬로 파싱
+
+사용법:
+    python index_dumps.py build                        # 기본 덤프 전부 인덱싱
+    python index_dumps.py build data/old_dumps/*.html --workers 4
+    python index_dumps.py list
+    python index_dumps.py show debug_audio_tab.html
+    python index_dumps.py search "출처 추가"
+    python index_dumps.py diff debug_audio_tab.html debug_audio_section.html
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Windows 콘솔 인코딩 문제 방지 (cp949 → utf-8)
+if sys.platform == "win32":
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+    sys.stderr.reconfigure(encoding="utf-8", errors="replace")
+
+sys.path.insert(0, str(Path(__file__).parent))
+from lib.config import DEBUG_DIR, DOM_INDEX_DB
+from lib.dom_index import DomIndex, diff_controls, format_diff
+
+ROOT = Path(__file__).parent
+
+
+def _default_dumps() -> list[Path]:
+    dumps = sorted(ROOT.glob("debug_*.html"))
+    if DEBUG_DIR.exists():
+        dumps += sorted(DEBUG_DIR.glob("*.html.gz"))
+    return dumps
+
+
+def _resolve(index: DomIndex, name: str) -> str:
+    """인덱스의 덤프 이름 — 경로가 주어졌고 아직 인덱싱되지 않았으면 먼저 인덱싱"""
+    path = Path(name)
+    if path.exists():
+        index.update([path], workers=1)
+        return path.name
+    for candidate in (ROOT / name, DEBUG_DIR / name):
+        if candidate.exists():
+            index.update([candidate], workers=1)
+            return candidate.name
+    return path.name
+
+
+def cmd_build(index: DomIndex, args):
+    dumps = args.dumps or _default_dumps()
+    if not dumps:
+        print("❌ 인덱싱할 덤프가 없습니다 (debug_*.html 또는 data/debug/*.html.gz)")
+        sys.exit(1)
+    started = time.perf_counter()
+    indexed, skipped = index.update(dumps, workers=args.workers)
+    elapsed = time.perf_counter() - started
+    print(f"✅ 덤프 {len(dumps)}개: 새로 인덱싱 {indexed}개, 변경 없음 {skipped}개 ({elapsed:.2f}초)")
+    print(f"💾 {index.path}")
+
+
+def cmd_list(index: DomIndex, args):
+    rows = index.dumps()
+    if not rows:
+        print("(인덱스가 비어 있습니다 — 먼저 build)")
+        return
+    for name, size, controls, indexed_at in rows:
+        print(f"  {name:<50} {size / 1024:>8.0f}KB  컨트롤 {controls:>4}개  {indexed_at[:19]}")
+    print(f"\n📊 덤프 {len(rows)}개")
+
+
+def cmd_show(index: DomIndex, args):
+    name = _resolve(index, args.dump)
+    controls = index.controls(name)
+    if not controls:
+        print(f"❌ 인덱스에 없는 덤프이거나 컨트롤이 없습니다: {name}")
+        sys.exit(1)
+    for c in controls:
+        extra = f"  [{c.attrs}]" if c.attrs else ""
+        print(f"  {c.describe():<60} @ {c.path or '(root)'}{extra}")
+    print(f"\n📊 {name}: 컨트롤 {len(controls)}개")
+
+
+def cmd_search(index: DomIndex, args):
+    hits = index.search(args.term, limit=args.limit)
+    for name, c in hits:
+        print(f"  {name:<40} {c.describe():<50} @ {c.path or '(root)'}")
+    print(f"\n🔎 '{args.term}': {len(hits)}건")
+
+
+def cmd_diff(index: DomIndex, args):
+    old_name, new_name = _resolve(index, args.old), _resolve(index, args.new)
+    old, new = index.controls(old_name), index.controls(new_name)
+    for name, controls in ((old_name, old), (new_name, new)):
+        if not controls:
+            print(f"❌ 인덱스에 없는 덤프이거나 컨트롤이 없습니다: {name}")
+            sys.exit(1)
+    print(format_diff(diff_controls(old, new), old_name, new_name, limit=args.limit))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="디버그 덤프 구조 인덱스 / 비교")
+    parser.add_argument("--db", type=Path, default=DOM_INDEX_DB, help="인덱스 SQLite 파일")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("build", help="덤프 인덱싱 (바뀐 덤프만)")
+    p.add_argument("dumps", nargs="*", type=Path, help="덤프 파일 (기본: debug_*.html + data/debug/*.html.gz)")
+    p.add_argument("--workers", type=int, default=None, help="병렬 프로세스 수 (기본: CPU 수, 1이면 순차)")
+    p.set_defaults(func=cmd_build)
+
+    p = sub.add_parser("list", help="인덱싱된 덤프 목록")
+    p.set_defaults(func=cmd_list)
+
+    p = sub.add_parser("show", help="덤프 하나의 컨트롤 목록")
+    p.add_argument("dump", help="덤프 이름 또는 경로")
+    p.set_defaults(func=cmd_show)
+
+    p = sub.add_parser("search", help="레이블/클래스/속성으로 전체 덤프 검색")
+    p.add_argument("term")
+    p.add_argument("--limit", type=int, default=50)
+    p.set_defaults(func=cmd_search)
+
+    p = sub.add_parser("diff", help="두 덤프의 컨트롤 비교")
+    p.add_argument("old", help="이전 덤프 이름 또는 경로")
+    p.add_argument("new", help="새 덤프 이름 또는 경로")
+    p.add_argument("--limit", type=int, default=30, help="분류별 최대 출력 수")
+    p.set_defaults(func=cmd_diff)
+
+    args = parser.parse_args()
+    index = DomIndex(args.db)
+    try:
+        args.func(index, args)
+    finally:
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Streaming parser for YouTube channel Atom feeds
+Pulls yt:videoId / title / published per entry and stops at the first
+entry older than the cutoff, since YouTube lists entries newest-first
+"""
+
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from typing import Iterator, Optional
+
+_ATOM = '{http://www.w3.org/2005/Atom}'
+_YT = '{http://www.youtube.com/xml/schemas/2015}'
+
+FEED_CHUNK_SIZE = 4096
+
+
+def iter_entries(content: bytes, chunk_size: int = FEED_CHUNK_SIZE) -> Iterator[dict]:
+    """
+    Yield {'video_id', 'title', 'published'} per <entry> in document order.
+    The document is fed in chunks, so stopping the iterator early skips
+    parsing the rest of the feed. published is normalized to UTC ISO 8601.
+    """
+    parser = ET.XMLPullParser(events=('end',))
+    view = memoryview(content)
+    for start in range(0, len(view), chunk_size):
+        parser.feed(view[start:start + chunk_size])
+        for _, elem in parser.read_events():
+            if elem.tag != _ATOM + 'entry':
+                continue
+            video_id = elem.findtext(_YT + 'videoId')
+            published = elem.findtext(_ATOM + 'published')
+            if video_id and published:
+                yield {
+                    'video_id': video_id,
+                    'title': elem.findtext(_ATOM + 'title', default=''),
+                    'published': datetime.fromisoformat(published).astimezone(timezone.utc).isoformat(),
+                }
+            # 처리한 entry의 하위 노드(media:group 등)는 바로 버려 메모리 유지
+            elem.clear()
+    parser.close()
+
+
+def parse_recent_entries(content: bytes, cutoff: Optional[datetime] = None, limit: int = 10) -> list[dict]:
+    """Entries newer than cutoff (at most limit), parsing only as far as needed"""
+    entries = []
+    for entry in iter_entries(content):
+        if cutoff is not None and datetime.fromisoformat(entry['published']) < cutoff:
+            break
+        entries.append(entry)
+        if len(entries) >= limit:
+            break
+    return entries
@@ -0,0 +1,250 @@
+"""
+Event-driven Audio Overview watcher
+A MutationObserver in the page reports generation state changes through
+expose_binding and resolves a promise when generation finishes or fails,
+so Python waits inside a single page.evaluate instead of polling. Media
+requests are recorded from the network so the finished file can be
+streamed to disk with a checksum.
+"""
+
+import hashlib
+import os
+import re
+import time
+from pathlib import Path
+from typing import Optional
+
+from patchright.sync_api import Error as PlaywrightError
+from patchright.sync_api import Page, Request
+
+from .http_session import get_session
+
+BINDING_NAME = '__nlmAudioEvent'
+DOWNLOAD_CHUNK = 256 * 1024
+
+_AUDIO_URL = re.compile(r'\.(?:mp3|m4a|wav|ogg)(?:[?#]|$)|googleusercontent\.com/.*(?:audio|notebooklm)', re.I)
+_EXTENSIONS = {'audio/mpeg': '.mp3', 'audio/mp3': '.mp3', 'audio/mp4': '.m4a', 'audio/x-m4a': '.m4a',
+               'audio/wav': '.wav', 'audio/x-wav': '.wav', 'audio/ogg': '.ogg', 'audio/webm': '.webm'}
+
+# 스튜디오 패널의 오디오 개요 상태를 DOM 변화 때마다 다시 판정한다 (50ms 묶음).
+# arm()은 트리거 직전의 오디오 src 목록과 오디오 개요 요소 수를 기준(baseline)으로 기록한다.
+# 이후 새 src가 생기거나 개요 요소가 늘어난 'ready', 또는 오류일 때만 done 프로미스가 풀린다
+# (이미 있던 오디오가 보인다고 완료로 치지 않는다).
+_OBSERVER_JS = """
+(bindingName) => {
+  if (window.__nlmAudioWatch) { window.__nlmAudioWatch.check(); return window.__nlmAudioWatch.state; }
+  const READY = 'audio[src], audio-player, button[aria-label*="재생"], button[aria-label*="Play"]';
+  const GENERATING = '.audio-generating, [aria-label*="생성 중"], [aria-label*="Generating"]';
+  const SCOPE = 'audio-overview, .audio-overview, studio-panel, .studio-panel, .cdk-overlay-container';
+  const ERROR_TEXT = /생성 실패|생성하지 못했|Error generating|Couldn.t generate|Failed to generate/i;
+  const GENERATING_TEXT = /생성 중|Generating/;
+  const w = {state: 'idle', src: '', armed: false, baseline: null, resolve: null, done: null};
+  const snapshot = () => ({
+    srcs: Array.from(document.querySelectorAll('audio[src]')).map(a => a.src),
+    count: document.querySelectorAll(READY).length,
+  });
+  w.arm = (baseline) => {
+    w.armed = true; w.baseline = baseline || snapshot(); w.src = '';
+    w.done = new Promise(r => { w.resolve = r; });
+  };
+  w.check = () => {
+    const text = Array.from(document.querySelectorAll(SCOPE)).map(e => e.innerText || '').join('\\n');
+    let next = 'idle';
+    if (ERROR_TEXT.test(text)) next = 'error';
+    else if (document.querySelector(GENERATING) || GENERATING_TEXT.test(text)) next = 'generating';
+    else if (document.querySelector(READY)) next = 'ready';
+    const now = snapshot();
+    const fresh = w.baseline ? now.srcs.filter(s => !w.baseline.srcs.includes(s)) : now.srcs;
+    const src = fresh[0] || '';
+    if (next !== w.state || src !== w.src) {
+      w.state = next; w.src = src;
+      window[bindingName]({state: next, src});
+    }
+    if (!w.armed || !w.resolve) return;
+    if (next === 'error' || (next === 'ready' && (fresh.length > 0 || now.count > w.baseline.count))) {
+      w.resolve(next); w.resolve = null;
+    }
+  };
+  let pending = false;
+  new MutationObserver(() => {
+    if (pending) return;
+    pending = true;
+    setTimeout(() => { pending = false; w.check(); }, 50);
+  }).observe(document.body, {subtree: true, childList: true, attributes: true, characterData: true});
+  window.__nlmAudioWatch = w;
+  w.check();
+  return w.state;
+}
+"""
+
+_ARM_JS = "(baseline) => { const w = window.__nlmAudioWatch; if (!w) return null; w.arm(baseline); w.check(); return w.baseline; }"
+
+# 완료/오류 또는 ms 경과 중 먼저 오는 쪽 (페이지가 새로 로드되어 감시가 사라졌으면 'lost')
+_WAIT_JS = """
+(ms) => {
+  const w = window.__nlmAudioWatch;
+  if (!w || !w.done) return 'lost';
+  return Promise.race([w.done, new Promise(r => setTimeout(() => r('pending'), ms))]);
+}
+"""
+
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(DOWNLOAD_CHUNK), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _write_checksum(path: Path, sha256: str):
+    # sha256sum -c 로 검증할 수 있는 형식
+    Path(f"{path}.sha256").write_text(f"{sha256}  {path.name}\n", encoding='utf-8')
+
+
+class AudioWatcher:
+    """
+    Watches one notebook page for Audio Overview completion.
+    install() → arm() → (trigger generation) → wait() → download()
+    """
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.state = 'idle'
+        self.src = ''
+        self.media_urls: list[str] = []
+        self.baseline: Optional[dict] = None        # arm() 시점의 {srcs, count}
+        self._media_from = 0                        # arm() 이후에 잡힌 media_urls의 시작 위치
+        self.events: list[tuple[float, str]] = []   # (시각, 상태) — 상태 변화 기록
+        self._installed = False
+
+    # ── 설치 ──
+
+    def install(self) -> str:
+        """Start observing; returns the current state ('idle' / 'generating' / 'ready' / 'error')"""
+        if not self._installed:
+            self.page.expose_binding(BINDING_NAME, self._on_binding)
+            self.page.on('request', self._on_request)
+            self._installed = True
+        try:
+            self.state = self.page.evaluate(_OBSERVER_JS, BINDING_NAME)
+        except PlaywrightError as e:
+            print(f"  ⚠️ 오디오 감시 설치 실패: {e}")
+        return self.state
+
+    def arm(self, baseline: Optional[dict] = None) -> bool:
+        """
+        Call right before triggering generation: records the audio already on
+        the page (or reuses baseline after a reload) so that only a new file,
+        or a failure, ends the wait
+        """
+        if baseline is None:
+            self.src = ''
+            self._media_from = len(self.media_urls)
+        try:
+            self.baseline = self.page.evaluate(_ARM_JS, baseline) or self.baseline
+        except PlaywrightError:
+            return False
+        return self.baseline is not None
+
+    # ── 이벤트 ──
+
+    def _on_binding(self, source, payload: dict):
+        state, src = payload.get('state', ''), payload.get('src', '')
+        if state != self.state:
+            print(f"    🎙️ 오디오 상태: {self.state} → {state}")
+            self.events.append((time.monotonic(), state))
+        self.state = state
+        if src:
+            self.src = src
+
+    def _on_request(self, request: Request):
+        # 미디어 차단 프로필에서도 요청 URL은 잡힌다 (다운로드는 브라우저 밖에서 한다)
+        if request.resource_type == 'media' or _AUDIO_URL.search(request.url):
+            if request.url not in self.media_urls:
+                self.media_urls.append(request.url)
+
+    # ── 대기 ──
+
+    def wait(self, timeout: float, report_every: float = 60) -> str:
+        """
+        Block until generation finishes ('ready'), fails ('error') or
+        timeout seconds pass ('timeout'). The page resolves the wait itself;
+        Python only wakes up every report_every seconds to print progress.
+        """
+        started = time.monotonic()
+        while True:
+            remaining = timeout - (time.monotonic() - started)
+            if remaining <= 0:
+                return 'timeout'
+            try:
+                outcome = self.page.evaluate(_WAIT_JS, int(min(remaining, report_every) * 1000))
+            except PlaywrightError as e:
+                print(f"  ⚠️ 오디오 대기 중 오류: {e}")
+                outcome = 'lost'
+            if outcome in ('ready', 'error'):
+                return outcome
+            if outcome == 'lost':
+                # 페이지가 다시 로드됨 — 같은 기준으로 감시를 다시 걸고 이어서 대기
+                # (기존 오디오가 보인다고 바로 'ready'로 돌려주지 않는다)
+                self.install()
+                self.arm(self.baseline)
+                continue
+            print(f"    ... {time.monotonic() - started:.0f}초 경과 (상태: {self.state})")
+
+    # ── 다운로드 ──
+
+    def audio_url(self) -> Optional[str]:
+        """<audio src> if the player has one, else the last media request seen"""
+        if self.src and not self.src.startswith('blob:'):
+            return self.src
+        # arm() 이후 요청 중 기존 오디오가 아닌 것만 (재생성 후 옛 파일을 받지 않게)
+        old = set((self.baseline or {}).get('srcs', []))
+        for url in reversed(self.media_urls[self._media_from:]):
+            if not url.startswith('blob:') and url not in old:
+                return url
+        return None
+
+    def download(self, dest_dir: Path, stem: str) -> Optional[dict]:
+        """
+        Stream the audio to dest_dir/<stem><ext> with the browser's cookies,
+        hashing while writing. Returns {path, sha256, bytes, url} or None.
+        """
+        url = self.audio_url()
+        if not url:
+            return None
+        cookies = {c['name']: c['value'] for c in self.page.context.cookies(url)}
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            with get_session().get(url, cookies=cookies, stream=True, timeout=(10, 60)) as resp:
+                content_type = resp.headers.get('Content-Type', '').split(';')[0].strip().lower()
+                if resp.status_code != 200 or not content_type.startswith(('audio/', 'video/', 'application/octet-stream')):
+                    print(f"  ⚠️ 오디오 다운로드 실패: HTTP {resp.status_code} ({content_type or '?'})")
+                    return None
+                path = dest_dir / f"{stem}{_EXTENSIONS.get(content_type, '.mp3')}"
+                part = path.with_name(path.name + '.part')
+                digest = hashlib.sha256()
+                size = 0
+                with open(part, 'wb') as f:
+                    for block in resp.iter_content(DOWNLOAD_CHUNK):
+                        f.write(block)
+                        digest.update(block)
+                        size += len(block)
+                os.replace(part, path)
+        except Exception as e:
+            print(f"  ⚠️ 오디오 다운로드 실패: {e}")
+            return None
+        sha256 = digest.hexdigest()
+        _write_checksum(path, sha256)
+        return {"path": str(path), "sha256": sha256, "bytes": size, "url": url}
+
+    @staticmethod
+    def finish_browser_download(download, dest_dir: Path, stem: str) -> dict:
+        """Save a Playwright Download (menu fallback) and checksum it the same way"""
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        suffix = Path(download.suggested_filename).suffix or '.mp3'
+        path = dest_dir / f"{stem}{suffix}"
+        download.save_as(str(path))
+        sha256 = _sha256_file(path)
+        _write_checksum(path, sha256)
+        return {"path": str(path), "sha256": sha256, "bytes": path.stat().st_size, "url": download.url}
@@ -0,0 +1,196 @@
+"""
+Warm browser service for loop mode
+Keeps one persistent Chromium context alive between daily runs and hands
+it out in-process, so the 06:00 run skips the Playwright/Chromium cold
+start. The context is health-checked before use and recycled after a
+number of runs or when the browser's memory grows past a threshold.
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+from patchright.sync_api import BrowserContext, sync_playwright
+
+from .browser_utils import BrowserFactory, clear_profile_locks
+from .config import BROWSER_PROFILE_DIR
+from .request_blocker import RequestBlocker
+
+try:
+    import psutil
+except ImportError:
+    psutil = None  # 없으면 /proc에서 읽는다 (리눅스만)
+
+RECYCLE_AFTER_RUNS = 7
+MAX_MEMORY_MB = 1500
+HEALTH_CHECK_INTERVAL = 300  # keep_warm()에서 상태 확인 간격 (초)
+
+
+class BrowserService:
+    """
+    Long-lived persistent context shared by consecutive runs.
+    Sync Playwright objects are bound to the thread that started them,
+    so the service must live on the loop's (main) thread.
+    """
+
+    def __init__(self, headless: bool = True, recycle_after_runs: int = RECYCLE_AFTER_RUNS,
+                 max_memory_mb: Optional[int] = MAX_MEMORY_MB):
+        self.headless = headless
+        self.recycle_after_runs = recycle_after_runs
+        self.max_memory_mb = max_memory_mb
+        self.playwright = None
+        self.context: Optional[BrowserContext] = None
+        self.blocker = RequestBlocker.for_session(headless)
+        self.runs = 0
+        self._last_check = 0.0
+        self._memory_warned = False
+
+    # ── 수명 ──
+
+    def start(self):
+        if self.context is not None:
+            return
+        started = time.monotonic()
+        print("🌐 브라우저 서비스 시작 (웜 상태 유지)...")
+        clear_profile_locks()
+        self.playwright = sync_playwright().start()
+        self.context = BrowserFactory.launch_persistent_context(
+            self.playwright,
+            headless=self.headless,
+            user_data_dir=str(BROWSER_PROFILE_DIR),
+            blocker=self.blocker,
+        )
+        self.runs = 0
+        self._last_check = time.monotonic()
+        print(f"  ✅ 브라우저 준비 완료 ({time.monotonic() - started:.1f}초)")
+        if self.max_memory_mb and not self._memory_warned and self.memory_mb() is None:
+            self._memory_warned = True
+            print("  ℹ️ 메모리 사용량을 읽을 수 없어 메모리 기준 재시작은 꺼짐 (psutil 설치 필요)")
+
+    def stop(self):
+        if self.context is not None:
+            try:
+                self.context.close()
+            except Exception:
+                pass
+            self.context = None
+        if self.playwright is not None:
+            try:
+                self.playwright.stop()
+            except Exception:
+                pass
+            self.playwright = None
+
+    def restart(self, reason: str):
+        print(f"  ♻️ 브라우저 재시작: {reason}")
+        self.stop()
+        self.start()
+
+    # ── 상태 확인 ──
+
+    def healthy(self) -> bool:
+        """One round trip to the browser; False if it crashed or was closed"""
+        if self.context is None:
+            return False
+        try:
+            self.context.cookies("https://notebooklm.google.com/")
+            return True
+        except Exception:
+            return False
+
+    def memory_mb(self) -> Optional[float]:
+        """RSS of all browser processes started by this process (None if it cannot be read)"""
+        if psutil is None:
+            return _proc_children_rss_mb(os.getpid())
+        try:
+            children = psutil.Process(os.getpid()).children(recursive=True)
+        except psutil.Error:
+            return None
+        total = 0
+        for proc in children:
+            try:
+                total += proc.memory_info().rss
+            except psutil.Error:
+                continue
+        return total / (1024 * 1024)
+
+    def _recycle_reason(self) -> Optional[str]:
+        if self.recycle_after_runs and self.runs >= self.recycle_after_runs:
+            return f"{self.runs}회 실행"
+        memory = self.memory_mb()
+        if self.max_memory_mb and memory is not None and memory > self.max_memory_mb:
+            return f"메모리 {memory:.0f}MB > {self.max_memory_mb}MB"
+        return None
+
+    def keep_warm(self):
+        """Call periodically while idle: restarts a dead browser before the next run needs it"""
+        if time.monotonic() - self._last_check < HEALTH_CHECK_INTERVAL:
+            return
+        self._last_check = time.monotonic()
+        if not self.healthy():
+            self.restart("상태 확인 실패")
+
+    # ── 실행 단위 ──
+
+    def acquire(self) -> BrowserContext:
+        """Context for one run, restarting it first if it is unhealthy"""
+        if self.context is None:
+            self.start()
+        elif not self.healthy():
+            self.restart("상태 확인 실패")
+        return self.context
+
+    def release(self):
+        """
+        End of a run: close its pages and recycle now if due, so the
+        cold start happens right after this run instead of before the next
+        """
+        self.runs += 1
+        if self.context is not None:
+            # 마지막 창을 닫으면 브라우저가 종료될 수 있으므로 한 페이지는 빈 화면으로 남긴다
+            pages = list(self.context.pages)
+            for page in pages[1:]:
+                try:
+                    page.close()
+                except Exception:
+                    pass
+            if pages:
+                try:
+                    pages[0].goto("about:blank")
+                except Exception:
+                    pass
+        reason = self._recycle_reason()
+        if reason:
+            self.restart(reason)
+
+
+def _proc_children_rss_mb(pid: int) -> Optional[float]:
+    """psutil fallback: sum VmRSS of pid's descendants from /proc (None off Linux)"""
+    proc = Path("/proc")
+    if not (proc / str(pid) / "status").exists():
+        return None
+    parents: dict[int, list[int]] = {}
+    for entry in proc.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            # stat: "pid (comm) state ppid ..." — comm에 공백/괄호가 있을 수 있어 마지막 ')' 뒤에서 자른다
+            ppid = int((entry / "stat").read_text().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        parents.setdefault(ppid, []).append(int(entry.name))
+
+    total_kb = 0
+    stack = list(parents.get(pid, []))
+    while stack:
+        child = stack.pop()
+        stack.extend(parents.get(child, []))
+        try:
+            for line in (proc / str(child) / "status").read_text().splitlines():
+                if line.startswith("VmRSS:"):
+                    total_kb += int(line.split()[1])
+                    break
+        except (OSError, IndexError, ValueError):
+            continue
+    return total_kb / 1024
@@ -6,11 +6,33 @@ Handles browser launching, stealth features, and common interactions
 import json
 import time
 import random
-from typing import Optional, List
+from pathlib import Path
+from typing import Optional, List, TYPE_CHECKING
 
 from patchright.sync_api import Playwright, BrowserContext, Page
 from .config import BROWSER_PROFILE_DIR, STATE_FILE, BROWSER_ARGS, USER_AGENT
 
+if TYPE_CHECKING:
+    from .request_blocker import RequestBlocker
+
+
+def clear_profile_locks(profile_dir: Path = BROWSER_PROFILE_DIR):
+    """Remove profile lock files left behind by a crashed browser"""
+    try:
+        lock_file = profile_dir / "SingletonLock"
+        if lock_file.exists():
+            print(f"  🧹 잠금 파일 삭제: {lock_file}")
+            lock_file.unlink()
+        
+        # 윈도우의 경우 Lockfile도 확인
+        lock_file_w = profile_dir / "Lockfile"
+        if lock_file_w.exists():
+             print(f"  🧹 잠금 파일 삭제: {lock_file_w}")
+             lock_file_w.unlink()
+             
+    except Exception as e:
+        print(f"  ⚠️ 잠금 파일 정리 실패 (무시): {e}")
+
 
 class BrowserFactory:
     """Factory for creating configured browser contexts"""
@@ -19,11 +41,13 @@ class BrowserFactory:
     def launch_persistent_context(
         playwright: Playwright,
         headless: bool = True,
-        user_data_dir: str = str(BROWSER_PROFILE_DIR)
+        user_data_dir: str = str(BROWSER_PROFILE_DIR),
+        blocker: Optional["RequestBlocker"] = None
     ) -> BrowserContext:
         """
         Launch a persistent browser context with anti-detection features
-        and cookie workaround.
+        and cookie workaround. A blocker, if given, is attached before any
+        page is opened.
         """
         # Launch persistent context
         context = playwright.chromium.launch_persistent_context(
@@ -37,6 +61,9 @@ class BrowserFactory:
 
         # Cookie Workaround for Playwright bug #36139
         BrowserFactory._inject_cookies(context)
+
+        if blocker:
+            blocker.attach(context)
         
         return context
 
@@ -44,42 +71,54 @@ class BrowserFactory:
     def _inject_cookies(context: BrowserContext):
         """Inject cookies from state.json if available with sanitization"""
         abs_state_path = STATE_FILE.resolve()
-        
-        if STATE_FILE.exists():
+        cookies = BrowserFactory._load_cookies()
+        if cookies:
             try:
-                with open(STATE_FILE, 'r') as f:
-                    state = json.load(f)
-                    if 'cookies' in state and len(state['cookies']) > 0:
-                        # Playwright 호환성을 위한 쿠키 정규화
-                        sanitized_cookies = []
-                        for cookie in state['cookies']:
-                            s_cookie = cookie.copy()
-                            
-                            # sameSite 값 정규화 (Playwright는 Strict, Lax, None만 허용)
-                            ss = s_cookie.get('sameSite', '').lower()
-                            if ss in ['no_restriction', 'unspecified', 'none', '']:
-                                s_cookie['sameSite'] = 'None'
-                            elif 'lax' in ss:
-                                s_cookie['sameSite'] = 'Lax'
-                            elif 'strict' in ss:
-                                s_cookie['sameSite'] = 'Strict'
-                            else:
-                                s_cookie['sameSite'] = 'Lax' # 기본값
-                            
-                            # 불필요하거나 충돌을 일으키는 필드 제거
-                            for field in ['id', 'storeId', 'hostOnly']:
-                                if field in s_cookie:
-                                    del s_cookie[field]
-                                    
-                            sanitized_cookies.append(s_cookie)
-                            
-                        context.add_cookies(sanitized_cookies)
-                        print(f"  🍪 쿠키 {len(sanitized_cookies)}개 정규화 및 주입 완료")
-                        print(f"     (경로: {abs_state_path})")
+                context.add_cookies(cookies)
+                print(f"  🍪 쿠키 {len(cookies)}개 정규화 및 주입 완료")
+                print(f"     (경로: {abs_state_path})")
             except Exception as e:
                 print(f"  ⚠️ 쿠키 주입 실패: {e}")
-        else:
+
+    @staticmethod
+    def _load_cookies() -> list:
+        """Read cookies from state.json, normalized for Playwright"""
+        abs_state_path = STATE_FILE.resolve()
+        
+        if not STATE_FILE.exists():
             print(f"  ℹ️ 쿠키 파일 없음 (건너뜀): {abs_state_path}")
+            return []
+
+        try:
+            with open(STATE_FILE, 'r') as f:
+                state = json.load(f)
+        except Exception as e:
+            print(f"  ⚠️ 쿠키 주입 실패: {e}")
+            return []
+
+        # Playwright 호환성을 위한 쿠키 정규화
+        sanitized_cookies = []
+        for cookie in state.get('cookies', []):
+            s_cookie = cookie.copy()
+            
+            # sameSite 값 정규화 (Playwright는 Strict, Lax, None만 허용)
+            ss = s_cookie.get('sameSite', '').lower()
+            if ss in ['no_restriction', 'unspecified', 'none', '']:
+                s_cookie['sameSite'] = 'None'
+            elif 'lax' in ss:
+                s_cookie['sameSite'] = 'Lax'
+            elif 'strict' in ss:
+                s_cookie['sameSite'] = 'Strict'
+            else:
+                s_cookie['sameSite'] = 'Lax' # 기본값
+            
+            # 불필요하거나 충돌을 일으키는 필드 제거
+            for field in ['id', 'storeId', 'hostOnly']:
+                if field in s_cookie:
+                    del s_cookie[field]
+                    
+            sanitized_cookies.append(s_cookie)
+        return sanitized_cookies
 
 
 class StealthUtils:
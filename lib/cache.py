@@ -0,0 +1,141 @@
+"""
+Persistent caches for the research phase
+Thread-safe in-memory dicts backed by a single JSON file on disk
+"""
+
+import copy
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from .config import CHANNEL_ID_CACHE_FILE, FEED_CACHE_FILE
+
+
+class JsonCache:
+    """Key-value cache loaded lazily from a JSON file and saved atomically"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._data: Optional[dict] = None
+        self._dirty = False
+
+    def _load(self) -> dict:
+        """Load the backing file once (caller must hold the lock)"""
+        if self._data is None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._data = json.load(f)
+            except (FileNotFoundError, ValueError):
+                # 캐시가 없거나 깨졌으면 빈 상태로 시작
+                self._data = {}
+        return self._data
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            return self._load().get(key)
+
+    def keys(self) -> list[str]:
+        with self._lock:
+            return list(self._load())
+
+    def set(self, key: str, value: Any):
+        with self._lock:
+            self._load()[key] = value
+            self._dirty = True
+
+    def update(self, key: str, fn: Callable[[Optional[Any]], Any]):
+        """
+        Read-modify-write one key under the lock. fn gets a copy of the
+        current value (None if missing) and returns the new value, so
+        values handed out by get() are never mutated in place.
+        """
+        with self._lock:
+            data = self._load()
+            data[key] = fn(copy.deepcopy(data.get(key)))
+            self._dirty = True
+
+    def save(self):
+        """Write the cache to disk if it changed (tmp file + rename)"""
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                # 다른 스레드가 update()하는 동안에도 직렬화할 수 있게 복사본을 쓴다
+                snapshot = copy.deepcopy(self._data)
+                self._dirty = False
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+
+
+class FeedCache(JsonCache):
+    """
+    Conditional-GET cache for feeds, keyed by feed URL.
+    Stores the ETag / Last-Modified validators with the parsed entries
+    so a 304 response can skip parsing entirely.
+
+    Entries are only parsed down to a cutoff ('parsed_until'); a request
+    that needs older entries than that must not be answered from cache.
+    """
+
+    def __init__(self, path: Path = FEED_CACHE_FILE):
+        super().__init__(path)
+
+    def conditional_headers(self, url: str, cutoff: Optional[datetime] = None) -> dict:
+        """Build If-None-Match / If-Modified-Since headers for url"""
+        cached = self.get(url)
+        if not cached:
+            return {}
+        parsed_until = cached.get('parsed_until')
+        if cutoff is not None and parsed_until and datetime.fromisoformat(parsed_until) > cutoff:
+            # 캐시된 항목이 요청 범위를 다 덮지 못함 → 전체 응답 필요
+            return {}
+        headers = {}
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+        return headers
+
+    def entries(self, url: str) -> Optional[list]:
+        """Parsed entries from the last full response, or None"""
+        cached = self.get(url)
+        return cached['entries'] if cached else None
+
+    def store(self, url: str, etag: Optional[str], last_modified: Optional[str], entries: list,
+              parsed_until: Optional[datetime] = None):
+        self.set(url, {
+            'etag': etag,
+            'last_modified': last_modified,
+            'entries': entries,
+            'parsed_until': parsed_until.isoformat() if parsed_until else None,
+        })
+
+
+class ChannelIdCache(JsonCache):
+    """
+    Persistent handle -> channel_id map with a TTL.
+    Channel IDs never change, but handles can be reassigned, so entries expire.
+    """
+
+    def __init__(self, path: Path = CHANNEL_ID_CACHE_FILE, ttl_days: float = 30):
+        super().__init__(path)
+        self.ttl_seconds = ttl_days * 86400
+
+    def lookup(self, handle: str) -> Optional[str]:
+        """Cached channel_id for handle, or None if missing or expired"""
+        cached = self.get(handle.lower())
+        if not cached or time.time() - cached['resolved_at'] > self.ttl_seconds:
+            return None
+        return cached['channel_id']
+
+    def remember(self, handle: str, channel_id: str):
+        self.set(handle.lower(), {'channel_id': channel_id, 'resolved_at': time.time()})
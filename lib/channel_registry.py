@@ -0,0 +1,121 @@
+"""
+File-backed channel registry for the research phase
+Loads channels.toml, indexes channels by group / tag / handle and
+reloads the file when it changes on disk
+"""
+
+import threading
+from pathlib import Path
+from typing import Optional
+
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python 3.10
+    import tomli as tomllib
+
+from .config import CHANNELS_FILE
+
+DEFAULT_GROUP = "default"
+
+
+def _normalize(raw: dict) -> dict:
+    """Fill defaults for one [[channels]] entry"""
+    if not raw.get('handle'):
+        raise ValueError(f"channel entry without handle: {raw}")
+    channel = {
+        'handle': raw['handle'],
+        'name': raw.get('name', raw['handle']),
+        'group': raw.get('group', DEFAULT_GROUP),
+        'tags': list(raw.get('tags', [])),
+        'poll_hours': float(raw.get('poll_hours', 0)),
+        'enabled': bool(raw.get('enabled', True)),
+    }
+    if raw.get('channel_id'):
+        channel['channel_id'] = raw['channel_id']
+    return channel
+
+
+class ChannelRegistry:
+    """
+    In-memory view of channels.toml.
+    Lookups by group, tag and handle are dict-indexed; call
+    reload_if_changed() to pick up edits without restarting.
+    """
+
+    def __init__(self, path: Path = CHANNELS_FILE):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._signature = None
+        self._channels: list[dict] = []
+        self._by_group: dict[str, list[dict]] = {}
+        self._by_tag: dict[str, list[dict]] = {}
+        self._by_handle: dict[str, dict] = {}
+        self.reload_if_changed()
+
+    def _file_signature(self):
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def reload_if_changed(self) -> bool:
+        """Re-read the file if its mtime/size changed. Returns True on reload."""
+        signature = self._file_signature()
+        with self._lock:
+            if signature == self._signature:
+                return False
+            if signature is None:
+                print(f"  ⚠️ 채널 목록 파일 없음: {self.path}")
+                channels = []
+            else:
+                try:
+                    with open(self.path, 'rb') as f:
+                        channels = [_normalize(raw) for raw in tomllib.load(f).get('channels', [])]
+                except (tomllib.TOMLDecodeError, ValueError) as e:
+                    # 편집 중 깨진 파일이면 기존 목록 유지
+                    print(f"  ⚠️ 채널 목록 파싱 실패 (이전 목록 유지): {e}")
+                    self._signature = signature
+                    return False
+            self._index(channels)
+            self._signature = signature
+        print(f"  📋 채널 목록 로드: {len(channels)}개 ({self.path.name})")
+        return True
+
+    def _index(self, channels: list[dict]):
+        by_group: dict[str, list[dict]] = {}
+        by_tag: dict[str, list[dict]] = {}
+        by_handle: dict[str, dict] = {}
+        for ch in channels:
+            by_handle[ch['handle'].lower()] = ch
+            if not ch['enabled']:
+                continue
+            by_group.setdefault(ch['group'], []).append(ch)
+            for tag in ch['tags']:
+                by_tag.setdefault(tag, []).append(ch)
+        self._channels = channels
+        self._by_group, self._by_tag, self._by_handle = by_group, by_tag, by_handle
+
+    def channels(self, group: Optional[str] = None, tag: Optional[str] = None) -> list[dict]:
+        """Enabled channels, optionally restricted to a group and/or tag"""
+        with self._lock:
+            if group is not None:
+                selected = self._by_group.get(group, [])
+            elif tag is not None:
+                selected = self._by_tag.get(tag, [])
+            else:
+                selected = [ch for ch in self._channels if ch['enabled']]
+            if group is not None and tag is not None:
+                selected = [ch for ch in selected if tag in ch['tags']]
+            return list(selected)
+
+    def groups(self) -> list[str]:
+        with self._lock:
+            return sorted(self._by_group)
+
+    def get(self, handle: str) -> Optional[dict]:
+        with self._lock:
+            return self._by_handle.get(handle.lower())
+
+    def __len__(self) -> int:
+        return len(self._channels)
@@ -9,11 +9,26 @@ from pathlib import Path
 # 모든 스크립트에서 동일한 뿌리(PROJECT_ROOT)를 공유하도록 설계합니다.
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
+CHANNELS_FILE = PROJECT_ROOT / "channels.toml"
 BROWSER_STATE_DIR = DATA_DIR / "browser_state"
 BROWSER_PROFILE_DIR = BROWSER_STATE_DIR / "browser_profile"
+WORKER_PROFILES_DIR = BROWSER_STATE_DIR / "worker_profiles"   # 동시 실행 워커별 프로필 (worker_1, worker_2 ...)
 STATE_FILE = BROWSER_STATE_DIR / "state.json"
 AUTH_INFO_FILE = DATA_DIR / "auth_info.json"
 LIBRARY_FILE = DATA_DIR / "library.json"
+FEED_CACHE_FILE = DATA_DIR / "feed_cache.json"
+CHANNEL_ID_CACHE_FILE = DATA_DIR / "channel_ids.json"
+VIDEO_INDEX_DB = DATA_DIR / "video_index.db"
+TRANSCRIPT_STORE_DIR = DATA_DIR / "transcripts"
+SELECTOR_STATS_FILE = DATA_DIR / "selector_stats.json"
+NOTEBOOK_MANIFEST_FILE = DATA_DIR / "notebook_sources.json"
+AUDIO_DIR = DATA_DIR / "audio"
+DEBUG_DIR = DATA_DIR / "debug"
+DOM_INDEX_DB = DATA_DIR / "dom_index.db"
+
+# Debug snapshots (실패한 단계의 DOM 덤프)
+DEBUG_MAX_MB = 50               # data/debug 전체 크기 한도 — 넘으면 오래된 파일부터 삭제
+DEBUG_EXTRAS_ENV = "NOTEBOOKLM_DEBUG_EXTRAS"   # "screenshot,aria"
 
 # NotebookLM Selectors
 QUERY_INPUT_SELECTORS = [
@@ -39,6 +54,53 @@ BROWSER_ARGS = [
 
 USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
 
+# Request blocking (headless 세션에서 DOM 조작에 필요 없는 리소스 차단)
+# NOTEBOOKLM_BLOCKING 환경 변수로 프로필 선택: off / default / strict
+BLOCKING_PROFILE_ENV = "NOTEBOOKLM_BLOCKING"
+DEFAULT_BLOCKING_PROFILE = "default"
+BLOCKING_PROFILES = {
+    "off": {"resource_types": [], "url_patterns": []},
+    "default": {
+        "resource_types": ["image", "media", "font"],
+        "url_patterns": [
+            r"google-analytics\.com",
+            r"googletagmanager\.com",
+            r"play\.google\.com/log",
+            r"/gen_204",
+            r"/jserror",
+            r"csp\.withgoogle\.com",
+            r"doubleclick\.net",
+        ],
+    },
+    "strict": {
+        "resource_types": ["image", "media", "font", "texttrack", "manifest"],
+        "url_patterns": [
+            r"google-analytics\.com",
+            r"googletagmanager\.com",
+            r"play\.google\.com/log",
+            r"/gen_204",
+            r"/jserror",
+            r"csp\.withgoogle\.com",
+            r"doubleclick\.net",
+            r"ogs\.google\.com",             # 계정 위젯 (앱 로직과 무관)
+            r"apis\.google\.com/js/",        # 공유/피드백 위젯
+        ],
+    },
+}
+# 차단 대상과 겹쳐도 항상 통과 (앱 자체 RPC, 로그인, 업로드)
+BLOCKING_ALLOW_PATTERNS = [
+    r"notebooklm\.google\.com/_/",
+    r"batchexecute",
+    r"accounts\.google\.com",
+    r"/upload/",
+]
+
+# Source batching (NotebookLM 소스 추가 한도)
+NOTEBOOK_SOURCE_LIMIT = 50      # 노트북당 최대 소스 수 — 넘치면 "<이름> (2)" 노트북으로
+SOURCE_CHUNK_SIZE = 10          # 소스 추가 모달 1회 제출당 URL 수
+SOURCE_PIPELINE_DEPTH = 2       # 처리 중인 묶음이 이만큼 쌓이면 가장 오래된 묶음을 기다림
+SOURCE_CHUNK_TIMEOUT = 120      # 묶음 하나의 처리 대기 한도 (초)
+
 # Timeouts
 LOGIN_TIMEOUT_MINUTES = 10
 QUERY_TIMEOUT_SECONDS = 120
@@ -0,0 +1,178 @@
+"""
+Debug snapshots for failed automation steps
+The page HTML is grabbed only when a step fails (nothing is captured on
+the happy path) and handed to a background thread, which compresses it,
+writes it to data/debug/ unless the same content is already on disk (by
+hash), and deletes the oldest files past a size budget. Screenshots and the ARIA tree are opt-in
+(NOTEBOOKLM_DEBUG_EXTRAS=screenshot,aria).
+"""
+
+import atexit
+import gzip
+import hashlib
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from .config import DEBUG_DIR, DEBUG_EXTRAS_ENV, DEBUG_MAX_MB
+
+EXTRAS = ('screenshot', 'aria')
+
+
+@dataclass
+class Snapshot:
+    step: str
+    taken_at: float
+    sha256: str
+    html_gz: bytes
+    screenshot: Optional[bytes] = None
+    aria_gz: Optional[bytes] = None
+
+    @property
+    def stem(self) -> str:
+        return f"{self.step}_{time.strftime('%Y%m%d_%H%M%S', time.localtime(self.taken_at))}_{self.sha256[:12]}"
+
+
+def _extras_from_env() -> set[str]:
+    raw = os.environ.get(DEBUG_EXTRAS_ENV, '')
+    return {name.strip().lower() for name in raw.split(',') if name.strip().lower() in EXTRAS}
+
+
+class SnapshotStore:
+    """
+    capture() only does the page calls (content, optional screenshot/ARIA)
+    on the caller's thread; hashing, compression and disk I/O happen on a
+    single daemon worker. Call flush() before exiting to wait for writes.
+    """
+
+    def __init__(self, directory: Path = DEBUG_DIR, max_mb: float = DEBUG_MAX_MB,
+                 extras: Optional[set[str]] = None):
+        self.directory = Path(directory)
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.extras = _extras_from_env() if extras is None else set(extras)
+        self._on_disk: Optional[set[str]] = None    # 이미 저장된 스냅샷 해시 앞 12자리
+        self._queue: queue.Queue = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    # ── 수집 (호출한 스레드) ──
+
+    def capture(self, page, step: str):
+        """Grab the page for a failed step and queue it for the worker"""
+        try:
+            html = page.content()
+        except Exception as e:
+            print(f"    ⚠️ 디버그 스냅샷 실패 ({step}): {e}")
+            return
+        screenshot = aria = None
+        if 'screenshot' in self.extras:
+            try:
+                screenshot = page.screenshot(type='jpeg', quality=60)
+            except Exception:
+                pass
+        if 'aria' in self.extras:
+            try:
+                aria = page.locator('body').aria_snapshot(timeout=3000)
+            except Exception:
+                pass
+        self.submit(step, html, screenshot, aria)
+
+    def submit(self, step: str, html: str, screenshot: Optional[bytes] = None, aria: Optional[str] = None):
+        self._queue.put((step, time.time(), html, screenshot, aria))
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name='debug-snapshots', daemon=True)
+                self._worker.start()
+        print(f"    💾 디버그 스냅샷: {step} (백그라운드 저장)")
+
+    def flush(self, timeout: Optional[float] = 30):
+        """Wait until queued snapshots are on disk (at most timeout seconds)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() >= deadline:
+                print(f"    ⚠️ 디버그 스냅샷 {self._queue.unfinished_tasks}개 저장 대기 중단")
+                return
+            time.sleep(0.05)
+
+    # ── 백그라운드 ──
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                self._store(*item)
+            except Exception as e:
+                print(f"    ⚠️ 디버그 스냅샷 저장 실패: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _store(self, step: str, taken_at: float, html: str, screenshot: Optional[bytes], aria: Optional[str]):
+        raw = html.encode('utf-8')
+        snap = Snapshot(
+            step=step, taken_at=taken_at, sha256=hashlib.sha256(raw).hexdigest(),
+            html_gz=gzip.compress(raw, compresslevel=6), screenshot=screenshot,
+            aria_gz=gzip.compress(aria.encode('utf-8')) if aria else None,
+        )
+        self._write(snap)
+        self._enforce_budget()
+
+    def _known_hashes(self) -> set[str]:
+        if self._on_disk is None:
+            self._on_disk = set()
+            if self.directory.exists():
+                for path in self.directory.glob('*.html.gz'):
+                    self._on_disk.add(path.name[:-len('.html.gz')].rsplit('_', 1)[-1])
+        return self._on_disk
+
+    def _write(self, snap: Snapshot):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        known = self._known_hashes()
+        if snap.sha256[:12] in known:
+            return  # 같은 DOM이 이미 저장돼 있음
+        (self.directory / f"{snap.stem}.html.gz").write_bytes(snap.html_gz)
+        if snap.screenshot:
+            (self.directory / f"{snap.stem}.jpg").write_bytes(snap.screenshot)
+        if snap.aria_gz:
+            (self.directory / f"{snap.stem}.aria.yml.gz").write_bytes(snap.aria_gz)
+        known.add(snap.sha256[:12])
+
+    def _enforce_budget(self):
+        """Delete the oldest files until the debug directory fits in max_bytes (the newest is always kept)"""
+        files = sorted((p.stat().st_mtime, p.stat().st_size, p) for p in self.directory.iterdir() if p.is_file())
+        total = sum(size for _, size, _ in files)
+        for _, size, path in files[:-1]:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+                total -= size
+                if path.name.endswith('.html.gz'):
+                    self._known_hashes().discard(path.name[:-len('.html.gz')].rsplit('_', 1)[-1])
+            except OSError:
+                continue
+
+
+def load_snapshot(path: Path) -> str:
+    """HTML of a stored snapshot (.html.gz) or a legacy debug_*.html dump"""
+    path = Path(path)
+    if path.suffix == '.gz':
+        return gzip.decompress(path.read_bytes()).decode('utf-8', errors='replace')
+    return path.read_text(encoding='utf-8', errors='replace')
+
+
+_default_store: Optional[SnapshotStore] = None
+_default_lock = threading.Lock()
+
+
+def get_store() -> SnapshotStore:
+    """Process-wide store; pending writes are flushed at interpreter exit"""
+    global _default_store
+    with _default_lock:  # 워커 스레드 여러 개가 동시에 처음 부를 수 있다
+        if _default_store is None:
+            _default_store = SnapshotStore()
+            atexit.register(_default_store.flush)
+    return _default_store
@@ -0,0 +1,336 @@
+"""
+Structural index of interactive controls in DOM dumps
+A single regex pass over the HTML (no DOM tree) pulls out buttons, links,
+inputs and role/tabindex elements with their tag, role, aria-label, text,
+classes and ancestor path. Results are kept in SQLite keyed by content hash,
+so re-indexing a directory only parses new dumps, and two dumps can be
+diffed to see which controls moved, were renamed, added or removed.
+"""
+
+import hashlib
+import html as html_lib
+import re
+import sqlite3
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import astuple, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .config import DOM_INDEX_DB
+from .debug_snapshots import load_snapshot
+
+INTERACTIVE_TAGS = {'button', 'a', 'input', 'textarea', 'select', 'summary', 'option'}
+INTERACTIVE_ROLES = {'button', 'link', 'menuitem', 'menuitemcheckbox', 'menuitemradio', 'tab', 'checkbox',
+                     'radio', 'switch', 'option', 'combobox', 'textbox', 'searchbox', 'slider'}
+VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'param',
+             'source', 'track', 'wbr'}
+# 경로에서 생략하는 범용 태그 (경로는 커스텀 요소와 구조 태그만으로 구성)
+GENERIC_TAGS = {'div', 'span', 'p', 'b', 'i', 'em', 'strong', 'small', 'font', 'label', 'html', 'body'}
+KEPT_ATTRS = ('formcontrolname', 'placeholder', 'type', 'name')
+PATH_DEPTH = 6
+TEXT_LIMIT = 100
+
+# 주석, script/style/svg/template 블록, 시작/끝 태그, 텍스트를 한 번에 토큰화
+_TOKEN = re.compile(
+    r'<!--.*?-->'
+    r'|<(script|style|svg|template)\b[^>]*>.*?</\1\s*>'
+    r'|<(/?)([a-zA-Z][\w:.-]*)((?:[^>"\']|"[^"]*"|\'[^\']*\')*)>'
+    r'|([^<]+)',
+    re.S | re.I,
+)
+_ATTR = re.compile(r'([^\s=/>"\']+)(?:\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+)))?')
+# Angular/Material이 상태에 따라 붙였다 떼는 클래스는 비교에서 제외
+_VOLATILE_CLASS = re.compile(r'^(?:ng-|cdk-(?:focused|mouse|keyboard|program)|mat-mdc-focus|mdc-ripple|_ngcontent|_nghost)')
+
+
+@dataclass(frozen=True)
+class Control:
+    tag: str
+    role: str
+    aria_label: str
+    text: str
+    classes: str
+    path: str
+    attrs: str
+
+    @property
+    def label(self) -> str:
+        return self.aria_label or self.text
+
+    def describe(self) -> str:
+        label = f' "{self.label[:50]}"' if self.label else ''
+        role = f'[role={self.role}]' if self.role else ''
+        return f"{self.tag}{role}{label}"
+
+
+def _attrs(raw: str) -> dict[str, str]:
+    out = {}
+    for match in _ATTR.finditer(raw):
+        name = match.group(1).lower()
+        value = match.group(2) if match.group(2) is not None else (match.group(3) if match.group(3) is not None else match.group(4) or '')
+        out.setdefault(name, html_lib.unescape(value))
+    return out
+
+
+def _squash(text: str) -> str:
+    return ' '.join(html_lib.unescape(text).split())[:TEXT_LIMIT]
+
+
+def extract_controls(html: str) -> list[Control]:
+    """Interactive controls of one HTML document, in document order"""
+    stack: list[str] = []                 # 열린 태그 (경로 계산용)
+    open_controls: list[list] = []        # [tag, attrs, path, text parts, stack depth]
+    controls: list[Control] = []
+
+    def emit(tag: str, attrs: dict, path: str, text: str):
+        classes = ' '.join(sorted(c for c in attrs.get('class', '').split() if not _VOLATILE_CLASS.match(c)))
+        kept = ';'.join(f"{k}={attrs[k]}" for k in KEPT_ATTRS if attrs.get(k))
+        if not text and tag in ('input', 'textarea'):
+            text = attrs.get('placeholder', '')
+        controls.append(Control(tag, attrs.get('role', ''), attrs.get('aria-label', ''), _squash(text),
+                                classes, path, kept))
+
+    for match in _TOKEN.finditer(html):
+        text = match.group(5)
+        if text is not None:
+            if open_controls and not text.isspace():
+                for ctl in open_controls:
+                    ctl[3].append(text)
+            continue
+        tag = match.group(3)
+        if tag is None:
+            continue  # 주석 / script 등 건너뛴 블록
+        tag = tag.lower()
+        raw = match.group(4)
+
+        if match.group(2):  # 끝 태그
+            if tag not in stack:
+                continue
+            while stack:
+                closed = stack.pop()
+                if open_controls and open_controls[-1][4] == len(stack):
+                    ctl = open_controls.pop()
+                    emit(ctl[0], ctl[1], ctl[2], ' '.join(ctl[3]))
+                if closed == tag:
+                    break
+            continue
+
+        interactive = tag in INTERACTIVE_TAGS or 'role=' in raw or 'tabindex' in raw
+        attrs = _attrs(raw) if interactive else None
+        if interactive and tag not in INTERACTIVE_TAGS:
+            interactive = attrs.get('role', '') in INTERACTIVE_ROLES or (
+                'tabindex' in attrs and attrs['tabindex'] != '-1')
+        if interactive and tag == 'a' and 'href' not in attrs and not attrs.get('role'):
+            interactive = False
+
+        path = ''
+        if interactive:
+            segments = [t for t in stack if t not in GENERIC_TAGS]
+            path = ' > '.join(segments[-PATH_DEPTH:])
+
+        self_closing = raw.rstrip().endswith('/')
+        if tag in VOID_TAGS or self_closing:
+            if interactive:
+                emit(tag, attrs, path, '')
+            continue
+        if interactive:
+            open_controls.append([tag, attrs, path, [], len(stack)])
+        stack.append(tag)
+
+    # 닫히지 않은 채 문서가 끝난 컨트롤
+    for ctl in reversed(open_controls):
+        emit(ctl[0], ctl[1], ctl[2], ' '.join(ctl[3]))
+    return controls
+
+
+def index_file(path: Path) -> tuple[str, str, int, list[tuple]]:
+    """(name, sha256, bytes, control tuples) for one dump — runs in worker processes"""
+    path = Path(path)
+    data = path.read_bytes()
+    sha256 = hashlib.sha256(data).hexdigest()
+    controls = extract_controls(load_snapshot(path))
+    return path.name, sha256, len(data), [astuple(c) for c in controls]
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dumps (
+    id         INTEGER PRIMARY KEY,
+    name       TEXT NOT NULL UNIQUE,
+    sha256     TEXT NOT NULL,
+    bytes      INTEGER NOT NULL,
+    controls   INTEGER NOT NULL,
+    indexed_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS controls (
+    dump_id    INTEGER NOT NULL REFERENCES dumps (id) ON DELETE CASCADE,
+    ord        INTEGER NOT NULL,
+    tag        TEXT NOT NULL,
+    role       TEXT NOT NULL,
+    aria_label TEXT NOT NULL,
+    text       TEXT NOT NULL,
+    classes    TEXT NOT NULL,
+    path       TEXT NOT NULL,
+    attrs      TEXT NOT NULL,
+    PRIMARY KEY (dump_id, ord)
+) WITHOUT ROWID;
+"""
+
+
+class DomIndex:
+    """
+    SQLite index of controls per dump (by file name).
+    A dump is re-parsed only when its content hash changes.
+    """
+
+    def __init__(self, path: Path = DOM_INDEX_DB):
+        self.path = Path(path)
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path))
+            self._conn.execute("PRAGMA foreign_keys = ON")
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def update(self, paths: Iterable[Path], workers: Optional[int] = None) -> tuple[int, int]:
+        """Index new or changed dumps (in parallel). Returns (indexed, skipped)."""
+        db = self._db()
+        known = dict(db.execute("SELECT name, sha256 FROM dumps"))
+        todo = []
+        skipped = 0
+        for path in paths:
+            path = Path(path)
+            if known.get(path.name) == hashlib.sha256(path.read_bytes()).hexdigest():
+                skipped += 1
+            else:
+                todo.append(path)
+        if not todo:
+            return 0, skipped
+
+        pool = None
+        if len(todo) > 1 and workers != 1:
+            pool = ProcessPoolExecutor(max_workers=workers)
+            results = pool.map(index_file, todo, chunksize=4)
+        else:
+            results = map(index_file, todo)
+        try:
+            now = datetime.now(timezone.utc).isoformat()
+            with db:
+                for name, sha256, size, rows in results:
+                    db.execute("DELETE FROM dumps WHERE name = ?", (name,))
+                    cur = db.execute(
+                        "INSERT INTO dumps (name, sha256, bytes, controls, indexed_at) VALUES (?, ?, ?, ?, ?)",
+                        (name, sha256, size, len(rows), now),
+                    )
+                    db.executemany(
+                        "INSERT INTO controls VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        [(cur.lastrowid, i, *row) for i, row in enumerate(rows)],
+                    )
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        return len(todo), skipped
+
+    def dumps(self) -> list[tuple[str, int, int, str]]:
+        """(name, bytes, controls, indexed_at) for every indexed dump"""
+        return list(self._db().execute("SELECT name, bytes, controls, indexed_at FROM dumps ORDER BY name"))
+
+    def controls(self, name: str) -> list[Control]:
+        rows = self._db().execute(
+            "SELECT c.tag, c.role, c.aria_label, c.text, c.classes, c.path, c.attrs "
+            "FROM controls c JOIN dumps d ON d.id = c.dump_id WHERE d.name = ? ORDER BY c.ord",
+            (name,),
+        )
+        return [Control(*row) for row in rows]
+
+    def search(self, term: str, limit: int = 50) -> list[tuple[str, Control]]:
+        """Controls whose label, classes or attrs contain term, across all dumps"""
+        like = f"%{term}%"
+        rows = self._db().execute(
+            "SELECT d.name, c.tag, c.role, c.aria_label, c.text, c.classes, c.path, c.attrs "
+            "FROM controls c JOIN dumps d ON d.id = c.dump_id "
+            "WHERE c.aria_label LIKE ? OR c.text LIKE ? OR c.classes LIKE ? OR c.attrs LIKE ? "
+            "ORDER BY d.name, c.ord LIMIT ?",
+            (like, like, like, like, limit),
+        )
+        return [(row[0], Control(*row[1:])) for row in rows]
+
+
+def _take(pool: dict[tuple, list[Control]], key: tuple) -> Optional[Control]:
+    items = pool.get(key)
+    return items.pop(0) if items else None
+
+
+def diff_controls(old: list[Control], new: list[Control]) -> dict[str, list]:
+    """
+    Pair up controls of two dumps, most specific match first:
+    unchanged (same everything), moved (same label, different path or
+    classes), renamed (same path and classes, different label); whatever
+    is left is removed / added.
+    """
+    result = {'unchanged': 0, 'moved': [], 'renamed': [], 'removed': [], 'added': []}
+
+    def group(controls: list[Control], key) -> dict[tuple, list[Control]]:
+        pool = defaultdict(list)
+        for c in controls:
+            pool[key(c)].append(c)
+        return pool
+
+    # 1단계: 완전히 같은 컨트롤
+    pool = group(new, lambda c: c)
+    rest_old = []
+    for c in old:
+        if _take(pool, c) is not None:
+            result['unchanged'] += 1
+        else:
+            rest_old.append(c)
+    rest_new = [c for items in pool.values() for c in items]
+
+    # 2단계: 같은 이름(태그/역할/레이블)이 다른 위치로 이동 (aria-label이 있으면 텍스트 차이는 무시)
+    label_key = lambda c: (c.tag, c.role, c.label)
+    pool = group(rest_new, label_key)
+    unmatched = []
+    for c in rest_old:
+        match = _take(pool, label_key(c)) if c.label else None
+        if match is not None:
+            result['moved'].append((c, match))
+        else:
+            unmatched.append(c)
+    rest_old = unmatched
+    rest_new = [c for items in pool.values() for c in items]
+
+    # 3단계: 같은 자리(경로/태그/클래스)에서 이름만 바뀜
+    place_key = lambda c: (c.path, c.tag, c.classes)
+    pool = group(rest_new, place_key)
+    for c in rest_old:
+        match = _take(pool, place_key(c))
+        if match is not None:
+            result['renamed'].append((c, match))
+        else:
+            result['removed'].append(c)
+    result['added'] = [c for items in pool.values() for c in items]
+    return result
+
+
+def format_diff(diff: dict, old_name: str, new_name: str, limit: int = 30) -> str:
+    lines = [f"🔀 {old_name} → {new_name}: 그대로 {diff['unchanged']}, 이동 {len(diff['moved'])}, "
+             f"이름 변경 {len(diff['renamed'])}, 삭제 {len(diff['removed'])}, 추가 {len(diff['added'])}"]
+    for old, new in diff['renamed'][:limit]:
+        lines.append(f"  ✏️ {old.describe()} → \"{new.label[:50]}\"  @ {new.path or '(root)'}")
+    for old, new in diff['moved'][:limit]:
+        where = f"{old.path or '(root)'} → {new.path or '(root)'}" if old.path != new.path else f"class: {old.classes} → {new.classes}"
+        lines.append(f"  🚚 {new.describe()}  {where}")
+    for c in diff['removed'][:limit]:
+        lines.append(f"  ➖ {c.describe()}  @ {c.path or '(root)'}")
+    for c in diff['added'][:limit]:
+        lines.append(f"  ➕ {c.describe()}  @ {c.path or '(root)'}")
+    return '\n'.join(lines)
@@ -0,0 +1,114 @@
+"""
+Batched DOM queries
+One page.evaluate collects text, aria-label, visibility and a stable handle
+for every element matching a selector, so scans of buttons or notebook cards
+cost a single round trip instead of one is_visible()/inner_text() per element.
+Matching happens in Python; only the element that is finally clicked is
+touched again, through its handle selector.
+"""
+
+import itertools
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional, Sequence
+
+from patchright.sync_api import Error as PlaywrightError
+from patchright.sync_api import Page
+
+SCAN_ATTR = 'data-nlm-scan'
+
+# 요소마다 data-nlm-scan="<scan>-<i>"를 찍어 두면 DOM이 바뀌어도 같은 요소를 다시 찾을 수 있다.
+# related가 있으면 요소의 카드(closest 후보 순서대로) 안의 관련 요소(예: 메뉴 버튼)도 함께 찍는다.
+_SCAN_JS = """
+({selector, scanId, attr, limit, closest, child}) => {
+  const isVisible = (el) => {
+    const rect = el.getBoundingClientRect();
+    if (rect.width === 0 || rect.height === 0) return false;
+    const style = getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none';
+  };
+  const out = [];
+  const elements = Array.from(document.querySelectorAll(selector)).slice(0, limit);
+  elements.forEach((el, index) => {
+    const key = scanId + '-' + index;
+    el.setAttribute(attr, key);
+    let related = false;
+    if (closest.length) {
+      let card = null;
+      for (const sel of closest) { card = el.closest(sel); if (card) break; }
+      const rel = card && card.querySelector(child);
+      if (rel) { rel.setAttribute(attr, key + '-r'); related = true; }
+    }
+    out.push({
+      key, index,
+      tag: el.tagName.toLowerCase(),
+      text: (el.innerText || el.textContent || '').trim().slice(0, 500),
+      aria_label: el.getAttribute('aria-label') || '',
+      title: el.getAttribute('title') || '',
+      href: el.getAttribute('href') || '',
+      visible: isVisible(el),
+      related,
+    });
+  });
+  return out;
+}
+"""
+
+_scan_ids = itertools.count(1)
+
+
+@dataclass
+class ScannedElement:
+    key: str
+    index: int
+    tag: str
+    text: str
+    aria_label: str
+    title: str
+    href: str
+    visible: bool
+    related: bool
+
+    @property
+    def selector(self) -> str:
+        """Selector that finds this element again (valid while it stays in the DOM)"""
+        return f'[{SCAN_ATTR}="{self.key}"]'
+
+    @property
+    def related_selector(self) -> Optional[str]:
+        return f'[{SCAN_ATTR}="{self.key}-r"]' if self.related else None
+
+    @property
+    def label(self) -> str:
+        """Visible text, falling back to aria-label/title (icon-only buttons)"""
+        return ' '.join(self.text.split()) or self.aria_label or self.title
+
+
+def _scan_args(selector: str, limit: int, related: Optional[tuple[Sequence[str], str]]) -> dict:
+    closest, child = related if related else ([], '')
+    return {
+        'selector': selector, 'scanId': f's{next(_scan_ids)}', 'attr': SCAN_ATTR,
+        'limit': limit, 'closest': list(closest), 'child': child,
+    }
+
+
+def scan(page: Page, selector: str, limit: int = 1000,
+         related: Optional[tuple[Sequence[str], str]] = None) -> list[ScannedElement]:
+    """
+    Describe every element matching selector in one round trip.
+    related=(closest_selectors, child_selector) also marks, for each
+    element, the first child_selector inside its nearest card.
+    """
+    try:
+        rows = page.evaluate(_SCAN_JS, _scan_args(selector, limit, related))
+    except PlaywrightError as e:
+        print(f"  ⚠️ DOM 스캔 실패 ({selector}): {e}")
+        return []
+    return [ScannedElement(**row) for row in rows]
+
+
+def find_first(elements: Iterable[ScannedElement], predicate: Callable[[ScannedElement], bool],
+               visible_only: bool = True) -> Optional[ScannedElement]:
+    for el in elements:
+        if (el.visible or not visible_only) and predicate(el):
+            return el
+    return None
@@ -0,0 +1,69 @@
+"""
+Shared HTTP session for research-phase network calls
+One pooled requests.Session with keep-alive, default timeouts and retries,
+so feeds, channel pages and transcripts reuse TCP/TLS connections
+"""
+
+import threading
+from typing import Mapping, Optional
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_TIMEOUT = 10
+POOL_SIZE = 32  # 호스트당 유지할 keep-alive 연결 수 (동시 워커 수 이상)
+
+# 일시적 오류/쓰로틀링(429)은 지수 백오프로 재시도, Retry-After 헤더 존중
+DEFAULT_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({'GET', 'HEAD', 'POST'}),
+    respect_retry_after_header=True,
+    raise_on_status=False,  # 재시도 후에도 실패하면 응답을 그대로 돌려줌
+)
+
+
+class PooledSession(requests.Session):
+    """requests.Session with a connection pool, retry policy and default timeout"""
+
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT, pool_size: int = POOL_SIZE,
+                 retry: Retry = DEFAULT_RETRY, adapters: Optional[Mapping[str, BaseAdapter]] = None):
+        super().__init__()
+        self.timeout = timeout
+        if adapters is not None:
+            # 다른 세션의 어댑터(= 연결 풀)를 그대로 쓴다
+            for prefix, adapter in adapters.items():
+                self.mount(prefix, adapter)
+            return
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+_session: Optional[PooledSession] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> PooledSession:
+    """Process-wide shared session (created on first use)"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = PooledSession()
+        return _session
+
+
+def pooled_session() -> PooledSession:
+    """
+    New session with its own headers and cookies that mounts the shared
+    session's adapters, for clients that modify their session (the
+    connections are still pooled, the shared session's state is untouched)
+    """
+    shared = get_session()
+    return PooledSession(timeout=shared.timeout, adapters=shared.adapters)
@@ -0,0 +1,123 @@
+"""
+Incremental notebook sync for NotebookLM
+Reads the current sources list in one DOM query and works out which rows are
+stale and which URLs are missing, so a run only removes and adds the
+difference instead of deleting and recreating the whole notebook
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from patchright.sync_api import Error as PlaywrightError
+from patchright.sync_api import Page
+
+from .cache import JsonCache
+from .config import NOTEBOOK_MANIFEST_FILE
+from .source_tracker import video_id
+
+# 소스 목록의 모든 행을 한 번의 evaluate로 읽는다 (SourceTracker와 같은 판정 기준)
+_SOURCES_JS = """
+() => Array.from(document.querySelectorAll('.single-source-container')).map((row, index) => {
+  const titleEl = row.querySelector('.source-title');
+  const title = ((titleEl && (titleEl.getAttribute('aria-label') || titleEl.textContent)) || '').trim();
+  const icon = ((row.querySelector('.source-item-source-icon') || {}).textContent || '').trim();
+  const loading = !!row.querySelector('mat-progress-spinner, .mat-mdc-progress-spinner, [role="progressbar"]');
+  const error = /error|warning|report/.test(icon) || /error|failed/.test(row.className);
+  return {index, title, state: loading ? 'loading' : (error ? 'error' : 'ready')};
+}).filter(row => row.title)
+"""
+
+_ROW_TITLE_JS = """
+(row) => {
+  const titleEl = row.querySelector('.source-title');
+  return ((titleEl && (titleEl.getAttribute('aria-label') || titleEl.textContent)) || '').trim();
+}
+"""
+
+
+def row_title(row) -> str:
+    """Title of one source row locator, read the same way as read_sources()"""
+    return row.evaluate(_ROW_TITLE_JS, timeout=2000)
+
+
+def read_sources(page: Page) -> Optional[list[dict]]:
+    """Current source rows ({index, title, state}), or None if the list could not be read"""
+    try:
+        return page.evaluate(_SOURCES_JS)
+    except PlaywrightError as e:
+        print(f"  ⚠️ 소스 목록 읽기 실패: {e}")
+        return None
+
+
+def _norm(text: str) -> str:
+    return ' '.join(text.split()).casefold()
+
+
+class NotebookManifest(JsonCache):
+    """
+    Row title each URL ended up with, per notebook name.
+    YouTube sources are listed by video title, not URL, so this is what
+    lets the next sync recognise them when no expected title is given.
+    """
+
+    def __init__(self, path: Path = NOTEBOOK_MANIFEST_FILE):
+        super().__init__(path)
+
+    def titles(self, notebook: str) -> dict[str, str]:
+        return dict(self.get(notebook) or {})
+
+    def record(self, notebook: str, row_titles: dict[str, str]):
+        """Replace the notebook's mapping (URLs no longer in the notebook are dropped)"""
+        self.set(notebook, dict(row_titles))
+
+
+@dataclass
+class SyncPlan:
+    keep: dict[str, str] = field(default_factory=dict)     # URL → 이미 있는 행 제목
+    stale: list[dict] = field(default_factory=list)        # 지울 행 ({index, title, state})
+    missing: list[str] = field(default_factory=list)       # 새로 추가할 URL
+
+    @property
+    def unchanged(self) -> bool:
+        return not self.stale and not self.missing
+
+
+def plan_sync(rows: list[dict], urls: list[str], titles: Optional[dict[str, str]] = None,
+              known: Optional[dict[str, str]] = None) -> SyncPlan:
+    """
+    Match existing rows to the wanted URLs and split the rest into work.
+
+    A row belongs to a URL if its title contains the URL or video id
+    (failed sources keep the URL as title), or equals the title recorded
+    in the manifest (known) or passed by the caller (titles). Rows that
+    failed to ingest are treated as stale so their URL is submitted again.
+    """
+    titles = titles or {}
+    known = known or {}
+    plan = SyncPlan()
+    claimed: set[int] = set()
+
+    def claim(url: str, predicate) -> bool:
+        for row in rows:
+            if row['index'] in claimed or not predicate(row):
+                continue
+            claimed.add(row['index'])
+            if row['state'] == 'error':
+                return False
+            plan.keep[url] = row['title']
+            return True
+        return False
+
+    for url in urls:
+        vid = video_id(url)
+        expected = {_norm(t) for t in (known.get(url), titles.get(url)) if t}
+        if claim(url, lambda row: url in row['title'] or (vid and vid in row['title'])):
+            continue
+        if expected and claim(url, lambda row: _norm(row['title']) in expected):
+            continue
+        if url not in plan.keep:
+            plan.missing.append(url)
+
+    plan.stale = [row for row in rows if row['index'] not in claimed or row['state'] == 'error']
+    return plan
@@ -0,0 +1,142 @@
+"""
+Request blocking for headless NotebookLM sessions
+Routes only the requests that could be blocked (by file extension, asset
+host or telemetry pattern) through context.route, so the app's own XHR/RPC
+traffic never round-trips through Python. Images are stubbed with a 1x1
+GIF, telemetry with an empty 204, fonts and media are aborted.
+"""
+
+import os
+import re
+from collections import Counter
+from typing import Optional
+
+from .config import (
+    BLOCKING_ALLOW_PATTERNS, BLOCKING_PROFILE_ENV, BLOCKING_PROFILES, DEFAULT_BLOCKING_PROFILE,
+)
+
+# 차단 후보만 가로채기 위한 URL 패턴 (확장자 / 정적 리소스 호스트)
+_ASSET_PATTERNS = [
+    r"\.(?:png|jpe?g|gif|webp|avif|ico|svg|bmp)(?:[?#]|$)",
+    r"\.(?:woff2?|ttf|otf|eot)(?:[?#]|$)",
+    r"\.(?:mp4|webm|mp3|m4a|ogg|wav)(?:[?#]|$)",
+    r"\.(?:vtt|webmanifest)(?:[?#]|$)",
+    r"googleusercontent\.com",
+    r"fonts\.(?:googleapis|gstatic)\.com",
+    r"gstatic\.com/.*/(?:images|icons)/",
+]
+
+# 차단한 요청 1개당 아낀 것으로 치는 바이트 — 받지 않은 응답은 잴 수 없으므로 어림값
+_ESTIMATED_BYTES = {
+    "image": 20_000,
+    "font": 60_000,
+    "media": 400_000,
+    "texttrack": 5_000,
+    "manifest": 2_000,
+    "telemetry": 1_000,
+}
+
+_TRANSPARENT_GIF = bytes.fromhex("47494638396101000100800000000000ffffff21f90401000000002c00000000010001000002024401003b")
+
+
+class RequestBlocker:
+    """
+    Blocking profile applied to a browser context.
+    Counters accumulate until reset(), so one blocker can report per run
+    even when the context is reused.
+    """
+
+    def __init__(self, profile: str = DEFAULT_BLOCKING_PROFILE):
+        if profile not in BLOCKING_PROFILES:
+            raise ValueError(f"Unknown blocking profile: {profile} (choose from {', '.join(BLOCKING_PROFILES)})")
+        config = BLOCKING_PROFILES[profile]
+        self.profile = profile
+        self.resource_types = set(config["resource_types"])
+        self._telemetry = re.compile("|".join(config["url_patterns"])) if config["url_patterns"] else None
+        self._allow = re.compile("|".join(BLOCKING_ALLOW_PATTERNS))
+        route_patterns = list(config["url_patterns"]) + (_ASSET_PATTERNS if self.resource_types else [])
+        self._route_pattern = re.compile("|".join(route_patterns)) if route_patterns else None
+        self.blocked: Counter = Counter()
+        self.passed = 0
+
+    @classmethod
+    def for_session(cls, headless: bool) -> Optional["RequestBlocker"]:
+        """
+        Blocker for a new session, or None when disabled.
+        Visible (debugging) sessions load everything; headless ones use the
+        profile named by NOTEBOOKLM_BLOCKING (default: 'default').
+        """
+        if not headless:
+            return None
+        profile = os.environ.get(BLOCKING_PROFILE_ENV, DEFAULT_BLOCKING_PROFILE).strip().lower()
+        if profile == "off":
+            return None
+        try:
+            return cls(profile)
+        except ValueError as e:
+            print(f"  ⚠️ {e} — 차단 없이 진행")
+            return None
+
+    # ── 판단 ──
+
+    def classify(self, url: str, resource_type: str) -> Optional[str]:
+        """Block category for a request, or None to let it through"""
+        if self._allow.search(url):
+            return None
+        if self._telemetry and self._telemetry.search(url):
+            return "telemetry"
+        if resource_type in self.resource_types:
+            return resource_type
+        return None
+
+    def _decide(self, route) -> tuple[str, dict]:
+        request = route.request
+        kind = self.classify(request.url, request.resource_type)
+        if kind is None:
+            self.passed += 1
+            return "continue", {}
+        self.blocked[kind] += 1
+        if kind == "image":
+            return "fulfill", {"status": 200, "content_type": "image/gif", "body": _TRANSPARENT_GIF}
+        if kind == "telemetry":
+            return "fulfill", {"status": 204, "body": b""}
+        return "abort", {"error_code": "blockedbyclient"}
+
+    # ── 연결 ──
+
+    def attach(self, context):
+        if self._route_pattern is None:
+            return
+
+        def handler(route):
+            action, kwargs = self._decide(route)
+            try:
+                if action == "continue":
+                    route.continue_()
+                elif action == "fulfill":
+                    route.fulfill(**kwargs)
+                else:
+                    route.abort(kwargs["error_code"])
+            except Exception:
+                pass  # 페이지가 이미 닫힌 경우 등
+
+        context.route(self._route_pattern, handler)
+        print(f"  🚫 리소스 차단 프로필: {self.profile}")
+
+    # ── 통계 ──
+
+    def estimated_saved_bytes(self) -> int:
+        """Rough estimate from per-category typical sizes, not measured transfer"""
+        return sum(_ESTIMATED_BYTES.get(kind, 0) * n for kind, n in self.blocked.items())
+
+    def reset(self):
+        self.blocked.clear()
+        self.passed = 0
+
+    def report(self) -> str:
+        total = sum(self.blocked.values())
+        if not total:
+            return f"🚫 리소스 차단 ({self.profile}): 차단한 요청 없음"
+        detail = ", ".join(f"{kind} {n}" for kind, n in self.blocked.most_common())
+        return (f"🚫 리소스 차단 ({self.profile}): 요청 {total}개 차단, 추정 절약량 약 {self.estimated_saved_bytes() / 1024 / 1024:.1f}MB"
+                f" ({detail}; 통과 {self.passed}개)")
@@ -0,0 +1,156 @@
+"""
+Locale-aware selector registry with persisted hit-rate stats
+Detects the NotebookLM UI language once per session and drops candidates
+written for the other language. The rest keep their authored priority:
+all candidates are raced in one wait, so order only decides which visible
+match wins. The hit stats are for reporting and for spotting dead selectors.
+"""
+
+import re
+import time
+from pathlib import Path
+from typing import Optional
+
+from patchright.sync_api import Locator, Page
+
+from .cache import JsonCache
+from .config import SELECTOR_STATS_FILE
+from .selector_resolver import resolve_first
+
+_HANGUL = re.compile(r'[가-힣]')
+_LATIN_WORD = re.compile(r'[A-Za-z]{2,}')
+
+# 셀렉터 안의 "사람이 읽는 텍스트" 부분 (언어 판별 대상)
+_TEXT_PARTS = [
+    re.compile(r'has-text\(\s*["\'](.+?)["\']\s*\)'),
+    re.compile(r'^text=(.+)$'),
+    re.compile(r'aria-label\*?=\s*["\'](.+?)["\']'),
+    re.compile(r'placeholder\*?=\s*["\'](.+?)["\']'),
+]
+
+_LANG_JS = "() => document.documentElement.lang || navigator.language || ''"
+
+# 한국어 UI에서도 그대로 쓰이는 단어 (언어 중립으로 취급)
+_NEUTRAL_WORDS = {'youtube', 'url', 'ai', 'mp3'}
+
+# 이만큼 시도하고도 한 번도 맞지 않은 셀렉터는 삭제 후보로 보고
+DEAD_AFTER = 20
+
+
+def selector_language(selector: str) -> Optional[str]:
+    """'ko' / 'en' for text-bearing selectors, None for structural ones"""
+    texts = []
+    for pattern in _TEXT_PARTS:
+        texts.extend(m.strip('/"\' ') for m in pattern.findall(selector))
+    if not texts:
+        return None
+    joined = ' '.join(texts)
+    if _HANGUL.search(joined):
+        return 'ko'
+    words = [w for w in _LATIN_WORD.findall(joined) if w.lower() not in _NEUTRAL_WORDS]
+    return 'en' if words else None
+
+
+class SelectorRegistry:
+    """
+    Per-step selector stats, stored as
+    {locale: {step: {selector: {attempts, hits, total_ms, last_hit}}}}
+    """
+
+    def __init__(self, stats_file: Path = SELECTOR_STATS_FILE):
+        self._stats = JsonCache(stats_file)
+        self.locale: Optional[str] = None
+
+    def detect_locale(self, page: Page) -> Optional[str]:
+        """Read <html lang> (falls back to navigator.language) once per session"""
+        try:
+            lang = page.evaluate(_LANG_JS)
+        except Exception:
+            return self.locale
+        return self._set_locale(lang)
+
+    def _set_locale(self, lang: str) -> str:
+        self.locale = 'ko' if lang.lower().startswith('ko') else 'en'
+        print(f"  🌐 UI 언어 감지: {lang or '?'} → '{self.locale}' 셀렉터 사용")
+        return self.locale
+
+    def _step_stats(self, step: str) -> dict:
+        return (self._stats.get(self.locale or 'unknown') or {}).get(step, {})
+
+    def candidates(self, step: str, selectors: list[str]) -> list[str]:
+        """Drop other-language candidates; the authored order is kept"""
+        # 과거 적중으로 순서를 바꾸지 않는다 — 한 번 이긴 넓은 폴백이 계속 앞에 오게 된다
+        if self.locale:
+            kept = [s for s in selectors if selector_language(s) in (None, self.locale)]
+            selectors = kept or selectors
+        return list(selectors)
+
+    def dead_selectors(self, min_attempts: int = DEAD_AFTER) -> dict[str, dict[str, list[str]]]:
+        """
+        {locale: {step: [selector, ...]}} — candidates tried at least min_attempts
+        times without a single hit, in steps where some other candidate does hit
+        """
+        dead = {}
+        for locale in self._stats.keys():
+            for step, stats in (self._stats.get(locale) or {}).items():
+                if not any(s['hits'] for s in stats.values()):
+                    continue
+                never = [sel for sel, s in stats.items() if not s['hits'] and s['attempts'] >= min_attempts]
+                if never:
+                    dead.setdefault(locale, {})[step] = sorted(never)
+        return dead
+
+    def record(self, step: str, candidates: list[str], winner: Optional[str], elapsed_ms: float):
+        def bump(by_locale: Optional[dict]) -> dict:
+            by_locale = by_locale or {}
+            step_stats = by_locale.setdefault(step, {})
+            for sel in candidates:
+                s = step_stats.setdefault(sel, {'attempts': 0, 'hits': 0, 'total_ms': 0.0, 'last_hit': None})
+                s['attempts'] += 1
+                if sel == winner:
+                    s['hits'] += 1
+                    s['total_ms'] += elapsed_ms
+                    s['last_hit'] = time.strftime('%Y-%m-%d %H:%M:%S')
+            return by_locale
+
+        # 병렬 워커가 같은 통계를 갱신하므로 캐시 잠금 안에서 읽고-고치고-쓴다
+        self._stats.update(self.locale or 'unknown', bump)
+
+    def resolve(self, page: Page, step: Optional[str], selectors: list[str],
+                timeout: int = 5000) -> Optional[tuple[Locator, str]]:
+        """resolve_first with locale filtering and hit stats"""
+        if not step:
+            return resolve_first(page, selectors, timeout=timeout)
+        candidates = self.candidates(step, selectors)
+        started = time.monotonic()
+        resolved = resolve_first(page, candidates, timeout=timeout)
+        self.record(step, candidates, resolved[1] if resolved else None, (time.monotonic() - started) * 1000)
+        return resolved
+
+    def save(self):
+        try:
+            self._stats.save()
+        except OSError as e:
+            print(f"  ⚠️ 셀렉터 통계 저장 실패: {e}")
+
+    def report(self) -> str:
+        """
+        Text table of hit rate per step and selector. The average is the time
+        until the element showed up (page speed), not a property of the selector.
+        """
+        dead = self.dead_selectors()
+        lines = []
+        for locale in sorted(self._stats.keys()):
+            lines.append(f"[{locale}]")
+            for step, stats in sorted(self._stats.get(locale).items()):
+                lines.append(f"  {step}")
+                ordered = sorted(stats.items(), key=lambda kv: (-kv[1]['hits'], kv[0]))
+                for sel, s in ordered:
+                    rate = s['hits'] / s['attempts'] if s['attempts'] else 0.0
+                    avg = f"{s['total_ms'] / s['hits']:.0f}ms" if s['hits'] else '-'
+                    flag = '' if s['hits'] else '  ⚠️ 적중 없음'
+                    if sel in dead.get(locale, {}).get(step, ()):
+                        flag += ' — 삭제 후보'
+                    lines.append(f"    {rate:6.1%} {s['hits']:>4}/{s['attempts']:<4} {avg:>8}  {sel}"
+                                 f"  (마지막 적중: {s['last_hit'] or '-'}){flag}")
+        return '\n'.join(lines) if lines else '(셀렉터 통계 없음)'
@@ -0,0 +1,69 @@
+"""
+Selector resolver for NotebookLM automation
+Waits on all candidate selectors at once (a union locator) instead of
+trying them one by one, so a step costs one timeout instead of N
+"""
+
+from typing import Optional
+
+from patchright.sync_api import Error as PlaywrightError
+from patchright.sync_api import Locator, Page
+from patchright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+
+def union_locator(page: Page, selectors: list[str]) -> Locator:
+    """Combine candidates with Locator.or_() so one wait covers all of them"""
+    union = page.locator(selectors[0])
+    for sel in selectors[1:]:
+        union = union.or_(page.locator(sel))
+    return union
+
+
+def _only(locator: Locator, state: str) -> Locator:
+    # .first는 DOM 순서상 첫 매칭 — 앞쪽에 숨은 요소가 있으면 그 요소만 기다리게 되므로
+    # 보이는 요소만 남긴 뒤 고른다
+    return locator.filter(visible=True) if state == "visible" else locator
+
+
+def _first_matching(page: Page, selectors: list[str], state: str) -> Optional[tuple[Locator, str]]:
+    """Highest-priority candidate with a match in state right now (no waiting)"""
+    for sel in selectors:
+        try:
+            loc = _only(page.locator(sel), state)
+            if loc.count() > 0:
+                return loc.first, sel
+        except PlaywrightError:
+            continue
+    return None
+
+
+def resolve_first(page: Page, selectors: list[str], timeout: int = 5000,
+                  state: str = "visible") -> Optional[tuple[Locator, str]]:
+    """
+    Wait until any candidate reaches state, then return (locator, selector)
+    for the highest-priority candidate that matched. None on timeout.
+
+    Candidate order still decides the winner when several match at once.
+    For state="visible" hidden matches are ignored, so a broad candidate
+    matching a hidden element earlier in the DOM cannot stall the wait.
+    If the union itself is rejected (e.g. one malformed selector), fall
+    back to checking candidates individually within the same deadline.
+    """
+    if not selectors:
+        return None
+    try:
+        _only(union_locator(page, selectors), state).first.wait_for(state=state, timeout=timeout)
+    except PlaywrightTimeoutError:
+        return None
+    except PlaywrightError:
+        # 잘못된 셀렉터 하나가 union 전체를 깨뜨린 경우 — 개별 확인으로 폴백
+        per_selector = max(timeout // len(selectors), 100)
+        for sel in selectors:
+            try:
+                loc = _only(page.locator(sel), state).first
+                loc.wait_for(state=state, timeout=per_selector)
+                return loc, sel
+            except PlaywrightError:
+                continue
+        return None
+    return _first_matching(page, selectors, state)
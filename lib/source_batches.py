@@ -0,0 +1,31 @@
+"""
+Batching helpers for bulk source insertion
+Splits URL lists into per-submission chunks and spreads them over as many
+notebooks as the per-notebook source cap requires
+"""
+
+from typing import Iterator
+
+from .config import NOTEBOOK_SOURCE_LIMIT, SOURCE_CHUNK_SIZE
+
+
+def chunked(urls: list[str], size: int = SOURCE_CHUNK_SIZE) -> Iterator[list[str]]:
+    size = max(1, size)
+    for start in range(0, len(urls), size):
+        yield urls[start:start + size]
+
+
+def split_for_capacity(urls: list[str], room: int,
+                       limit: int = NOTEBOOK_SOURCE_LIMIT) -> tuple[list[str], list[list[str]]]:
+    """
+    (URLs that fit in the current notebook, [URLs for each spillover notebook]).
+    room is how many sources the current notebook can still take.
+    """
+    room = max(0, min(room, limit))
+    head, rest = urls[:room], urls[room:]
+    return head, list(chunked(rest, limit))
+
+
+def spillover_name(base: str, number: int) -> str:
+    """Notebook name for the number-th notebook of a run ('Daily new', 'Daily new (2)', ...)"""
+    return base if number <= 1 else f"{base} ({number})"
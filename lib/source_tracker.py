@@ -0,0 +1,263 @@
+"""
+Per-URL source ingestion tracking for NotebookLM
+A MutationObserver on the sources list reports every row change through
+expose_binding, and notebook RPC responses are watched for acknowledgement,
+so each submitted URL settles as ok / failed as soon as its row does
+"""
+
+import re
+from typing import Optional
+
+from patchright.sync_api import Error as PlaywrightError
+from patchright.sync_api import Page, Response
+
+BINDING_NAME = '__nlmSourceEvent'
+
+_VIDEO_ID = re.compile(r'(?:[?&]v=|youtu\.be/|/shorts/|/live/)([\w-]{11})')
+
+# 소스 목록 행(.single-source-container)의 제목/상태가 바뀔 때마다 binding 호출.
+# version은 Python 쪽에서 "변화가 생길 때까지" 기다리는 데 쓴다.
+_OBSERVER_JS = """
+(bindingName) => {
+  if (window.__nlmSourceObserver) { window.__nlmSourceObserver.flush(); return; }
+  const ROW = '.single-source-container';
+  const last = new WeakMap();
+  const snapshot = (row) => {
+    const titleEl = row.querySelector('.source-title');
+    const title = ((titleEl && (titleEl.getAttribute('aria-label') || titleEl.textContent)) || '').trim();
+    const icon = ((row.querySelector('.source-item-source-icon') || {}).textContent || '').trim();
+    const loading = !!row.querySelector('mat-progress-spinner, .mat-mdc-progress-spinner, [role="progressbar"]');
+    const error = /error|warning|report/.test(icon) || /error|failed/.test(row.className);
+    return {title, icon, state: loading ? 'loading' : (error ? 'error' : 'ready')};
+  };
+  const state = {version: 0, observer: null, flush: null};
+  state.flush = () => {
+    document.querySelectorAll(ROW).forEach((row) => {
+      const s = snapshot(row);
+      if (!s.title) return;
+      const key = s.title + '|' + s.state;
+      if (last.get(row) === key) return;
+      last.set(row, key);
+      window[bindingName](s);
+      state.version += 1;
+    });
+  };
+  let pending = false;
+  state.observer = new MutationObserver(() => {
+    if (pending) return;
+    pending = true;
+    setTimeout(() => { pending = false; state.flush(); }, 50);
+  });
+  state.observer.observe(document.body, {subtree: true, childList: true, attributes: true, characterData: true});
+  window.__nlmSourceObserver = state;
+  state.flush();
+}
+"""
+
+_CHANGED_JS = """
+(seen) => {
+  const o = window.__nlmSourceObserver;
+  return o && o.version !== seen ? o.version : false;
+}
+"""
+
+
+def video_id(url: str) -> Optional[str]:
+    match = _VIDEO_ID.search(url)
+    return match.group(1) if match else None
+
+
+def _norm(text: str) -> str:
+    return ' '.join(text.split()).casefold()
+
+
+class SourceTracker:
+    """
+    Tracks submitted source URLs to 'ok' or 'failed'.
+    One tracker per page; call begin() for every submission batch.
+
+    A row is matched to a URL by, in order: the URL or its video id in the
+    row title (failed sources keep the URL as title), the expected title
+    passed to begin(), and finally submission order for rows that appeared
+    after begin() but matched nothing else.
+    """
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.status: dict[str, str] = {}
+        self.reasons: dict[str, str] = {}
+        self.acknowledged: set[str] = set()
+        self._titles: dict[str, str] = {}
+        self._rows: dict[str, str] = {}          # 행 제목 → 최신 상태
+        self._new_rows: list[str] = []           # begin() 이후 처음 나타난 행 (등장 순)
+        self._row_owner: dict[str, str] = {}     # 행 제목 → URL
+        self._retired: set[str] = set()          # 재시도로 버린 오류 행 제목
+        self._responses: list[Response] = []
+        self._version = 0
+        self._installed = False
+
+    # ── 설치 ──
+
+    def install(self):
+        if self._installed:
+            return
+        self.page.expose_binding(BINDING_NAME, self._on_binding)
+        self.page.on('response', self._on_response)
+        self._installed = True
+
+    def _observe(self):
+        try:
+            self.page.evaluate(_OBSERVER_JS, BINDING_NAME)
+        except PlaywrightError as e:
+            print(f"  ⚠️ 소스 목록 감시 설치 실패: {e}")
+
+    # ── 이벤트 ──
+
+    def _on_binding(self, source, payload: dict):
+        title, state = payload.get('title', ''), payload.get('state', '')
+        if title in self._retired:
+            if state == 'error':
+                return  # 재시도 전의 오류 행이 다시 그려진 것 (목록 재렌더링)
+            self._retired.discard(title)
+        if title not in self._rows:
+            self._new_rows.append(title)
+        self._rows[title] = state
+        url = self._row_owner.get(title) or self._match(title)
+        if url:
+            self._row_owner[title] = url
+            self._apply(url, state)
+
+    def _on_response(self, response: Response):
+        # 핸들러 안에서는 본문을 읽지 않고 모아 두었다가 drain()에서 처리
+        if 'batchexecute' in response.url and response.request.method == 'POST':
+            self._responses.append(response)
+
+    def drain(self):
+        """Scan collected notebook RPC responses for the video ids we submitted"""
+        responses, self._responses = self._responses, []
+        for response in responses:
+            if not self._unacknowledged():
+                return
+            try:
+                self._acknowledge(response.text())
+            except PlaywrightError:
+                continue
+
+    def _unacknowledged(self) -> list[str]:
+        return [u for u, s in self.status.items() if s in ('pending', 'loading') and u not in self.acknowledged]
+
+    def _acknowledge(self, body: str):
+        for url in self._unacknowledged():
+            vid = video_id(url)
+            if (vid and vid in body) or url in body:
+                self.acknowledged.add(url)
+
+    # ── 매칭 ──
+
+    def _match(self, title: str) -> Optional[str]:
+        waiting = [u for u, s in self.status.items() if s in ('pending', 'loading')]
+        for url in waiting:
+            vid = video_id(url)
+            if url in title or (vid and vid in title):
+                return url
+        key = _norm(title)
+        for url in waiting:
+            expected = self._titles.get(url)
+            if expected and _norm(expected) == key:
+                return url
+        return None
+
+    def _apply(self, url: str, state: str):
+        if self.status.get(url) not in ('pending', 'loading'):
+            return
+        if state == 'ready':
+            self.status[url] = 'ok'
+        elif state == 'error':
+            self.status[url] = 'failed'
+            self.reasons[url] = 'source_error'
+        else:
+            self.status[url] = 'loading'
+
+    # ── 배치 ──
+
+    def begin(self, urls: list[str], titles: Optional[dict[str, str]] = None, append: bool = False):
+        """
+        Mark urls pending. append=True keeps rows that appeared since the
+        previous begin(), for a batch submitted while another is still processing.
+        """
+        # 감시를 먼저 걸어 이미 있던 행을 기준선으로 흡수한 뒤 URL을 대기 상태로 둔다
+        self.install()
+        self._observe()
+        # 재시도하는 URL의 이전(오류) 행은 버린다 — 남겨 두면 새 행 대신 그 행에 바로 매칭된다
+        retried = set(urls)
+        stale = [title for title, owner in self._row_owner.items() if owner in retried]
+        for title in stale:
+            del self._row_owner[title]
+            if self._rows.pop(title, None) == 'error':
+                self._retired.add(title)
+        if not append:
+            self._new_rows = []
+        else:
+            self._new_rows = [t for t in self._new_rows if t not in stale]
+        for url in urls:
+            self.status[url] = 'pending'
+            self.reasons.pop(url, None)
+        self._titles.update(titles or {})
+
+    def wait_for_change(self, timeout: float) -> bool:
+        """Block until the sources list changes (or timeout seconds pass)"""
+        try:
+            handle = self.page.wait_for_function(_CHANGED_JS, arg=self._version, timeout=max(timeout, 0.1) * 1000)
+            self._version = handle.json_value()
+            return True
+        except PlaywrightError:
+            return False
+
+    def settled(self, urls: list[str]) -> bool:
+        return all(self.status.get(u) in ('ok', 'failed') for u in urls)
+
+    def fail(self, urls: list[str], reason: str):
+        for url in urls:
+            if self.status.get(url) in ('pending', 'loading'):
+                self.status[url] = 'failed'
+                self.reasons[url] = reason
+
+    def assign_by_order(self, urls: list[str], force: bool = False):
+        """
+        Give new rows that matched nothing (titles unknown) to still-unsettled
+        URLs in submission order. Waits until every such URL has a settled row
+        unless force is set.
+        """
+        unowned = [t for t in self._new_rows if t not in self._row_owner]
+        waiting = [u for u in urls if self.status.get(u) in ('pending', 'loading')]
+        if not unowned or not waiting:
+            return
+        if not force and sum(self._rows[t] != 'loading' for t in unowned) < len(waiting):
+            return
+        if len(unowned) < len(waiting):
+            # 행이 모자라면 응답에서 확인된 URL만 행을 받을 수 있다 (배정 순서는 그대로 제출 순서)
+            chosen = set(sorted(waiting, key=lambda u: u not in self.acknowledged)[:len(unowned)])
+            waiting = [u for u in waiting if u in chosen]
+        for url, title in zip(waiting, unowned):
+            self._row_owner[title] = url
+            self._apply(url, self._rows[title])
+
+    def finalize(self, urls: list[str], order_urls: Optional[list[str]] = None):
+        """
+        Last order-based assignment, then fail whatever is left in urls as
+        timed out. order_urls (all batches in flight, in submission order)
+        keeps a later batch's rows from being given to this one.
+        """
+        self.assign_by_order(order_urls or urls, force=True)
+        self.fail(urls, 'timeout')
+
+    def failed(self, urls: list[str]) -> list[str]:
+        return [u for u in urls if self.status.get(u) == 'failed']
+
+    def succeeded(self, urls: list[str]) -> list[str]:
+        return [u for u in urls if self.status.get(u) == 'ok']
+
+    def row_titles(self, urls: list[str]) -> dict[str, str]:
+        """Row title each URL was matched to (only URLs that have a row)"""
+        owners = {url: title for title, url in self._row_owner.items()}
+        return {u: owners[u] for u in urls if u in owners}
@@ -0,0 +1,338 @@
+"""
+Content-addressed transcript store
+Compressed transcripts keyed by video_id and content hash, with a SQLite
+index, preset-dictionary compression and LRU retention
+
+Layout under TRANSCRIPT_STORE_DIR:
+    index.db                  video_id -> hash, chunk table, access time
+    objects/ab/<sha256>.z     independently deflated chunks, concatenated
+    dicts/<dict_id>.bin       zlib preset dictionaries (trained on captions)
+
+Each transcript is split into CHUNK_CHARS-character chunks compressed on
+their own, so head()/tail() only inflate the chunks they need. The first
+dictionary is trained automatically once TRAIN_AFTER transcripts are stored.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import time
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .config import TRANSCRIPT_STORE_DIR
+
+CHUNK_CHARS = 4096
+DICT_SIZE = 32 * 1024          # zlib은 32KB 윈도우까지만 참조 가능
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+TRAIN_AFTER = 200              # 사전 없이 이만큼 쌓이면 첫 사전을 학습
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transcripts (
+    video_id     TEXT PRIMARY KEY,
+    hash         TEXT NOT NULL,
+    dict_id      TEXT,
+    chars        INTEGER NOT NULL,
+    stored_bytes INTEGER NOT NULL,
+    chunks       TEXT NOT NULL,
+    created_at   REAL NOT NULL,
+    last_access  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_transcripts_hash ON transcripts (hash);
+CREATE INDEX IF NOT EXISTS idx_transcripts_access ON transcripts (last_access);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def train_dictionary(samples: Iterable[str], size: int = DICT_SIZE) -> bytes:
+    """
+    Build a zlib preset dictionary from sample transcripts.
+    Frequent words and word pairs are scored by (count x byte length);
+    the most valuable ones go last because zlib prefers short distances.
+    """
+    counts: Counter = Counter()
+    for text in samples:
+        words = re.findall(r'\S+', text)
+        counts.update(words)
+        counts.update(f'{a} {b}' for a, b in zip(words, words[1:]))
+
+    scored = sorted(
+        ((n * len(term.encode('utf-8')), term) for term, n in counts.items() if n > 1),
+        reverse=True,
+    )
+    picked, total = [], 0
+    for _, term in scored:
+        encoded = term.encode('utf-8') + b' '
+        if total + len(encoded) > size:
+            continue
+        picked.append(encoded)
+        total += len(encoded)
+    return b''.join(reversed(picked))
+
+
+class TranscriptStore:
+    """
+    Compressed, deduplicated transcript archive.
+    The SQLite connection is opened lazily and must be used from a single thread.
+    """
+
+    def __init__(self, root: Path = TRANSCRIPT_STORE_DIR, max_bytes: int = DEFAULT_MAX_BYTES,
+                 max_entries: Optional[int] = None, train_after: Optional[int] = TRAIN_AFTER):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.train_after = train_after
+        self._conn: Optional[sqlite3.Connection] = None
+        self._dicts: dict[str, bytes] = {}
+        self._usage: Optional[list[int]] = None   # [블롭 총 바이트, 항목 수] — prune()이 매번 집계하지 않도록
+
+    # ── 내부 유틸 ──
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.root.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.root / 'index.db'))
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / 'objects' / digest[:2] / f'{digest}.z'
+
+    def _dictionary(self, dict_id: Optional[str]) -> bytes:
+        if not dict_id:
+            return b''
+        if dict_id not in self._dicts:
+            self._dicts[dict_id] = (self.root / 'dicts' / f'{dict_id}.bin').read_bytes()
+        return self._dicts[dict_id]
+
+    def _current_dict_id(self) -> Optional[str]:
+        row = self._db().execute("SELECT value FROM meta WHERE key = 'dict_id'").fetchone()
+        return row[0] if row else None
+
+    def _usage_totals(self) -> list[int]:
+        """Running [stored bytes, entries], counted once per process and kept up to date by put/delete"""
+        if self._usage is None:
+            # 블롭 공유(hash 중복)는 한 번만 계산
+            total = self._db().execute(
+                "SELECT COALESCE(SUM(stored_bytes), 0) FROM "
+                "(SELECT MAX(stored_bytes) AS stored_bytes FROM transcripts GROUP BY hash)"
+            ).fetchone()[0]
+            entries = self._db().execute("SELECT COUNT(*) FROM transcripts").fetchone()[0]
+            self._usage = [total, entries]
+        return self._usage
+
+    def _row(self, video_id: str):
+        return self._db().execute(
+            "SELECT hash, dict_id, chars, chunks FROM transcripts WHERE video_id = ?", (video_id,)
+        ).fetchone()
+
+    def _touch(self, video_id: str):
+        db = self._db()
+        with db:
+            db.execute("UPDATE transcripts SET last_access = ? WHERE video_id = ?", (time.time(), video_id))
+
+    def _read_all(self, video_id: str) -> str:
+        """Whole transcript without updating last_access"""
+        digest, dict_id, _, chunks_json = self._row(video_id)
+        chunks = json.loads(chunks_json)
+        return ''.join(self._read_chunks(digest, dict_id, chunks, range(len(chunks))))
+
+    def _read_chunks(self, digest: str, dict_id: Optional[str], chunks: list, indexes: range) -> list[str]:
+        """Inflate only the chunks in indexes (ascending)"""
+        zdict = self._dictionary(dict_id)
+        offsets = [0]
+        for clen, _ in chunks:
+            offsets.append(offsets[-1] + clen)
+        texts = []
+        with open(self._object_path(digest), 'rb') as f:
+            for i in indexes:
+                f.seek(offsets[i])
+                raw = f.read(chunks[i][0])
+                inflater = zlib.decompressobj(zdict=zdict) if zdict else zlib.decompressobj()
+                texts.append(inflater.decompress(raw).decode('utf-8'))
+        return texts
+
+    # ── 공개 API ──
+
+    def __contains__(self, video_id: str) -> bool:
+        return self._row(video_id) is not None
+
+    def info(self, video_id: str) -> Optional[dict]:
+        """Metadata (hash, chars, chunk count) without touching the blob"""
+        row = self._row(video_id)
+        if row is None:
+            return None
+        digest, dict_id, chars, chunks = row
+        return {'hash': digest, 'dict_id': dict_id, 'chars': chars, 'chunks': len(json.loads(chunks))}
+
+    def put(self, video_id: str, text: str) -> str:
+        """Store text for video_id and return its content hash"""
+        digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        db = self._db()
+        now = time.time()
+
+        usage = self._usage_totals()
+        existing = db.execute(
+            "SELECT dict_id, chars, stored_bytes, chunks FROM transcripts WHERE hash = ? LIMIT 1", (digest,)
+        ).fetchone()
+        if existing and self._object_path(digest).exists():
+            # 같은 내용이 이미 있으면 블롭을 공유
+            dict_id, chars, stored_bytes, chunks_json = existing
+        else:
+            dict_id = self._current_dict_id()
+            zdict = self._dictionary(dict_id)
+            blobs, chunks = [], []
+            for start in range(0, len(text), CHUNK_CHARS):
+                piece = text[start:start + CHUNK_CHARS]
+                deflater = zlib.compressobj(9, zdict=zdict) if zdict else zlib.compressobj(9)
+                blob = deflater.compress(piece.encode('utf-8')) + deflater.flush()
+                blobs.append(blob)
+                chunks.append([len(blob), len(piece)])
+            path = self._object_path(digest)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(b''.join(blobs))
+            os.replace(tmp_path, path)
+            chars, stored_bytes, chunks_json = len(text), sum(len(b) for b in blobs), json.dumps(chunks)
+            if existing is None:
+                usage[0] += stored_bytes
+
+        old = db.execute(
+            "SELECT hash, stored_bytes FROM transcripts WHERE video_id = ?", (video_id,)
+        ).fetchone()
+        with db:
+            db.execute(
+                "INSERT OR REPLACE INTO transcripts "
+                "(video_id, hash, dict_id, chars, stored_bytes, chunks, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (video_id, digest, dict_id, chars, stored_bytes, chunks_json, now, now),
+            )
+        if old is None:
+            usage[1] += 1
+        elif old[0] != digest:
+            usage[0] -= self._drop_blob_if_unused(old[0], old[1])
+        self.prune()
+        if self.train_after and usage[1] >= self.train_after and self._current_dict_id() is None:
+            print(f"  🗜️ 자막 {usage[1]}개 저장됨 — 압축 사전 학습")
+            self.train(sample_count=self.train_after)
+        return digest
+
+    def get(self, video_id: str) -> Optional[str]:
+        row = self._row(video_id)
+        if row is None:
+            return None
+        digest, dict_id, _, chunks_json = row
+        chunks = json.loads(chunks_json)
+        self._touch(video_id)
+        return ''.join(self._read_chunks(digest, dict_id, chunks, range(len(chunks))))
+
+    def head(self, video_id: str, n_chars: int) -> Optional[str]:
+        """First n_chars characters, inflating only the leading chunks"""
+        row = self._row(video_id)
+        if row is None:
+            return None
+        digest, dict_id, _, chunks_json = row
+        chunks = json.loads(chunks_json)
+        count, needed = 0, 0
+        while needed < len(chunks) and count < n_chars:
+            count += chunks[needed][1]
+            needed += 1
+        self._touch(video_id)
+        return ''.join(self._read_chunks(digest, dict_id, chunks, range(needed)))[:n_chars]
+
+    def tail(self, video_id: str, n_chars: int) -> Optional[str]:
+        """Last n_chars characters, inflating only the trailing chunks"""
+        row = self._row(video_id)
+        if row is None:
+            return None
+        digest, dict_id, _, chunks_json = row
+        chunks = json.loads(chunks_json)
+        if n_chars <= 0:
+            return ''
+        count, first = 0, len(chunks)
+        while first > 0 and count < n_chars:
+            first -= 1
+            count += chunks[first][1]
+        self._touch(video_id)
+        return ''.join(self._read_chunks(digest, dict_id, chunks, range(first, len(chunks))))[-n_chars:]
+
+    def delete(self, video_id: str):
+        db = self._db()
+        row = db.execute("SELECT hash, stored_bytes FROM transcripts WHERE video_id = ?", (video_id,)).fetchone()
+        if row is None:
+            return
+        usage = self._usage_totals()
+        with db:
+            db.execute("DELETE FROM transcripts WHERE video_id = ?", (video_id,))
+        usage[1] -= 1
+        usage[0] -= self._drop_blob_if_unused(*row)
+
+    def _drop_blob_if_unused(self, digest: str, stored_bytes: int) -> int:
+        """Remove the blob if no transcript refers to it; returns the bytes freed"""
+        in_use = self._db().execute("SELECT 1 FROM transcripts WHERE hash = ? LIMIT 1", (digest,)).fetchone()
+        if in_use:
+            return 0
+        try:
+            self._object_path(digest).unlink()
+        except FileNotFoundError:
+            pass
+        return stored_bytes
+
+    def prune(self) -> int:
+        """Evict least recently accessed transcripts until within limits"""
+        usage = self._usage_totals()
+
+        def over() -> bool:
+            return usage[0] > self.max_bytes or (self.max_entries is not None and usage[1] > self.max_entries)
+
+        if not over():
+            return 0
+        evicted = 0
+        for (video_id,) in self._db().execute("SELECT video_id FROM transcripts ORDER BY last_access").fetchall():
+            if not over():
+                break
+            self.delete(video_id)
+            evicted += 1
+        return evicted
+
+    def train(self, samples: Optional[Iterable[str]] = None, sample_count: int = 200) -> str:
+        """
+        Train a new preset dictionary and use it for future writes.
+        Defaults to the most recently stored transcripts as samples.
+        Existing blobs keep the dictionary they were written with.
+        """
+        if samples is None:
+            ids = [r[0] for r in self._db().execute(
+                "SELECT video_id FROM transcripts ORDER BY created_at DESC LIMIT ?", (sample_count,)
+            )]
+            samples = [self._read_all(video_id) for video_id in ids]
+        zdict = train_dictionary(samples)
+        dict_id = hashlib.sha256(zdict).hexdigest()[:16]
+        path = self.root / 'dicts' / f'{dict_id}.bin'
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(zdict)
+        self._dicts[dict_id] = zdict
+        db = self._db()
+        with db:
+            db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('dict_id', ?)", (dict_id,))
+        return dict_id
+
+    def stats(self) -> dict:
+        entries, chars, stored = self._db().execute(
+            "SELECT COUNT(*), COALESCE(SUM(chars), 0), COALESCE(SUM(stored_bytes), 0) FROM transcripts"
+        ).fetchone()
+        return {'entries': entries, 'chars': chars, 'stored_bytes': stored, 'dict_id': self._current_dict_id()}
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        self._usage = None
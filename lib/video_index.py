@@ -0,0 +1,125 @@
+"""
+Seen-video index for incremental research
+SQLite table of processed video_ids with a per-channel high-water mark
+"""
+
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .config import VIDEO_INDEX_DB
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS videos (
+    video_id   TEXT PRIMARY KEY,
+    channel_id TEXT NOT NULL,
+    title      TEXT,
+    url        TEXT,
+    published  TEXT NOT NULL,
+    seen_at    TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_videos_channel ON videos (channel_id, published);
+CREATE TABLE IF NOT EXISTS channels (
+    channel_id TEXT PRIMARY KEY,
+    watermark  TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS polls (
+    handle    TEXT PRIMARY KEY,
+    polled_at TEXT NOT NULL
+);
+"""
+
+
+class VideoIndex:
+    """
+    Records which videos have been processed.
+    The connection is opened lazily and must be used from a single thread.
+    """
+
+    def __init__(self, path: Path = VIDEO_INDEX_DB):
+        self.path = Path(path)
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path))
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def watermarks(self) -> dict[str, datetime]:
+        """channel_id -> published time of the newest processed video"""
+        rows = self._db().execute("SELECT channel_id, watermark FROM channels")
+        return {cid: datetime.fromisoformat(mark) for cid, mark in rows}
+
+    def unseen(self, video_ids: Iterable[str]) -> set[str]:
+        """Return the subset of video_ids that are not in the index"""
+        ids = set(video_ids)
+        if not ids:
+            return set()
+        db = self._db()
+        seen = set()
+        id_list = list(ids)
+        # SQLite 바인딩 변수 개수 제한을 피하기 위해 나눠서 조회
+        for i in range(0, len(id_list), 500):
+            chunk = id_list[i:i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = db.execute(f"SELECT video_id FROM videos WHERE video_id IN ({placeholders})", chunk)
+            seen.update(row[0] for row in rows)
+        return ids - seen
+
+    def mark_seen(self, videos: list[dict]):
+        """
+        Record videos (research_agent dicts with video_id, channel_id, published)
+        and advance each channel's watermark.
+        """
+        if not videos:
+            return
+        now = datetime.now(timezone.utc).isoformat()
+        db = self._db()
+        with db:
+            db.executemany(
+                "INSERT OR IGNORE INTO videos (video_id, channel_id, title, url, published, seen_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(v["video_id"], v["channel_id"], v.get("title"), v.get("url"), v["published"], now)
+                 for v in videos],
+            )
+            db.executemany(
+                "INSERT INTO channels (channel_id, watermark) VALUES (?, ?) "
+                "ON CONFLICT(channel_id) DO UPDATE SET watermark = max(watermark, excluded.watermark)",
+                [(v["channel_id"], v["published"]) for v in videos],
+            )
+
+    def processed_since(self, since: datetime) -> list[dict]:
+        """Processed videos published at or after since, oldest first"""
+        # seen_at >= published 이므로 seen_at으로 먼저 좁힌 뒤 게시 시각으로 거른다
+        rows = self._db().execute(
+            "SELECT video_id, channel_id, title, url, published FROM videos WHERE seen_at >= ?",
+            (since.isoformat(),),
+        )
+        videos = [
+            {"video_id": vid, "channel_id": cid, "title": title, "url": url, "published": published}
+            for vid, cid, title, url, published in rows
+            if datetime.fromisoformat(published) >= since
+        ]
+        return sorted(videos, key=lambda v: datetime.fromisoformat(v["published"]))
+
+    def last_polled(self) -> dict[str, datetime]:
+        """handle -> last time its feed was fetched in incremental mode"""
+        rows = self._db().execute("SELECT handle, polled_at FROM polls")
+        return {handle: datetime.fromisoformat(at) for handle, at in rows}
+
+    def mark_polled(self, handles: Iterable[str], when: Optional[datetime] = None):
+        at = (when or datetime.now(timezone.utc)).isoformat()
+        db = self._db()
+        with db:
+            db.executemany(
+                "INSERT OR REPLACE INTO polls (handle, polled_at) VALUES (?, ?)",
+                [(handle.lower(), at) for handle in handles],
+            )
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,151 @@
+"""
+Condition-driven waits for NotebookLM automation
+Each wait blocks on an explicit readiness signal (element state, URL change,
+focus) with a deadline instead of sleeping a fixed time, and
+WaitTracker records how long it took next to the sleep it replaced
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+from patchright.sync_api import Error as PlaywrightError
+from patchright.sync_api import Page
+
+# 홈 화면(노트북 목록)과 노트북 화면이 그려졌다고 볼 수 있는 요소
+HOME_READY = ['project-grid', 'welcome-page', '.create-new-button', '.create-new-action-button']
+NOTEBOOK_READY = ['notebook-header', 'query-box', 'source-picker']
+OVERLAY_BACKDROP = '.cdk-overlay-backdrop'
+MENU_PANEL = '[role="menu"]'
+DIALOG = 'mat-dialog-container, [role="dialog"]'
+SOURCES_DIALOG = '.cdk-overlay-pane:has(add-sources-dialog)'
+SOURCES_DIALOG_ERROR = '.cdk-overlay-pane :text("오류"), .cdk-overlay-pane :text("Error")'
+STUDIO_PANEL = 'studio-panel'
+# 오디오 개요 진입 후: 맞춤설정 대화상자가 뜨거나 바로 생성이 시작됨 (AudioWatcher의 '생성 중' 표시와 같은 기준)
+AUDIO_ENTRY_OPENED = [DIALOG, '.audio-generating', '[aria-label*="생성 중"]', '[aria-label*="Generating"]']
+
+_READY_JS = """
+(selectors) => location.hostname.startsWith('accounts.')
+    || selectors.some(s => document.querySelector(s) !== null)
+"""
+
+
+def wait_for_page_ready(page: Page, selectors: list[str], timeout: int = 10000) -> bool:
+    """True once any selector is in the DOM (or we were sent to the login page)"""
+    try:
+        page.wait_for_function(_READY_JS, arg=selectors, timeout=timeout)
+        return True
+    except PlaywrightError:
+        return False
+
+
+_DIALOG_SETTLED_JS = """
+(pane) => {
+    const el = document.querySelector(pane);
+    return !el || /오류|Error/.test(el.innerText);
+}
+"""
+
+
+def wait_for_dialog_settled(page: Page, pane: str, timeout: int = 3000) -> bool:
+    """True once the dialog pane is gone or shows an error message"""
+    try:
+        page.wait_for_function(_DIALOG_SETTLED_JS, arg=pane, timeout=timeout)
+        return True
+    except PlaywrightError:
+        return False
+
+
+def wait_for_url_change(page: Page, old_url: str, timeout: int = 10000) -> bool:
+    try:
+        page.wait_for_url(lambda url: url != old_url, timeout=timeout)
+        return True
+    except PlaywrightError:
+        return False
+
+
+def wait_for_hidden(page: Page, selector: str, timeout: int = 3000) -> bool:
+    """True once selector is hidden or detached (immediately if it never existed)"""
+    try:
+        page.locator(selector).first.wait_for(state='hidden', timeout=timeout)
+        return True
+    except PlaywrightError:
+        return False
+
+
+def wait_for_visible(page: Page, selector: str, timeout: int = 3000) -> bool:
+    try:
+        page.locator(selector).first.wait_for(state='visible', timeout=timeout)
+        return True
+    except PlaywrightError:
+        return False
+
+
+def wait_for_blur(page: Page, element, timeout: int = 2000) -> bool:
+    """True once element no longer has focus (e.g. an inline rename was committed)"""
+    try:
+        page.wait_for_function('(el) => document.activeElement !== el', arg=element, timeout=timeout)
+        return True
+    except PlaywrightError:
+        return False
+
+
+class WaitTracker:
+    """
+    Per-run log of condition waits vs. the fixed sleeps they replaced.
+    Each record is (step, baseline_s, actual_s, ok). Records are kept per
+    thread, so agents running side by side in worker threads do not reset
+    or report each other's waits.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    @property
+    def records(self) -> list[tuple[str, float, float, bool]]:
+        if not hasattr(self._local, 'records'):
+            self._local.records = []
+        return self._local.records
+
+    def reset(self):
+        self.records.clear()
+
+    @contextmanager
+    def track(self, step: str, baseline: float):
+        """
+        Time the block; the caller may set outcome['ok'] or outcome['baseline']
+        (when the old sleep depended on how long the wait turned out to be)
+        """
+        outcome = {'ok': True, 'baseline': baseline}
+        started = time.monotonic()
+        try:
+            yield outcome
+        finally:
+            self.records.append((step, outcome['baseline'], time.monotonic() - started, outcome['ok']))
+
+    def skipped(self, step: str, baseline: float):
+        """A sleep removed outright because the next step already waits on its own condition"""
+        self.records.append((step, baseline, 0.0, True))
+
+    def totals(self) -> tuple[float, float]:
+        baseline = sum(r[1] for r in self.records)
+        actual = sum(r[2] for r in self.records)
+        return baseline, actual
+
+    def report(self) -> str:
+        if not self.records:
+            return '(대기 기록 없음)'
+        summary: dict[str, list] = {}
+        for step, baseline, actual, ok in self.records:
+            row = summary.setdefault(step, [0, 0.0, 0.0, 0])
+            row[0] += 1
+            row[1] += baseline
+            row[2] += actual
+            row[3] += 0 if ok else 1
+        lines = [f"  {'step':<34} {'횟수':>4} {'기존':>7} {'실제':>7} {'절감':>7}"]
+        for step, (count, baseline, actual, misses) in summary.items():
+            flag = f'  ⚠️ 타임아웃 {misses}회' if misses else ''
+            lines.append(f"  {step:<34} {count:>4} {baseline:>6.1f}s {actual:>6.1f}s {baseline - actual:>6.1f}s{flag}")
+        baseline, actual = self.totals()
+        lines.append(f"  {'합계':<34} {len(self.records):>4} {baseline:>6.1f}s {actual:>6.1f}s {baseline - actual:>6.1f}s")
+        return '\n'.join(lines)
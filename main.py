@@ -9,10 +9,12 @@ Podcast Agent - 메인 오케스트레이터
     python main.py --now         # 즉시 1회 실행
     python main.py --loop        # 매일 06:00에 반복 실행
     python main.py --visible     # 브라우저를 표시하며 실행 (디버깅용)
+    python main.py --now --per-group   # 채널 그룹별 노트북을 동시에 생성
 """
 
 import sys
 import time
+import asyncio
 import json
 import argparse
 import os
@@ -35,6 +37,8 @@ except ImportError:
 sys.path.insert(0, str(Path(__file__).parent))
 import research_agent
 from notebooklm_agent import NotebookLMAgent
+from notebooklm_async import AsyncNotebookLMAgent, DEFAULT_CONCURRENCY
+from lib.browser_service import BrowserService
 from gmail_notifier import send_gmail_notification
 
 # 스케줄 시간 설정 (24시간 형식)
@@ -42,26 +46,35 @@ SCHEDULE_HOUR = 6
 SCHEDULE_MINUTE = 0
 
 
-def run_once(headless: bool = True):
-    """단일 실행: 영상 URL 수집 → NotebookLM 오디오 개요 생성"""
+def run_once(headless: bool = True, browser_service: BrowserService | None = None, sync: bool = False,
+             download_audio: bool = False):
+    """
+    단일 실행: 영상 URL 수집 → NotebookLM 오디오 개요 생성
+    browser_service가 주어지면 매번 브라우저를 새로 띄우지 않고 웜 브라우저를 재사용한다.
+    sync=True면 노트북을 재생성하지 않고 소스 차이만 반영한다.
+    download_audio=True면 오디오 생성까지 트리거하고 완료된 파일을 data/audio에 저장한다.
+    """
     print(f"\n{'=' * 60}")
     print(f"🎙️ 팟캐스트 에이전트 — NotebookLM 오디오 개요 자동 생성")
     print(f"⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"{'=' * 60}\n")
 
     # ── Phase 1: Research ──
-    print("📡 [Phase 1] Research Agent — 최근 영상 URL 수집")
+    print("📡 [Phase 1] Research Agent — 새 영상 URL 수집 (이미 처리한 영상 제외)")
     try:
-        videos = research_agent.get_recent_video_urls()
+        videos = research_agent.get_recent_video_urls(incremental=True)
     except Exception as e:
         print(f"❌ Research Agent 실패: {e}")
         return False
 
     if not videos:
-        print("ℹ️ 최근 24시간 내 새 영상이 없습니다.")
+        print("ℹ️ 처리하지 않은 새 영상이 없습니다.")
         print("워크플로우 완료 (팟캐스트 생성 생략)")
         return True
 
+    # 동기화 모드는 노트북에 남길 영상 전체를 넘긴다 (새 영상만 넘기면 기존 소스가 모두 삭제됨)
+    targets = research_agent.sync_targets(videos) if sync else videos
+
     print(f"\n📊 수집 결과: {len(videos)}개 영상")
     for v in videos:
         print(f"  📹 [{v.get('channel', '')}] {v['title']}")
@@ -71,39 +84,57 @@ def run_once(headless: bool = True):
     with open(output_dir / "recent_videos.json", "w", encoding="utf-8") as f:
         json.dump(videos, f, indent=2, ensure_ascii=False)
 
-    video_urls = [v["url"] for v in videos]
+    video_urls = [v["url"] for v in targets]
 
     # ── Phase 2: NotebookLM ──
     print(f"\n🎙️ [Phase 2] NotebookLM Agent — 소스 추가 + 오디오 개요 생성")
     agent = NotebookLMAgent(
         notebook_name="Daily new",
         headless=headless,
+        browser_service=browser_service,
     )
 
     # 전체 워크플로우 실행
     # (노트북 재생성 -> 소스 추가 -> 오디오 생성 준비)
-    result = agent.run(video_urls)
+    result = agent.run(video_urls, titles={v["url"]: v["title"] for v in targets}, sync=sync,
+                       download_audio=download_audio)
 
     # ── 결과 보고 ──
     print(f"\n{'=' * 60}")
     
     # 이메일 본문 생성
-    video_list_str = "\n".join([f"- {v['title']} ({v['channel']})" for v in videos])
+    failed_urls = set(result.get("failed_urls", []))
+    video_list_str = "\n".join([
+        f"- {v['title']} ({v['channel']})" + (" ❌ 추가 실패" if v["url"] in failed_urls else "")
+        for v in videos
+    ])
     
     if result["success"]:
         print(f"✅ 팟캐스트 준비 완료!")
         print(f"📎 소스 추가: {result['sources_added']}/{len(video_urls)}개")
-        print(f"🎙️ 오디오 개요: {'준비 완료 (브라우저 확인 필요)' if result['audio_generated'] else '실패'}")
+        audio_file = result.get("audio_file")
+        if audio_file:
+            print(f"🎙️ 오디오 개요: 생성 완료 → {audio_file['path']}")
+        else:
+            print(f"🎙️ 오디오 개요: {'준비 완료 (브라우저 확인 필요)' if result['audio_generated'] else '실패'}")
         print(f"🔗 노트북: {result.get('notebook_url', 'N/A')}")
         
         # Gmail 알림 (성공)
-        subject = f"NotebookLM 소스 추가 완료 ({len(video_urls)}개)"
+        subject = f"NotebookLM 소스 추가 완료 ({result['sources_added']}/{len(video_urls)}개)"
+        next_step = (
+            f"🎧 오디오 파일: {audio_file['path']} (sha256 {audio_file['sha256']})" if audio_file
+            else "👉 NotebookLM에 접속하여 '생성' 버튼을 눌러주세요."
+        )
         body = (
-             f"✅ [성공] 총 {len(video_urls)}개의 영상 소스가 추가되었습니다.\n\n"
+             f"✅ [성공] 총 {len(video_urls)}개 중 {result['sources_added']}개의 영상 소스가 추가되었습니다.\n\n"
              f"<영상 목록>\n{video_list_str}\n\n"
-             f"👉 NotebookLM에 접속하여 '생성' 버튼을 눌러주세요."
+             f"{next_step}"
         )
         send_gmail_notification(subject, body, success=True)
+
+        # 처리 완료 기록 — 다음 실행부터 이 영상들은 수집 대상에서 제외
+        # (추가에 실패한 영상은 다음 실행에서 다시 시도)
+        research_agent.mark_processed([v for v in videos if v["url"] not in failed_urls])
         
     else:
         print(f"⚠️ 팟캐스트 준비 실패")
@@ -129,11 +160,90 @@ def run_once(headless: bool = True):
     return result["success"]
 
 
-def run_loop(headless: bool = True):
+def run_per_group(headless: bool = True, concurrency: int = DEFAULT_CONCURRENCY,
+                  download_audio: bool = False):
+    """
+    채널 그룹(channels.toml의 group)마다 노트북 하나씩 ("Daily <group>")
+    AsyncNotebookLMAgent로 동시에 생성한다.
+    """
+    print(f"\n{'=' * 60}")
+    print("🎙️ 팟캐스트 에이전트 — 그룹별 노트북 동시 생성")
+    print(f"⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"{'=' * 60}\n")
+
+    print("📡 [Phase 1] Research Agent — 새 영상 URL 수집 (이미 처리한 영상 제외)")
+    try:
+        videos = research_agent.get_recent_video_urls(incremental=True)
+    except Exception as e:
+        print(f"❌ Research Agent 실패: {e}")
+        return False
+
+    if not videos:
+        print("ℹ️ 처리하지 않은 새 영상이 없습니다.")
+        return True
+
+    by_group: dict[str, list[dict]] = {}
+    for v in videos:
+        by_group.setdefault(v.get("group", "default"), []).append(v)
+    jobs = [
+        {
+            "notebook_name": f"Daily {group}",
+            "video_urls": [v["url"] for v in group_videos],
+            "titles": {v["url"]: v["title"] for v in group_videos},
+            "download_audio": download_audio,
+        }
+        for group, group_videos in sorted(by_group.items())
+    ]
+    print(f"\n📊 수집 결과: {len(videos)}개 영상, {len(jobs)}개 그룹")
+
+    print(f"\n🎙️ [Phase 2] NotebookLM — 노트북 {len(jobs)}개 동시 처리")
+    agent = AsyncNotebookLMAgent(headless=headless, max_concurrency=concurrency)
+    results = asyncio.run(agent.run_many(jobs))
+
+    print(f"\n{'=' * 60}")
+    lines = []
+    for job, result in zip(jobs, results):
+        mark = "✅" if result["success"] else "⚠️"
+        line = f"{mark} {result['notebook_name']}: 소스 {result['sources_added']}/{len(job['video_urls'])}개"
+        print(line)
+        lines.append(line)
+    print(f"{'=' * 60}")
+
+    # 성공한 그룹의, 추가에 성공한 영상만 처리 완료로 기록
+    processed = []
+    for (group, group_videos), result in zip(sorted(by_group.items()), results):
+        if result["success"]:
+            failed = set(result["failed_urls"])
+            processed.extend(v for v in group_videos if v["url"] not in failed)
+    research_agent.mark_processed(processed)
+
+    success = all(r["success"] for r in results)
+    subject = f"NotebookLM 그룹별 노트북 {'완료' if success else '일부 실패'} ({len(jobs)}개)"
+    send_gmail_notification(subject, "\n".join(lines), success=success)
+
+    result_path = Path(__file__).parent / f"result_{datetime.now().strftime('%Y%m%d')}.json"
+    with open(result_path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+
+    return success
+
+
+def run_loop(headless: bool = True, sync: bool = False, download_audio: bool = False):
     """매일 06:00에 반복 실행"""
     print(f"🔄 팟캐스트 에이전트 — 매일 {SCHEDULE_HOUR:02d}:{SCHEDULE_MINUTE:02d} 자동 실행 모드")
     print(f"   종료: Ctrl+C\n")
 
+    # 브라우저는 루프 시작 시 한 번 띄워 두고 실행마다 재사용 (콜드 스타트를 06:00 경로에서 제거)
+    browser_service = BrowserService(headless=headless)
+    browser_service.start()
+    try:
+        _loop_forever(headless, browser_service, sync, download_audio)
+    finally:
+        browser_service.stop()
+
+
+def _loop_forever(headless: bool, browser_service: BrowserService, sync: bool = False,
+                  download_audio: bool = False):
     while True:
         now = datetime.now()
 
@@ -147,13 +257,17 @@ def run_loop(headless: bool = True):
 
         print(f"⏳ 다음 실행: {target.strftime('%Y-%m-%d %H:%M')} ({wait_hours:.1f}시간 후)")
 
-        # 대기 (1분 단위 체크)
+        # 대기 (1분 단위 체크) — 그 사이 channels.toml이 바뀌면 다시 읽고,
+        # 브라우저가 죽었으면 실행 전에 미리 다시 띄운다
         while datetime.now() < target:
             time.sleep(60)
+            research_agent.REGISTRY.reload_if_changed()
+            browser_service.keep_warm()
 
         # 실행
         try:
-            success = run_once(headless=headless)
+            success = run_once(headless=headless, browser_service=browser_service, sync=sync,
+                               download_audio=download_audio)
             status = "성공 ✅" if success else "실패 ⚠️"
             print(f"{datetime.now().strftime('%Y-%m-%d')} 실행 {status}")
         except Exception as e:
@@ -167,16 +281,23 @@ if __name__ == "__main__":
     parser.add_argument("--now", action="store_true", help="즉시 1회 실행")
     parser.add_argument("--loop", action="store_true", help=f"매일 {SCHEDULE_HOUR:02d}:{SCHEDULE_MINUTE:02d}에 반복 실행")
     parser.add_argument("--visible", action="store_true", help="브라우저를 표시하며 실행 (디버깅)")
+    parser.add_argument("--per-group", action="store_true", help="채널 그룹별 노트북을 동시에 생성")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="동시에 처리할 노트북 수 (--per-group)")
+    parser.add_argument("--sync", action="store_true", help="노트북을 재생성하지 않고 바뀐 소스만 삭제/추가")
+    parser.add_argument("--download-audio", action="store_true", help="오디오 개요 생성까지 실행하고 MP3를 data/audio에 저장")
     args = parser.parse_args()
 
     headless = not args.visible
 
-    if args.now:
-        success = run_once(headless=headless)
+    if args.now and args.per_group:
+        success = run_per_group(headless=headless, concurrency=args.concurrency, download_audio=args.download_audio)
+        sys.exit(0 if success else 1)
+    elif args.now:
+        success = run_once(headless=headless, sync=args.sync, download_audio=args.download_audio)
         sys.exit(0 if success else 1)
     elif args.loop:
         try:
-            run_loop(headless=headless)
+            run_loop(headless=headless, sync=args.sync, download_audio=args.download_audio)
         except KeyboardInterrupt:
             print("\n🛑 에이전트 종료")
     else:
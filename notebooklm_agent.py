@@ -36,8 +36,24 @@ if sys.platform == "win32":
 # (GitHub Actions 호환성을 위해 로컬 lib 사용)
 sys.path.insert(0, str(Path(__file__).parent))
 
-from lib.browser_utils import BrowserFactory, StealthUtils
-from lib.config import BROWSER_PROFILE_DIR, STATE_FILE
+from lib.audio_watcher import AudioWatcher
+from lib.browser_service import BrowserService
+from lib.browser_utils import BrowserFactory, clear_profile_locks
+from lib.config import (
+    AUDIO_DIR, BROWSER_PROFILE_DIR, NOTEBOOK_SOURCE_LIMIT, SOURCE_CHUNK_SIZE, SOURCE_CHUNK_TIMEOUT, SOURCE_PIPELINE_DEPTH,
+    STATE_FILE,
+)
+from lib.debug_snapshots import get_store
+from lib.dom_query import find_first, scan
+from lib.notebook_sync import NotebookManifest, SyncPlan, plan_sync, read_sources, row_title
+from lib.request_blocker import RequestBlocker
+from lib.source_batches import chunked, spillover_name, split_for_capacity
+from lib.selector_registry import SelectorRegistry
+from lib.source_tracker import SourceTracker
+from lib.wait_conditions import (
+    AUDIO_ENTRY_OPENED, DIALOG, HOME_READY, MENU_PANEL, NOTEBOOK_READY, OVERLAY_BACKDROP, SOURCES_DIALOG, SOURCES_DIALOG_ERROR, STUDIO_PANEL,
+    WaitTracker, wait_for_blur, wait_for_dialog_settled, wait_for_hidden, wait_for_page_ready, wait_for_url_change, wait_for_visible,
+)
 from patchright.sync_api import Page, BrowserContext, sync_playwright
 
 # ──────────────────────────────────────────────
@@ -48,16 +64,21 @@ from patchright.sync_api import Page, BrowserContext, sync_playwright
 SELECTORS = {
     # 소스 추가 관련
     "add_source_btn": [
-        'button:has-text("소스 추가")',
-        'button:has-text("Add source")',
-        'button:has-text("소스")',
         '[aria-label="소스 추가"]',
         '[aria-label="Add source"]',
+        'button:has-text("소스 추가")',
+        'button:has-text("Add source")',
+        # 노트북 내부의 add 아이콘 버튼
+        'button[aria-label="노트북 만들기"]',
+        'button:has(mat-icon:text("add"))',
     ],
     "website_option": [
         'text=웹사이트',
         'text=Website',
+        'text=웹사이트 URL',
+        'text=Website URL',
         '[data-value="WEBSITE"]',
+        'text=YouTube',
     ],
     "url_input": [
         'input[type="url"]',
@@ -67,13 +88,86 @@ SELECTORS = {
         'input[placeholder*="웹"]',
         'textarea',
     ],
+    "url_textarea": [
+        # 가장 정확한 셀렉터
+        'textarea[formcontrolname="urls"]',
+        'textarea[aria-label="URL 입력"]',
+        'textarea[placeholder="링크를 붙여넣으세요."]',
+        'textarea[placeholder*="붙여넣"]',
+        'textarea[placeholder*="paste"]',
+        'textarea[placeholder*="Paste"]',
+        'textarea[placeholder*="link"]',
+        'textarea[placeholder*="Link"]',
+        # 모달 내 textarea
+        '.cdk-overlay-pane textarea',
+        'mat-dialog-container textarea',
+        'add-sources-dialog textarea',
+        # 일반 폴백
+        'textarea.mat-mdc-input-element',
+        'textarea[matinput]',
+    ],
     "insert_btn": [
         'button:has-text("삽입")',
         'button:has-text("Insert")',
         'button:has-text("제출")',
         'button:has-text("Submit")',
+        'button:has-text("추가")',
+        'button:has-text("Add")',
+        # 모달 내의 primary/accent 버튼
+        '.cdk-overlay-pane button.mat-primary',
+        '.cdk-overlay-pane button.mat-accent',
+        'mat-dialog-container button.mat-primary',
+    ],
+    # 노트북 생성/삭제 관련
+    "create_notebook_btn": [
+        '.create-new-action-button',
+        '.create-new-button',
+        'button:has-text("새 노트북")',
+        'button:has-text("New notebook")',
+        'button:has-text("새로 만들기")',
+        'button[aria-label="노트북 만들기"]',
+    ],
+    "delete_menu_item": [
+        'text=Delete',
+        'text=삭제',
+        'button:has-text("Delete")',
+        'button:has-text("삭제")',
+    ],
+    "delete_confirm_btn": [
+        'dialog button:has-text("Delete")',
+        'dialog button:has-text("삭제")',
+    ],
+    # 소스 삭제 (동기화 모드) — source_more_btn은 소스 행 안에서만 찾으므로 CSS만 사용
+    "source_more_btn": [
+        '.source-item-more-button',
+        'button[aria-label="More"]',
+        'button[aria-label="더보기"]',
+        'button:has(mat-icon:text("more_vert"))',
+    ],
+    "remove_source_item": [
+        'text=소스 삭제',
+        'text=Remove source',
+        '[role="menuitem"]:has-text("삭제")',
+        '[role="menuitem"]:has-text("Remove")',
+    ],
+    "remove_source_confirm": [
+        'mat-dialog-container button:has-text("삭제")',
+        'mat-dialog-container button:has-text("Delete")',
+        'dialog button:has-text("삭제")',
+        'dialog button:has-text("Delete")',
     ],
     # 오디오 개요 관련
+    "studio_panel_btn": [
+        "button[aria-label='노트북 가이드']",
+        "button[aria-label='Notebook guide']",
+        ".notebook-guide-toggle",
+        "button:has-text('노트북 가이드')",
+        "button[aria-label='스튜디오']",
+    ],
+    "audio_panel_text": [
+        'text=오디오',
+        'text=Audio',
+    ],
     "audio_overview_tab": [
         'text=오디오 개요',
         'text=Audio Overview',
@@ -100,86 +194,139 @@ SELECTORS = {
         'button:has-text("재생")',
         'button:has-text("Play")',
     ],
+    # 오디오 플레이어 메뉴 → 다운로드 (스트리밍 URL을 못 얻었을 때의 대안)
+    "audio_more_btn": [
+        'audio-player button[aria-label*="더보기"]',
+        'audio-player button[aria-label*="More"]',
+        'audio-overview button:has(mat-icon:text("more_vert"))',
+    ],
+    "audio_download_item": [
+        '[role="menuitem"]:has-text("다운로드")',
+        '[role="menuitem"]:has-text("Download")',
+        'text=다운로드',
+        'text=Download',
+    ],
 }
 
 
-def _try_click(page: Page, selectors: list[str], timeout: int = 3000) -> bool:
-    """여러 셀렉터를 시도하여 클릭. 성공 시 True 반환."""
-    for sel in selectors:
-        try:
-            page.click(sel, timeout=timeout)
-            StealthUtils.random_delay(300, 700)
-            return True
-        except Exception:
-            continue
-    return False
+# 후보 셀렉터는 하나씩 timeout을 기다리지 않고, 모두 한 번에 기다린다 (resolve_first).
+# 단계당 최악 대기 시간 = timeout 1회. 여러 개가 동시에 보이면 목록 앞쪽이 우선.
+# step 이름을 주면 SELECTOR_REGISTRY가 UI 언어에 맞지 않는 후보를 빼고 적중 통계를 남긴다
+# (순서는 바꾸지 않는다 — 통계는 리포트와 죽은 셀렉터 정리용).
+SELECTOR_REGISTRY = SelectorRegistry()
 
+# 고정 sleep 대신 준비 조건(요소 상태, URL 변경, 오버레이 닫힘)을 기다린다.
+# WAIT_TRACKER는 실행마다 "기존 sleep 대비 실제 대기"를 기록해 close() 때 출력한다.
+WAIT_TRACKER = WaitTracker()
 
-def _try_fill(page: Page, selectors: list[str], text: str, timeout: int = 3000) -> bool:
-    """여러 셀렉터를 시도하여 텍스트 입력."""
-    for sel in selectors:
-        try:
-            page.fill(sel, text, timeout=timeout)
-            StealthUtils.random_delay(200, 400)
-            return True
-        except Exception:
-            continue
-    return False
+# 홈 화면의 노트북 카드 스캔용 (scan()으로 한 번에 읽는다)
+NOTEBOOK_TITLE_SELECTOR = '.project-button-title, .notebook-title, .title, a[href*="notebook"] .name'
+# 제목 요소 → 카드 컨테이너(앞에서부터 시도) → 카드 안의 메뉴 버튼
+NOTEBOOK_CARD_MENU = (['.project-button-card', 'a', 'div[role="button"]', '.notebook-card'],
+                      '.project-button-more, button[aria-label*="메뉴"], button[aria-label*="option"], '
+                      'button[aria-label*="옵션"], button .mat-icon')
 
+# 동기화 모드: 노트북별로 URL이 어떤 소스 제목으로 들어갔는지 기록 (다음 동기화의 매칭용)
+NOTEBOOK_MANIFEST = NotebookManifest()
 
-def _wait_for_any(page: Page, selectors: list[str], timeout: int = 5000) -> bool:
+
+def _try_click(page: Page, selectors: list[str], timeout: int = 3000, step: Optional[str] = None) -> bool:
+    """여러 셀렉터 중 먼저 나타난 것을 클릭. 성공 시 True 반환."""
+    resolved = SELECTOR_REGISTRY.resolve(page, step, selectors, timeout=timeout)
+    if not resolved:
+        return False
+    locator, _ = resolved
+    try:
+        locator.click(timeout=timeout)
+    except Exception:
+        return False
+    # 클릭 후 random_delay(300, 700)는 다음 단계의 조건 대기가 대신한다
+    WAIT_TRACKER.skipped("click_delay", 0.5)
+    return True
+
+
+def _try_fill(page: Page, selectors: list[str], text: str, timeout: int = 3000,
+              step: Optional[str] = None) -> bool:
+    """여러 셀렉터 중 먼저 나타난 것에 텍스트 입력."""
+    resolved = SELECTOR_REGISTRY.resolve(page, step, selectors, timeout=timeout)
+    if not resolved:
+        return False
+    locator, _ = resolved
+    try:
+        locator.fill(text, timeout=timeout)
+    except Exception:
+        return False
+    WAIT_TRACKER.skipped("fill_delay", 0.3)
+    return True
+
+
+def _wait_for_any(page: Page, selectors: list[str], timeout: int = 5000, step: Optional[str] = None) -> bool:
     """여러 셀렉터 중 하나라도 나타나면 True."""
-    for sel in selectors:
-        try:
-            page.wait_for_selector(sel, timeout=timeout)
-            return True
-        except Exception:
-            continue
-    return False
+    return SELECTOR_REGISTRY.resolve(page, step, selectors, timeout=timeout) is not None
 
 
 class NotebookLMAgent:
     """NotebookLM 오디오 개요(팟캐스트) 자동 생성 에이전트."""
 
-    def __init__(self, notebook_name: str = "Daily new", headless: bool = True):
+    def __init__(self, notebook_name: str = "Daily new", headless: bool = True,
+                 browser_service: Optional[BrowserService] = None, profile_dir: Path = BROWSER_PROFILE_DIR):
         self.notebook_name = notebook_name
         self.headless = headless
+        # 여러 에이전트를 동시에 띄울 때는 프로필 폴더를 따로 써야 한다 (Chromium 프로필 잠금)
+        self.profile_dir = profile_dir
+        # 루프 모드: 실행 사이에 브라우저를 띄워 둔 BrowserService에서 컨텍스트를 빌려 쓴다
+        self.browser_service = browser_service
+        self.blocker: Optional[RequestBlocker] = None
         self.playwright = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self._source_tracker: Optional[SourceTracker] = None
+        self._audio_watcher: Optional[AudioWatcher] = None
+        self.source_status: dict[str, str] = {}
 
     def start(self):
         """브라우저 세션 시작."""
+        if self.browser_service:
+            started = time.monotonic()
+            self.context = self.browser_service.acquire()
+            self.blocker = self.browser_service.blocker
+            self.page = self.context.new_page()
+            WAIT_TRACKER.reset()
+            print(f"🌐 웜 브라우저 사용 ({time.monotonic() - started:.1f}초)")
+            return
+
         print("🌐 브라우저 시작...")
-        
-        # 브라우저 프로필 잠금 파일 정리 (비정상 종료 대비)
-        try:
-            profile_dir = BROWSER_PROFILE_DIR
-            lock_file = profile_dir / "SingletonLock"
-            if lock_file.exists():
-                print(f"  🧹 잠금 파일 삭제: {lock_file}")
-                lock_file.unlink()
-            
-            # 윈도우의 경우 Lockfile도 확인
-            lock_file_w = profile_dir / "Lockfile"
-            if lock_file_w.exists():
-                 print(f"  🧹 잠금 파일 삭제: {lock_file_w}")
-                 lock_file_w.unlink()
-                 
-        except Exception as e:
-            print(f"  ⚠️ 잠금 파일 정리 실패 (무시): {e}")
+        clear_profile_locks(self.profile_dir)
 
+        self.blocker = RequestBlocker.for_session(self.headless)
         self.playwright = sync_playwright().start()
         self.context = BrowserFactory.launch_persistent_context(
             self.playwright,
             headless=self.headless,
-            user_data_dir=str(BROWSER_PROFILE_DIR),
+            user_data_dir=str(self.profile_dir),
+            blocker=self.blocker,
         )
         self.page = self.context.new_page()
+        WAIT_TRACKER.reset()
         print("  ✅ 브라우저 준비 완료")
 
     def close(self):
         """브라우저 세션 종료."""
+        SELECTOR_REGISTRY.save()
+        get_store().flush()
+        if WAIT_TRACKER.records:
+            print("⏱️ 대기 시간 리포트 (고정 sleep 대비)")
+            print(WAIT_TRACKER.report())
+        if self.blocker:
+            print(self.blocker.report())
+            self.blocker.reset()
+        if self.browser_service:
+            # 브라우저는 끄지 않고 서비스에 돌려준다 (페이지 정리/재시작 판단은 서비스가)
+            self.browser_service.release()
+            self.context = None
+            self.page = None
+            print("🔒 브라우저 반납 (웜 상태 유지)")
+            return
         if self.context:
             try:
                 self.context.close()
@@ -197,7 +344,8 @@ class NotebookLMAgent:
         print("📖 NotebookLM 접속 중...")
         try:
             self.page.goto("https://notebooklm.google.com/", wait_until="domcontentloaded", timeout=30000)
-            time.sleep(3)
+            with WAIT_TRACKER.track("navigate.page_ready", 3) as outcome:
+                outcome["ok"] = wait_for_page_ready(self.page, HOME_READY + NOTEBOOK_READY)
 
             # 인증 확인
             if "accounts.google.com" in self.page.url:
@@ -205,6 +353,7 @@ class NotebookLMAgent:
                 self._dump_debug("debug_auth_fail.html")
                 return False
 
+            SELECTOR_REGISTRY.detect_locale(self.page)
             print("  ✅ NotebookLM 접속 성공")
             return True
         except Exception as e:
@@ -219,8 +368,9 @@ class NotebookLMAgent:
         print(f"� 노트북 '{self.notebook_name}' 초기화(삭제 후 재생성) 시작...")
         
         # 1. 홈페이지로 이동 (이미 거기 있을 수 있지만 확실히 하기 위해)
-        self.page.goto("https://notebooklm.google.com/")
-        time.sleep(3)
+        self.page.goto("https://notebooklm.google.com/", wait_until="domcontentloaded")
+        with WAIT_TRACKER.track("recreate.home_ready", 3) as outcome:
+            outcome["ok"] = wait_for_page_ready(self.page, HOME_READY)
         
         # 2. 기존 노트북 삭제 시도
         self._delete_existing_notebook()
@@ -228,75 +378,152 @@ class NotebookLMAgent:
         # 3. 새 노트북 생성
         return self._create_new_notebook()
 
+    def sync_notebook(self, video_urls: list[str], titles: Optional[dict[str, str]] = None) -> Optional[SyncPlan]:
+        """
+        삭제 후 재생성 대신 기존 노트북을 열어 소스 목록을 한 번에 읽고,
+        새 URL 목록과의 차이만 반영합니다.
+        - 더 이상 필요 없는(또는 실패한) 소스만 삭제
+        - 아직 없는 URL은 plan.missing으로 돌려주어 add_sources가 추가
+
+        Returns:
+            SyncPlan (노트북이 없으면 새로 만들고 모든 URL이 missing), 실패 시 None
+        """
+        print(f"🔄 노트북 '{self.notebook_name}' 동기화 시작...")
+        self.page.goto("https://notebooklm.google.com/", wait_until="domcontentloaded")
+        with WAIT_TRACKER.track("sync.home_ready", 3) as outcome:
+            outcome["ok"] = wait_for_page_ready(self.page, HOME_READY)
+
+        if not self._find_existing_notebook():
+            print("  ℹ️ 기존 노트북 없음 — 새로 생성")
+            if not self._create_new_notebook():
+                return None
+            return SyncPlan(missing=list(video_urls))
+
+        # 빈 노트북이면 행이 끝내 나타나지 않으므로 짧게만 기다린다
+        with WAIT_TRACKER.track("sync.sources_listed", 0) as outcome:
+            outcome["ok"] = wait_for_page_ready(self.page, ['.single-source-container'], timeout=3000)
+
+        rows = read_sources(self.page)
+        if rows is None:
+            print("  ⚠️ 소스 목록을 읽지 못해 노트북 재생성으로 전환")
+            if not self.recreate_notebook():
+                return None
+            return SyncPlan(missing=list(video_urls))
+
+        plan = plan_sync(rows, video_urls, titles, NOTEBOOK_MANIFEST.titles(self.notebook_name))
+        print(f"  📋 기존 소스 {len(rows)}개 → 유지 {len(plan.keep)}, 삭제 {len(plan.stale)}, 추가 {len(plan.missing)}")
+
+        # 뒤쪽 행부터 지워야 앞쪽 행의 순번이 바뀌지 않는다
+        removed = sum(self._remove_source(row) for row in sorted(plan.stale, key=lambda r: r["index"], reverse=True))
+        if removed < len(plan.stale):
+            print(f"  ⚠️ 소스 {len(plan.stale) - removed}개 삭제 실패 (노트북에 남음)")
+        return plan
+
+    def _remove_source(self, row: dict) -> bool:
+        """소스 목록의 index번째 행(제목으로 재확인)을 메뉴 → 삭제 → 확인으로 지웁니다."""
+        title = row["title"]
+        try:
+            item = self.page.locator(".single-source-container").nth(row["index"])
+            if row_title(item) != title:
+                print(f"    ⚠️ 행 위치가 바뀌어 삭제 건너뜀: {title}")
+                return False
+            item.hover()
+            item.locator(", ".join(SELECTORS["source_more_btn"])).first.click(timeout=3000)
+            with WAIT_TRACKER.track("sync.menu_open", 1) as outcome:
+                outcome["ok"] = wait_for_visible(self.page, MENU_PANEL)
+
+            if not _try_click(self.page, SELECTORS["remove_source_item"], step="remove_source_item"):
+                self._dismiss_overlay()
+                return False
+            with WAIT_TRACKER.track("sync.dialog_open", 1) as outcome:
+                outcome["ok"] = wait_for_visible(self.page, DIALOG)
+            if not _try_click(self.page, SELECTORS["remove_source_confirm"], step="remove_source_confirm"):
+                self._dismiss_overlay()
+                return False
+            with WAIT_TRACKER.track("sync.dialog_closed", 2) as outcome:
+                outcome["ok"] = wait_for_hidden(self.page, DIALOG, timeout=5000)
+            print(f"    🗑️ 소스 삭제: {title}")
+            return True
+        except Exception as e:
+            print(f"    ⚠️ 소스 삭제 실패 ({title}): {e}")
+            self._dismiss_overlay()
+            return False
+
+    def _record_manifest(self, kept: dict[str, str], added: list[str]):
+        """유지한 소스 + 이 노트북에 이번에 추가한 소스(added)의 행 제목을 노트북 매니페스트에 저장."""
+        row_titles = dict(kept)
+        # added로 한정 — source_status/트래커에는 앞 노트북(넘침 분할)의 결과도 남아 있다
+        if added and self._source_tracker is not None:
+            ok_urls = [u for u in added if self.source_status.get(u) == "ok"]
+            row_titles.update(self._source_tracker.row_titles(ok_urls))
+        NOTEBOOK_MANIFEST.record(self.notebook_name, row_titles)
+        NOTEBOOK_MANIFEST.save()
+
+    def _fill_spillover(self, batches: list[list[str]], titles: Optional[dict[str, str]],
+                        sync: bool) -> list[dict]:
+        """소스 한도를 넘친 URL 묶음마다 추가 노트북을 열어(또는 만들어) 채웁니다."""
+        base_name = self.notebook_name
+        results = []
+        try:
+            for number, urls in enumerate(batches, 2):
+                self.notebook_name = spillover_name(base_name, number)
+                print(f"\n📚 소스 한도({NOTEBOOK_SOURCE_LIMIT}개) 초과 — '{self.notebook_name}'에 {len(urls)}개 추가")
+                extra = {"notebook_name": self.notebook_name, "notebook_url": None, "sources_added": 0,
+                         "source_status": {url: "failed" for url in urls}}
+                results.append(extra)
+                if sync:
+                    plan = self.sync_notebook(urls, titles=titles)
+                    if plan is None:
+                        continue
+                    to_add, kept = plan.missing, plan.keep
+                else:
+                    if not self.recreate_notebook():
+                        continue
+                    to_add, kept = urls, {}
+                extra["notebook_url"] = self.page.url
+                extra["sources_added"] = (self.add_sources(to_add, titles=titles) if to_add else 0) + len(kept)
+                self.source_status.update({url: "ok" for url in kept})
+                self._record_manifest(kept, to_add)
+                extra["source_status"] = {url: self.source_status.get(url, "failed") for url in urls}
+        finally:
+            self.notebook_name = base_name
+        return results
+
     def _delete_existing_notebook(self):
         """홈페이지 목록에서 이름이 일치하는 노트북을 찾아 삭제합니다."""
         print(f"  🗑️ 기존 노트북 검색 및 삭제 시도...")
         
-        # 노트북 카드 식별
-        # Playwright의 기법: 특정 텍스트를 포함하는 요소의 상위 컨테이너(카드) 찾기
-        # 하지만 여기서는 'more_vert' 버튼이 중요함.
-        
-        # 전략: 모든 'more_vert' 버튼(또는 메뉴 트리거)을 찾아서, 
-        # 그 버튼이 속한 카드의 제목이 target인지 확인.
+        # 전략: 제목 텍스트로 카드 찾기 -> 그 안의 메뉴 버튼 찾기
+        # 제목 요소와 각 카드의 메뉴 버튼을 scan() 한 번으로 읽고, 비교는 Python에서 한다.
         
         try:
-            # 1. 모든 메뉴 버튼 찾기
-            menu_btns = self.page.query_selector_all('button[aria-label="More options"], button[aria-label="옵션 더보기"], button .mat-icon:has-text("more_vert")')
-            
             target_deleted = False
-            
-            for btn in menu_btns:
-                # 버튼의 상위 요소(카드)를 탐색하여 제목 확인
-                # DOM 구조에 따라 다르겠지만, 보통 카드 내에 제목과 버튼이 같이 있음.
-                # xpath로 상위 탐색이 편함.
-                
-                # 여기서는 간단히: 버튼을 클릭해서 메뉴를 열고, 
-                # 주변 텍스트나 카드의 제목을 확인할 수 없으므로, 
-                # '제목 텍스트'를 먼저 찾고 그 옆의 버튼을 찾는 방식이 나음.
-                pass 
-            
-            # 전략 수정: 제목 텍스트로 카드 찾기 -> 그 안의 메뉴 버튼 찾기
-            # text=... 셀렉터 사용
-            
-            # 노트북 제목 요소들 찾기
-            titles = self.page.query_selector_all(f'.notebook-title, .title, a[href*="notebook"] .name')
+            titles = scan(self.page, NOTEBOOK_TITLE_SELECTOR, related=NOTEBOOK_CARD_MENU)
             
             for title_el in titles:
-                if not title_el.is_visible(): continue
+                if not title_el.visible: continue
                 
-                txt = title_el.inner_text().strip()
+                txt = title_el.text
                 if txt.lower() == self.notebook_name.lower():
-                    # 제목 일치! 이 카드의 메뉴 버튼 찾기
+                    # 제목 일치! 이 카드의 메뉴 버튼 (스캔 때 함께 표시해 둠)
                     print(f"  🔍 삭제 대상 노트북 발견: {txt}")
                     
-                    # 카드의 부모 요소(컨테이너) 찾기 (DOM 구조 추정)
-                    # 제목 요소에서 상위로 올라가며 카드 컨테이너를 찾음
-                    card = title_el.xpath('..') # 부모
-                    # 좀 더 확실하게: Playwright locator filter 사용 (여기서는 sync_api라 query_selector 사용 중)
-                    
-                    # 해당 제목 요소 근처의 메뉴 버튼 찾기 (형제 요소 등)
-                    # title_el.evaluate("el => el.closest('.notebook-card').querySelector('button')") 방식 사용
-                    
-                    menu_btn = title_el.evaluate_handle("""
-                        (el) => {
-                            // 제목의 부모/조상 중 카드 컨테이너를 찾고, 그 안의 메뉴 버튼 반환
-                            const card = el.closest('a') || el.closest('div[role="button"]') || el.closest('.notebook-card');
-                            if (!card) return null;
-                            return card.querySelector('button[aria-label*="option"], button[aria-label*="옵션"], button .mat-icon');
-                        }
-                    """)
-                    
-                    if menu_btn:
-                        menu_btn.as_element().click()
-                        time.sleep(1)
+                    if title_el.related_selector:
+                        self.page.locator(title_el.related_selector).click(timeout=3000)
+                        with WAIT_TRACKER.track("delete.menu_open", 1) as outcome:
+                            outcome["ok"] = wait_for_visible(self.page, MENU_PANEL)
                         
                         # 삭제 메뉴 클릭
-                        if _try_click(self.page, ['text=Delete', 'text=삭제', 'button:has-text("Delete")', 'button:has-text("삭제")']):
-                            time.sleep(1)
+                        if _try_click(self.page, SELECTORS["delete_menu_item"], step="delete_menu_item"):
+                            with WAIT_TRACKER.track("delete.dialog_open", 1) as outcome:
+                                outcome["ok"] = wait_for_visible(self.page, DIALOG)
                             # 확인 모달 클릭
-                            if _try_click(self.page, ['dialog button:has-text("Delete")', 'dialog button:has-text("삭제")']):
+                            if _try_click(self.page, SELECTORS["delete_confirm_btn"], step="delete_confirm_btn"):
                                 print("  ✅ 노트북 삭제 완료")
-                                time.sleep(3)
+                                # 모달이 닫히고 목록에서 카드가 빠질 때까지
+                                with WAIT_TRACKER.track("delete.dialog_closed", 3) as outcome:
+                                    outcome["ok"] = wait_for_hidden(self.page, DIALOG, timeout=5000) and \
+                                        wait_for_hidden(self.page, f'text="{txt}"', timeout=5000)
                                 target_deleted = True
                                 break
             
@@ -310,21 +537,18 @@ class NotebookLMAgent:
         """새 노트북 생성 로직 (분리됨)"""
         print(f"  🆕 새 노트북 생성 시도...")
         try:
-            created = _try_click(self.page, [
-                '.create-new-action-button',
-                '.create-new-button',
-                'button:has-text("새 노트북")',
-                'button:has-text("New notebook")',
-                'button:has-text("새로 만들기")',
-                'button[aria-label="노트북 만들기"]',
-            ], timeout=5000)
+            home_url = self.page.url
+            created = _try_click(self.page, SELECTORS["create_notebook_btn"], timeout=5000, step="create_notebook_btn")
 
             if not created:
                 print("  ❌ 새 노트북 버튼을 찾을 수 없음")
                 self._dump_debug("debug_create_notebook.html")
                 return False
 
-            time.sleep(3)
+            # 새 노트북 URL로 이동하고 노트북 화면이 그려질 때까지
+            with WAIT_TRACKER.track("create.notebook_ready", 3) as outcome:
+                outcome["ok"] = wait_for_url_change(self.page, home_url) and \
+                    wait_for_page_ready(self.page, NOTEBOOK_READY)
             self._dismiss_overlay()
 
             # 노트북 이름 변경
@@ -335,7 +559,8 @@ class NotebookLMAgent:
                     self.page.keyboard.press('Control+A')
                     self.page.keyboard.type(self.notebook_name)
                     self.page.keyboard.press('Enter')
-                    time.sleep(1)
+                    with WAIT_TRACKER.track("create.rename_committed", 1) as outcome:
+                        outcome["ok"] = wait_for_blur(self.page, title_el)
                     print(f"  ✅ 노트북 '{self.notebook_name}' 생성 및 이름 변경 완료")
             except Exception as e:
                 print(f"  ⚠️ 이름 변경 실패 (기본 이름으로 진행): {e}")
@@ -347,211 +572,246 @@ class NotebookLMAgent:
 
     def _find_existing_notebook(self) -> bool:
         """
-        홈페이지에서 기존 노트북을 여러 방법으로 검색.
-        1) 정확한 텍스트 매칭
-        2) 모든 클릭 가능한 카드의 innerText를 순회하며 부분 매칭
-        3) input.title-input 값 확인
+        홈페이지에서 제목이 정확히 같은 기존 노트북을 검색.
+        1) Playwright text="..." 셀렉터 (전체 일치)
+        2) 카드 제목 요소를 한 번에 읽어 제목 전체 비교
+        부분 일치는 쓰지 않는다 — "Daily new"가 넘침 노트북 "Daily new (2)"를 열면 안 된다.
         """
         target = self.notebook_name.lower()
 
         # 방법 1: Playwright text= 셀렉터 (정확 매칭)
-        for sel in [
-            f'text="{self.notebook_name}"',
-            f'text=/{self.notebook_name}/i',
-        ]:
-            try:
-                el = self.page.query_selector(sel)
-                if el:
-                    el.click()
-                    time.sleep(3)
-                    print(f"  ✅ 기존 노트북 열기 성공 (text 셀렉터)")
-                    return True
-            except Exception:
-                continue
+        try:
+            el = self.page.query_selector(f'text="{self.notebook_name}"')
+            if el:
+                home_url = self.page.url
+                el.click()
+                self._wait_for_notebook_open(home_url)
+                print("  ✅ 기존 노트북 열기 성공 (text 셀렉터)")
+                return True
+        except Exception:
+            pass
 
-        # 방법 2: 모든 노트북 카드를 순회하며 텍스트 비교
+        # 방법 2: 모든 노트북 카드의 제목을 한 번에 읽어 비교 (삭제와 같은 기준)
         try:
-            # NotebookLM 카드 구조: a 태그 또는 클릭 가능한 div
-            cards = self.page.query_selector_all('a[href*="notebook"], .notebook-item, .notebook-card, mat-card, [class*="notebook"]')
-            if not cards:
-                # 더 넓은 범위로 재시도
-                cards = self.page.query_selector_all('a[href], .mat-card, [role="listitem"]')
-            
-            print(f"  🔍 {len(cards)}개 카드 검사 중...")
-            for card in cards:
-                try:
-                    card_text = card.inner_text().strip().lower()
-                    if target in card_text:
-                        card.click()
-                        time.sleep(3)
-                        print(f"  ✅ 기존 노트북 열기 성공 (카드 순회)")
-                        return True
-                except Exception:
-                    continue
+            titles = scan(self.page, NOTEBOOK_TITLE_SELECTOR)
+            print(f"  🔍 {len(titles)}개 노트북 제목 검사 중...")
+            title_el = find_first(titles, lambda t: t.text.lower() == target)
+            if title_el:
+                home_url = self.page.url
+                self.page.locator(title_el.selector).click(timeout=5000)
+                self._wait_for_notebook_open(home_url)
+                print("  ✅ 기존 노트북 열기 성공 (제목 비교)")
+                return True
         except Exception as e:
             print(f"  카드 검색 실패: {e}")
 
         return False
 
+    def _wait_for_notebook_open(self, home_url: str):
+        """카드 클릭 후 노트북 URL로 바뀌고 노트북 화면이 그려질 때까지 대기."""
+        with WAIT_TRACKER.track("open.notebook_ready", 3) as outcome:
+            outcome["ok"] = wait_for_url_change(self.page, home_url) and \
+                wait_for_page_ready(self.page, NOTEBOOK_READY)
+
     def _dismiss_overlay(self):
         """모달 오버레이/백드롭이 있으면 닫기."""
         try:
             # ESC 키로 모달 닫기
             self.page.keyboard.press("Escape")
-            time.sleep(1)
+            with WAIT_TRACKER.track("dismiss.escape", 1) as outcome:
+                outcome["ok"] = wait_for_hidden(self.page, OVERLAY_BACKDROP, timeout=1000)
             # 백드롭이 아직 있으면 클릭하여 닫기
-            backdrop = self.page.query_selector('.cdk-overlay-backdrop')
+            backdrop = self.page.query_selector(OVERLAY_BACKDROP)
             if backdrop:
                 backdrop.click(force=True)
-                time.sleep(0.5)
+                with WAIT_TRACKER.track("dismiss.backdrop", 0.5) as outcome:
+                    outcome["ok"] = wait_for_hidden(self.page, OVERLAY_BACKDROP, timeout=1000)
         except Exception:
             pass
 
-    def add_sources(self, video_urls: list[str]) -> int:
+    def add_sources(self, video_urls: list[str], titles: Optional[dict[str, str]] = None,
+                    max_retries: int = 1, chunk_size: int = SOURCE_CHUNK_SIZE,
+                    max_in_flight: int = SOURCE_PIPELINE_DEPTH) -> int:
         """
-        모든 영상 URL을 소스로 한 번에 일괄 추가.
+        영상 URL을 chunk_size개씩 묶어 소스로 추가.
         
         NotebookLM의 소스 추가 모달에는 textarea[formcontrolname="urls"]가 있어
         여러 URL을 줄바꿈(\n)으로 구분하여 한 번에 입력 가능.
+        한 번에 너무 많이 넣으면 제출 한도에 걸리고 URL 하나의 오류가 전체를
+        실패시키므로 묶음 단위로 제출·확인한다.
         
-        흐름:
+        흐름 (묶음마다):
         1. "소스 추가" 버튼 클릭 → 소스 유형 모달
         2. "웹사이트" 옵션 선택
-        3. textarea에 모든 URL을 줄바꿈으로 한 번에 입력
+        3. textarea에 묶음의 URL을 줄바꿈으로 입력
         4. "삽입" 버튼 클릭
-        5. 소스 처리 완료 대기
+        5. 소스 목록에서 URL별로 처리 완료/실패 확인 (SourceTracker)
+        앞 묶음이 처리되는 동안 다음 묶음을 제출한다 (최대 max_in_flight개 동시 처리).
+        UI가 처리 중 제출을 막으면 앞 묶음을 모두 기다린 뒤 다시 제출.
+        6. 실패한 URL만 다시 제출 (최대 max_retries회)
+
+        titles({url: 영상 제목})를 주면 소스 목록의 행 제목으로 URL을 정확히 짝짓는다.
+        URL별 결과는 self.source_status에 남는다 ('ok' / 'failed').
         """
-        print(f"📎 소스 {len(video_urls)}개 일괄 추가 시작...")
-        
-        # 혹시 열려있는 모달/오버레이 먼저 닫기
+        chunks = list(chunked(list(video_urls), chunk_size))
+        print(f"📎 소스 {len(video_urls)}개 추가 시작 ({len(chunks)}개 묶음)...")
+        if self._source_tracker is None or self._source_tracker.page is not self.page:
+            self._source_tracker = SourceTracker(self.page)
+        tracker = self._source_tracker
+
+        pending = list(video_urls)
+        for attempt in range(max_retries + 1):
+            if attempt:
+                print(f"  🔁 실패한 소스 {len(pending)}개만 재시도 ({attempt}/{max_retries})")
+            self._submit_pipelined(tracker, list(chunked(pending, chunk_size)), titles, max_in_flight)
+            pending = tracker.failed(pending)
+            if not pending:
+                break
+
+        self.source_status = {url: tracker.status.get(url, "failed") for url in video_urls}
+        success_count = len(tracker.succeeded(video_urls))
+        print(f"\n📊 소스 추가 결과: {success_count}/{len(video_urls)} 성공")
+        for url in tracker.failed(video_urls):
+            print(f"  ❌ {url} ({tracker.reasons.get(url, '?')})")
+        return success_count
+
+    def _submit_pipelined(self, tracker: SourceTracker, chunks: list[list[str]],
+                          titles: Optional[dict[str, str]], max_in_flight: int):
+        """묶음을 차례로 제출하고, 처리 중인 묶음이 max_in_flight개면 가장 오래된 것을 기다린다."""
+        in_flight: list[tuple[list[str], float]] = []   # (묶음, 제출 시각)
+
+        def wait_oldest():
+            chunk, submitted_at = in_flight[0]
+            order = [u for c, _ in in_flight for u in c]
+            remaining = submitted_at + SOURCE_CHUNK_TIMEOUT - time.monotonic()
+            self._wait_for_sources(tracker, chunk, timeout=max(remaining, 5), order_urls=order)
+            in_flight.pop(0)
+
+        for number, chunk in enumerate(chunks, 1):
+            while len(in_flight) >= max(1, max_in_flight):
+                wait_oldest()
+            if len(chunks) > 1:
+                print(f"  📦 묶음 {number}/{len(chunks)} ({len(chunk)}개) 제출")
+            tracker.begin(chunk, titles, append=bool(in_flight))
+            submitted = self._submit_sources(chunk)
+            if not submitted and in_flight:
+                # 처리 중에는 추가를 막는 UI — 앞 묶음이 끝난 뒤 한 번 더
+                print("    ℹ️ 처리 중 제출 불가 — 앞 묶음 완료 후 재제출")
+                while in_flight:
+                    wait_oldest()
+                tracker.begin(chunk, titles)
+                submitted = self._submit_sources(chunk)
+            if submitted and self._submission_error():
+                # 오류는 방금 제출한 이 묶음의 것 — 처리 대기 목록에 넣지 않는다
+                tracker.fail(chunk, "dialog_error")
+            elif submitted:
+                in_flight.append((chunk, time.monotonic()))
+            else:
+                tracker.fail(chunk, "submit_failed")
+
+        while in_flight:
+            wait_oldest()
+
+    def _submit_sources(self, video_urls: list[str]) -> bool:
+        """소스 추가 모달을 열어 URL들을 입력하고 삽입 버튼까지 클릭 (1~4단계)."""
+        # 혹시 열려있는 모달/오버레이 먼저 닫기 (_dismiss_overlay가 닫힘까지 대기)
         self._dismiss_overlay()
-        time.sleep(1)
+        WAIT_TRACKER.skipped("add_sources.settle", 1)
 
         # ── 1단계: "소스 추가" 버튼 클릭 ──
-        add_btn_selectors = [
-            '[aria-label="소스 추가"]',
-            '[aria-label="Add source"]',
-            'button:has-text("소스 추가")',
-            'button:has-text("Add source")',
-            # 노트북 내부의 add 아이콘 버튼
-            'button[aria-label="노트북 만들기"]',
-            'button:has(mat-icon:text("add"))',
-        ]
-
-        if not _try_click(self.page, add_btn_selectors, timeout=8000):
+        if not _try_click(self.page, SELECTORS["add_source_btn"], timeout=8000, step="add_source_btn"):
             print("  ❌ 소스 추가 버튼 못 찾음")
             self._dump_debug("debug_add_source_btn.html")
-            return 0
+            return False
 
-        time.sleep(2)
+        # 소스 유형 모달이 뜨는 것은 다음 단계의 셀렉터 대기가 확인한다
+        WAIT_TRACKER.skipped("add_sources.type_modal", 2)
 
         # ── 2단계: "웹사이트" 옵션 선택 ──
-        website_selectors = [
-            'text=웹사이트',
-            'text=Website',
-            'text=웹사이트 URL',
-            'text=Website URL',
-            '[data-value="WEBSITE"]',
-            'text=YouTube',
-        ]
-
-        if not _try_click(self.page, website_selectors, timeout=5000):
+        if not _try_click(self.page, SELECTORS["website_option"], timeout=5000, step="website_option"):
             print("  ❌ 웹사이트 옵션 못 찾음")
             self._dump_debug("debug_source_type.html")
             self._dismiss_overlay()
-            return 0
+            return False
 
-        time.sleep(2)
+        WAIT_TRACKER.skipped("add_sources.url_form", 2)
 
         # ── 3단계: 모든 URL을 한 번에 입력 ──
         # NotebookLM의 URL textarea는 formcontrolname="urls" (복수!)
         # 여러 URL을 줄바꿈(\n)으로 구분하여 한 번에 입력 가능
         all_urls_text = "\n".join(video_urls)
-        
-        # textarea 셀렉터 (정확한 우선순위)
-        url_textarea_selectors = [
-            # 가장 정확한 셀렉터
-            'textarea[formcontrolname="urls"]',
-            'textarea[aria-label="URL 입력"]',
-            'textarea[placeholder="링크를 붙여넣으세요."]',
-            'textarea[placeholder*="붙여넣"]',
-            'textarea[placeholder*="paste"]',
-            'textarea[placeholder*="Paste"]',
-            'textarea[placeholder*="link"]',
-            'textarea[placeholder*="Link"]',
-            # 모달 내 textarea
-            '.cdk-overlay-pane textarea',
-            'mat-dialog-container textarea',
-            'add-sources-dialog textarea',
-            # 일반 폴백
-            'textarea.mat-mdc-input-element',
-            'textarea[matinput]',
-        ]
 
-        if not _try_fill(self.page, url_textarea_selectors, all_urls_text, timeout=8000):
+        if not _try_fill(self.page, SELECTORS["url_textarea"], all_urls_text, timeout=8000, step="url_textarea"):
             print("  ❌ URL 입력 필드 못 찾음")
             self._dump_debug("debug_url_input.html")
             self._dismiss_overlay()
-            return 0
+            return False
 
         print(f"  ✅ URL {len(video_urls)}개 입력 완료")
-        time.sleep(1)
+        # 삽입 버튼 활성화는 click()의 actionability 대기가 확인한다
+        WAIT_TRACKER.skipped("add_sources.validate", 1)
 
         # ── 4단계: "삽입" 버튼 클릭 ──
-        insert_selectors = [
-            'button:has-text("삽입")',
-            'button:has-text("Insert")',
-            'button:has-text("제출")',
-            'button:has-text("Submit")',
-            'button:has-text("추가")',
-            'button:has-text("Add")',
-            # 모달 내의 primary/accent 버튼
-            '.cdk-overlay-pane button.mat-primary',
-            '.cdk-overlay-pane button.mat-accent',
-            'mat-dialog-container button.mat-primary',
-        ]
-
-        if not _try_click(self.page, insert_selectors, timeout=5000):
+        if not _try_click(self.page, SELECTORS["insert_btn"], timeout=5000, step="insert_btn"):
             print("  ❌ 삽입 버튼 못 찾음")
             self._dump_debug("debug_insert_btn.html")
             self._dismiss_overlay()
-            return 0
+            return False
 
-        # ── 5단계: 소스 처리 완료 대기 ──
+        return True
+
+    def _submission_error(self) -> bool:
+        """삽입 직후 모달에 오류가 떴는지 확인 (모달이 닫히거나 오류가 보일 때까지만 대기)."""
+        with WAIT_TRACKER.track("add_sources.submit_check", 0) as outcome:
+            outcome["ok"] = wait_for_dialog_settled(self.page, SOURCES_DIALOG, timeout=3000)
+        try:
+            err = self.page.query_selector(SOURCES_DIALOG_ERROR)
+        except Exception:
+            return False
+        if not err:
+            return False
+        print("  ⚠️ 소스 추가 중 에러 발생")
+        self._dump_debug("debug_source_error.html")
+        self._dismiss_overlay()
+        return True
+
+    def _wait_for_sources(self, tracker: SourceTracker, video_urls: list[str],
+                          timeout: float = SOURCE_CHUNK_TIMEOUT, order_urls: Optional[list[str]] = None):
+        """
+        5단계: 제출한 URL이 모두 'ok'/'failed'로 정해질 때까지 대기.
+        소스 목록이 바뀔 때마다(MutationObserver) 깨어나므로 마지막 소스가
+        정해지는 즉시 끝난다. (모달 오류는 제출 직후 _submission_error가 확인)
+        order_urls는 처리 중인 모든 묶음의 URL (제출 순) — 순서 기반 배정에 쓴다.
+        """
+        order_urls = order_urls or video_urls
         print(f"  ⏳ 소스 {len(video_urls)}개 처리 중...")
-        success_count = 0
-        for wait_cycle in range(24):  # 최대 120초 대기
-            time.sleep(5)
-            elapsed = (wait_cycle + 1) * 5
-            
-            # 모달이 닫혔는지 확인 (소스 추가 완료 시 모달이 닫힘)
-            overlay = self.page.query_selector('.cdk-overlay-pane:has(add-sources-dialog)')
-            if not overlay:
-                # 모달 닫힘 = 소스 추가 완료
-                success_count = len(video_urls)
-                print(f"  ✅ 소스 처리 완료 ({elapsed}초)")
-                break
-            
-            # 에러 메시지 확인
-            try:
-                err = self.page.query_selector('.cdk-overlay-pane :text("오류"), .cdk-overlay-pane :text("Error")')
-                if err:
-                    print(f"  ⚠️ 소스 추가 중 에러 발생")
-                    self._dump_debug("debug_source_error.html")
-                    self._dismiss_overlay()
-                    return 0
-            except Exception:
-                pass
-            
-            if elapsed % 15 == 0:
-                print(f"    ... {elapsed}초 경과")
-        else:
-            # 타임아웃이지만 일부 성공했을 수 있음
-            print(f"  ⚠️ 소스 처리 타임아웃 (120초)")
-            success_count = len(video_urls)  # 낙관적 추정
+        started = time.monotonic()
+        next_report = 15
+        with WAIT_TRACKER.track("add_sources.processing", 0) as outcome:
+            while not tracker.settled(video_urls):
+                elapsed = time.monotonic() - started
+                if elapsed >= timeout:
+                    print(f"  ⚠️ 소스 처리 타임아웃 ({timeout:.0f}초)")
+                    outcome["ok"] = False
+                    break
 
-        print(f"\n📊 소스 추가 결과: {success_count}/{len(video_urls)} 성공")
-        return success_count
+                tracker.wait_for_change(min(timeout - elapsed, 5))
+                tracker.drain()
+
+                if self.page.query_selector(SOURCES_DIALOG) is None:
+                    # 모달이 닫힌 뒤에는 제목으로 못 짝지은 새 행을 제출 순서대로 배정
+                    tracker.assign_by_order(order_urls)
+
+                if elapsed >= next_report:
+                    done = sum(tracker.status.get(u) in ("ok", "failed") for u in video_urls)
+                    print(f"    ... {elapsed:.0f}초 경과 ({done}/{len(video_urls)} 완료)")
+                    next_report += 15
+
+            tracker.finalize(video_urls, order_urls)
+            elapsed = time.monotonic() - started
+            print(f"  ✅ 소스 처리 확인 완료 ({elapsed:.1f}초)")
+            # 기존 방식은 모달이 닫힐 때까지 5초 단위로 확인했으므로 그 경계까지가 기존 대기 시간
+            outcome["baseline"] = min(120, 5 * (int(elapsed // 5) + 1))
 
     def generate_audio_overview(self, max_wait_minutes: int = 15) -> bool:
         """
@@ -579,10 +839,81 @@ class NotebookLMAgent:
         
         return True
 
-    # [Deprecated] 아래 메서드들은 현재 자동화 수준에서 사용하지 않음
-    # def _click_audio_entry_btn(self) -> bool: ...
-    # def _confirm_generation(self): ...
-    # def _wait_for_audio_generation(self, ...): ...
+    def generate_and_download_audio(self, max_wait_minutes: int = 15, regenerate: bool = True) -> Optional[dict]:
+        """
+        오디오 개요 생성을 실제로 트리거하고, 완료되면 파일로 받습니다.
+        완료/실패는 페이지 안의 MutationObserver가 알려 주므로 (AudioWatcher)
+        생성되는 동안 Python 쪽에서 셀렉터를 반복 확인하지 않는다.
+        regenerate=False(소스가 그대로인 동기화)일 때만 이미 있는 오디오를 그대로 받는다.
+        트리거 전에 있던 오디오는 감시 기준으로 기록되어, 새 파일이 생겨야 완료로 본다.
+
+        Returns:
+            {"path", "sha256", "bytes", "url"} — 실패 시 None
+        """
+        print("🎙️ 오디오 개요 생성 + 다운로드...")
+        if not self._open_studio_panel():
+            print("  ⚠️ 스튜디오 패널을 열지 못했습니다.")
+            return None
+
+        if self._audio_watcher is None or self._audio_watcher.page is not self.page:
+            self._audio_watcher = AudioWatcher(self.page)
+        watcher = self._audio_watcher
+        state = watcher.install()
+        reuse = state == "ready" and not regenerate
+
+        if state == "generating":
+            print("  ℹ️ 이미 생성 중인 오디오가 있습니다 — 완료까지 대기")
+            watcher.arm()
+        elif reuse:
+            print("  ℹ️ 소스 변경 없음 — 이미 생성된 오디오를 바로 다운로드")
+        else:
+            if state == "ready":
+                print("  ℹ️ 소스가 바뀌어 기존 오디오 대신 새로 생성합니다")
+            # 감시를 먼저 무장한 뒤 트리거해야 빠른 완료/실패도 놓치지 않는다
+            watcher.arm()
+            if not self._click_audio_entry_btn():
+                return None
+            self._confirm_generation()
+
+        if not reuse:
+            started = time.monotonic()
+            with WAIT_TRACKER.track("audio.generation", 0) as outcome:
+                finished = watcher.wait(max_wait_minutes * 60)
+                elapsed = time.monotonic() - started
+                outcome["ok"] = finished == "ready"
+                # 기존 방식은 10초 간격으로 확인했으므로 그 경계까지가 기존 대기 시간
+                outcome["baseline"] = min(max_wait_minutes * 60, 10 * (int(elapsed // 10) + 1))
+            if finished == "error":
+                print("  ❌ 오디오 생성 중 에러 발생")
+                self._dump_debug("debug_audio_error.html")
+                return None
+            if finished != "ready":
+                print(f"  ⚠️ 오디오 생성 타임아웃 ({max_wait_minutes}분)")
+                return None
+            print(f"  ✅ 오디오 생성 완료! (소요 시간: {elapsed:.0f}초)")
+
+        stem = f"{self.notebook_name.replace(' ', '_')}_{time.strftime('%Y%m%d_%H%M')}"
+        audio = watcher.download(AUDIO_DIR, stem) or self._download_audio_via_menu(stem)
+        if audio:
+            print(f"  💾 오디오 저장: {audio['path']} ({audio['bytes'] / 1024 / 1024:.1f}MB, sha256 {audio['sha256'][:12]}…)")
+        else:
+            print("  ❌ 오디오 파일을 받지 못했습니다.")
+            self._dump_debug("debug_audio_download.html")
+        return audio
+
+    def _download_audio_via_menu(self, stem: str) -> Optional[dict]:
+        """플레이어 메뉴의 '다운로드'로 브라우저가 직접 파일을 받게 한다 (오디오 URL을 못 찾은 경우)."""
+        try:
+            if not _try_click(self.page, SELECTORS["audio_more_btn"], step="audio_more_btn"):
+                return None
+            with self.page.expect_download(timeout=120000) as download_info:
+                if not _try_click(self.page, SELECTORS["audio_download_item"], step="audio_download_item"):
+                    self._dismiss_overlay()
+                    return None
+            return AudioWatcher.finish_browser_download(download_info.value, AUDIO_DIR, stem)
+        except Exception as e:
+            print(f"  ⚠️ 메뉴 다운로드 실패: {e}")
+            return None
 
     def _open_studio_panel(self) -> bool:
         """
@@ -594,46 +925,42 @@ class NotebookLMAgent:
         
         # 1. 'tune' 아이콘 버튼 찾아서 클릭 (가장 정확한 방법)
         # 로그에서 'tune' 텍스트를 가진 버튼이 확인됨
+        # 넓은 화면(3단 레이아웃)에서는 스튜디오 패널이 이미 보인다. 이때의 'tune'은
+        # 채팅의 '노트북 구성' 버튼이라 누르면 대화상자가 패널을 가리므로 건너뛴다.
         clicked = False
         try:
-            # inner_text에 'tune'이 포함된 버튼 검색
-            btns = self.page.query_selector_all('button')
-            for btn in btns:
-                if btn.is_visible() and "tune" in btn.inner_text():
-                    print("  🖱️ 'tune' 아이콘 버튼 클릭")
-                    btn.click()
-                    clicked = True
-                    time.sleep(1) # 애니메이션 대기
-                    break
+            if self.page.locator(STUDIO_PANEL).first.is_visible():
+                print("  ✅ 스튜디오 패널이 이미 열려 있음")
+                clicked = True
+        except Exception:
+            pass
+        try:
+            # 텍스트에 'tune'이 포함된 보이는 버튼 검색 (버튼 전체를 한 번에 스캔)
+            btn = None if clicked else find_first(
+                scan(self.page, 'button'), lambda b: "tune" in b.text and "구성" not in b.aria_label)
+            if btn:
+                print("  🖱️ 'tune' 아이콘 버튼 클릭")
+                self.page.locator(btn.selector).click(timeout=3000)
+                clicked = True
+                # 패널 애니메이션은 아래 '오디오' 텍스트 대기가 확인한다
+                WAIT_TRACKER.skipped("studio.animation", 1)
         except Exception as e:
             print(f"  ⚠️ tune 버튼 클릭 중 오류: {e}")
             
         # 2. tune 버튼 클릭 실패 시 다른 셀렉터 시도
         if not clicked:
-            clicked = _try_click(self.page, [
-                "button[aria-label='노트북 가이드']",
-                "button[aria-label='Notebook guide']",
-                ".notebook-guide-toggle",
-                "button:has-text('노트북 가이드')",
-                "button[aria-label='스튜디오']", 
-            ], timeout=3000)
+            clicked = _try_click(self.page, SELECTORS["studio_panel_btn"], timeout=3000, step="studio_panel_btn")
 
         # 3. 패널 내용 로딩 대기
         print("  ⏳ 패널 로딩 대기...")
-        try:
-            # '오디오' 또는 'Audio' 텍스트가 포함된 요소 대기
-            # 너무 짧은 timeout은 로딩 실패 원인이 됨
-            self.page.wait_for_selector("text=오디오", timeout=5000)
-            print("  ✅ 오디오 관련 텍스트 발견")
+        # '오디오' 또는 'Audio' 텍스트가 포함된 요소 대기 (두 후보를 한 번에)
+        # 너무 짧은 timeout은 로딩 실패 원인이 됨
+        resolved = SELECTOR_REGISTRY.resolve(self.page, "audio_panel_text", SELECTORS["audio_panel_text"], timeout=5000)
+        if resolved:
+            print(f"  ✅ 오디오 관련 텍스트 발견 ({resolved[1]})")
             return True
-        except:
-            try:
-                self.page.wait_for_selector("text=Audio", timeout=3000)
-                print("  ✅ Audio 텍스트 발견")
-                return True
-            except:
-                print("  ⚠️ 패널 텍스트 확인 실패 (로딩 실패로 간주)")
-                return False
+        print("  ⚠️ 패널 텍스트 확인 실패 (로딩 실패로 간주)")
+        return False
 
     def _click_audio_entry_btn(self) -> bool:
         """
@@ -641,20 +968,13 @@ class NotebookLMAgent:
         핵심: 긴 안내 텍스트가 아닌 '버튼'만 정확히 클릭해야 함.
         """
         print("  🔍 'AI 오디오 오버뷰' 버튼 탐색...")
-        time.sleep(2) # 패널 애니메이션 안정화 대기
+        # 패널 애니메이션은 _open_studio_panel()의 오디오 텍스트 대기가 이미 확인했다
+        WAIT_TRACKER.skipped("audio_entry.animation", 2)
         
-        # [디버깅] 화면에 보이는 모든 버튼 텍스트 출력
-        try:
-            buttons = self.page.query_selector_all('button')
-            visible_btns = []
-            for btn in buttons:
-                if btn.is_visible():
-                    txt = btn.inner_text().strip().replace('\n', ' ')
-                    if txt and len(txt) < 50: # 너무 긴 텍스트는 제외
-                        visible_btns.append(txt)
-            print(f"  👀 현재 화면의 버튼들(50자 미만): {visible_btns}")
-        except Exception as e:
-            print(f"  ⚠️ 버튼 목록 조회 실패: {e}")
+        # [디버깅] 화면에 보이는 모든 버튼 텍스트 출력 (아래 매칭도 이 스캔 결과로 한다)
+        buttons = [b for b in scan(self.page, 'button') if b.visible]
+        visible_btns = [b.text.replace('\n', ' ') for b in buttons if b.text and len(b.text) < 50] # 너무 긴 텍스트는 제외
+        print(f"  👀 현재 화면의 버튼들(50자 미만): {visible_btns}")
 
         # [추가] '맞춤' 또는 'Customize' 버튼이 보이면 이미 오디오 패널에 진입한 것으로 간주
         for btn_txt in visible_btns:
@@ -672,33 +992,47 @@ class NotebookLMAgent:
         
         # 1. 정확한 텍스트 매칭 시도 (가장 안전)
         for text in candidates:
-            # 버튼 태그이면서 해당 텍스트를 포함하는 요소 찾기
+            # 버튼이면서 해당 텍스트를 포함하는 요소 찾기
+            for el in buttons:
+                txt = el.text
+                
+                # [오클릭 방지] '노트북 만들기'는 제외
+                if "노트북" in txt and "만들기" in txt:
+                    continue
+                    
+                # 정확히 일치하거나, 해당 텍스트를 포함하면서 짧은 경우
+                if text in txt and len(txt) < 30:
+                    try:
+                        print(f"  🖱️ 버튼 클릭: '{txt}' (키워드: {text})")
+                        self.page.locator(el.selector).click(timeout=3000)
+                        self._wait_for_audio_entry()
+                        return True
+                    except Exception:
+                        continue
+
+        # 2. 스튜디오 패널의 타일은 <button>이 아니라 div[role=button] — aria-label로 찾는다
+        #    (타일 안의 연필 버튼은 '맞춤설정'이므로 제외)
+        tile = find_first(
+            [t for t in scan(self.page, '[role="button"][aria-label]') if t.visible],
+            lambda t: any(text in t.aria_label for text in ("오디오 오버뷰", "오디오 개요", "Audio Overview"))
+            and "맞춤" not in t.aria_label and "Customize" not in t.aria_label,
+        )
+        if tile:
             try:
-                els = self.page.query_selector_all(f'button:has-text("{text}")')
-                for el in els:
-                    if el.is_visible():
-                        txt = el.inner_text().strip()
-                        
-                        # [오클릭 방지] '노트북 만들기'는 제외
-                        if "노트북" in txt and "만들기" in txt:
-                            continue
-                            
-                        # 정확히 일치하거나, 해당 텍스트를 포함하면서 짧은 경우
-                        if text in txt and len(txt) < 30:
-                            print(f"  🖱️ 버튼 클릭: '{txt}' (키워드: {text})")
-                            el.click()
-                            time.sleep(2)
-                            return True
+                print(f"  🖱️ 스튜디오 타일 클릭: '{tile.aria_label}'")
+                self.page.locator(tile.selector).click(timeout=3000)
+                self._wait_for_audio_entry()
+                return True
             except Exception:
-                continue
+                pass
 
-        # 2. 차선책: 특정 컴포넌트 내의 버튼
+        # 3. 차선책: 특정 컴포넌트 내의 버튼
         try:
             el = self.page.query_selector('audio-overview button')
             if el and el.is_visible():
                 print("  🖱️ audio-overview 컴포넌트 내 버튼 클릭")
                 el.click()
-                time.sleep(2)
+                self._wait_for_audio_entry()
                 return True
         except: pass
 
@@ -706,6 +1040,11 @@ class NotebookLMAgent:
         self._dump_debug("debug_audio_entry_fail.html")
         return False
 
+    def _wait_for_audio_entry(self):
+        """진입 클릭 후 맞춤설정 대화상자가 뜨거나 생성이 시작될 때까지 대기."""
+        with WAIT_TRACKER.track("audio_entry.opened", 2) as outcome:
+            outcome["ok"] = wait_for_page_ready(self.page, AUDIO_ENTRY_OPENED, timeout=5000)
+
     def _confirm_generation(self):
         """
         진입 후 '생성', '만들기' 등의 확인 버튼이 있다면 클릭.
@@ -717,64 +1056,31 @@ class NotebookLMAgent:
         # 하지만 명시적인 버튼이 있다면 클릭해야 함
         
         btns = ["생성", "만들기", "Generate", "Create", "시작"]
+        buttons = [b for b in scan(self.page, 'button') if b.visible]
         
         for text in btns:
-            try:
-                # 버튼이면서 텍스트가 정확히 일치하거나 매우 짧은 경우
-                els = self.page.query_selector_all(f'button:has-text("{text}")')
-                for el in els:
-                    if el.is_visible():
-                        txt = el.inner_text().strip()
-                        
-                        # [오클릭 방지] '노트북 만들기'는 제외
-                        if "노트북" in txt and "만들기" in txt:
-                            continue
+            # 버튼이면서 텍스트가 정확히 일치하거나 매우 짧은 경우
+            for el in buttons:
+                txt = el.text
+                if text not in txt:
+                    continue
+                
+                # [오클릭 방지] '노트북 만들기'는 제외
+                if "노트북" in txt and "만들기" in txt:
+                    continue
 
-                        if len(txt) < 15: # 매우 짧은 텍스트여야 함 (안내문구 제외)
-                            print(f"  🖱️ 확인 버튼 클릭: '{txt}'")
-                            el.click()
-                            time.sleep(2)
-                            return
-            except: pass
+                if len(txt) < 15: # 매우 짧은 텍스트여야 함 (안내문구 제외)
+                    try:
+                        print(f"  🖱️ 확인 버튼 클릭: '{txt}'")
+                        self.page.locator(el.selector).click(timeout=3000)
+                        # 대화상자가 닫히면 생성 시작 — 이후 완료 대기는 AudioWatcher가 한다
+                        with WAIT_TRACKER.track("audio_confirm.closed", 2) as outcome:
+                            outcome["ok"] = wait_for_hidden(self.page, DIALOG, timeout=5000)
+                        return
+                    except Exception:
+                        continue
 
             
-    def _check_if_audio_exists(self) -> bool:
-        """이미 생성된 오디오가 있는지 재생 버튼 등으로 확인."""
-        return _wait_for_any(self.page, SELECTORS["audio_play_btn"], timeout=2000)
-
-    def _wait_for_audio_generation(self, max_wait_minutes: int) -> bool:
-        """오디오 생성 완료 대기 및 결과 처리."""
-        start_time = time.time()
-        max_wait_seconds = max_wait_minutes * 60
-        
-        while (time.time() - start_time) < max_wait_seconds:
-            elapsed = int(time.time() - start_time)
-            
-            # 1. 생성 완료 확인 (재생/공유 버튼 등)
-            if self._check_if_audio_exists():
-                print(f"  ✅ 오디오 생성 완료! (소요 시간: {elapsed}초)")
-                return True
-                
-            # 2. 에러 확인
-            try:
-                err = self.page.query_selector('text=생성 실패') or \
-                      self.page.query_selector('text=Error generating')
-                if err:
-                    print("  ❌ 오디오 생성 중 에러 발생")
-                    self._dump_debug("debug_audio_error.html")
-                    return False
-            except Exception:
-                pass
-            
-            # 3. 진행 상황 표시
-            if elapsed % 30 == 0:
-                print(f"    ... {elapsed}초 경과")
-                
-            time.sleep(10)
-            
-        print(f"  ⚠️ 오디오 생성 타임아웃 ({max_wait_minutes}분)")
-        return False
-        
     def get_audio_share_link(self) -> str:
         """
         생성된 오디오 개요의 공유 링크를 추출.
@@ -785,30 +1091,30 @@ class NotebookLMAgent:
         return self.page.url
 
     def _dump_debug(self, filename: str):
-        """디버그용 HTML 덤프."""
-        try:
-            output_path = Path(__file__).parent / filename
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(self.page.content())
-            print(f"    💾 디버그 덤프: {filename}")
-        except Exception as e:
-            print(f"    ⚠️ 디버그 덤프 실패: {e}")
+        """
+        디버그용 HTML 덤프.
+        페이지 내용만 여기서 읽고, 압축/중복 제거/저장은 백그라운드에서 data/debug/에 한다.
+        """
+        get_store().capture(self.page, Path(filename).stem.removeprefix("debug_"))
 
-    def run(self, video_urls: list[str]) -> dict:
+    def run(self, video_urls: list[str], titles: Optional[dict[str, str]] = None,
+            sync: bool = False, download_audio: bool = False) -> dict:
         """
         전체 워크플로우 실행:
         1. NotebookLM 접속
-        2. 노트북 열기/생성
+        2. 노트북 열기/생성 (sync=True면 재생성 대신 차이만 동기화)
         3. 소스 추가
-        4. 오디오 개요 생성
+        4. 오디오 개요 생성 (download_audio=True면 생성 완료까지 기다려 파일로 저장,
+           아니면 패널만 열어 두고 생성은 사용자가)
         
         Returns:
-            dict: 결과 정보 (success, notebook_url, sources_added 등)
+            dict: 결과 정보 (success, notebook_url, sources_added, failed_urls 등)
         """
         result = {
             "success": False,
             "notebook_url": None,
             "sources_added": 0,
+            "failed_urls": [],
             "audio_generated": False,
         }
 
@@ -819,24 +1125,58 @@ class NotebookLMAgent:
             if not self.navigate_to_notebooklm():
                 return result
 
-            # 2. 노트북 열기 (기존 소스 삭제를 위해 '재생성' 수행)
-            if not self.recreate_notebook():
-                return result
+            # 2. 노트북 열기 — 동기화 모드는 기존 노트북에서 바뀐 소스만 삭제/추가,
+            #    기본 모드는 기존 소스 삭제를 위해 '재생성' 수행
+            if sync:
+                plan = self.sync_notebook(video_urls, titles=titles)
+                if plan is None:
+                    return result
+                to_add, kept = plan.missing, plan.keep
+                # 소스가 하나라도 바뀌었으면 어제 오디오를 재사용하지 않고 새로 생성
+                sources_changed = bool(plan.missing or plan.stale)
+            else:
+                if not self.recreate_notebook():
+                    return result
+                to_add, kept = video_urls, {}
+                sources_changed = True
 
             result["notebook_url"] = self.page.url
 
-            # 3. 소스 추가
-            result["sources_added"] = self.add_sources(video_urls)
+            # 3. 소스 추가 (유지한 소스는 이미 처리된 것으로 본다)
+            #    노트북 소스 한도를 넘는 URL은 "<이름> (2)", "(3)" ... 노트북으로 넘긴다
+            to_add, spillover = split_for_capacity(to_add, NOTEBOOK_SOURCE_LIMIT - len(kept))
+            added = self.add_sources(to_add, titles=titles) if to_add else 0
+            self.source_status.update({url: "ok" for url in kept})
+            self._record_manifest(kept, to_add)
+            result["sources_added"] = added + len(kept)
+
+            if spillover:
+                status = dict(self.source_status)
+                result["spillover"] = self._fill_spillover(spillover, titles, sync)
+                for extra in result["spillover"]:
+                    result["sources_added"] += extra["sources_added"]
+                    status.update(extra.pop("source_status"))
+                self.source_status = status
+                # 오디오 개요는 첫 노트북에서 준비
+                self.page.goto(result["notebook_url"], wait_until="domcontentloaded")
+                with WAIT_TRACKER.track("spillover.back_to_first", 3) as outcome:
+                    outcome["ok"] = wait_for_page_ready(self.page, NOTEBOOK_READY)
+            result["failed_urls"] = [u for u, status in self.source_status.items() if status != "ok"]
 
             if result["sources_added"] == 0:
                 print("⚠️ 소스를 추가하지 못했습니다. 오디오 생성을 건너뜁니다.")
                 return result
 
             # 4. 오디오 개요 생성
-            result["audio_generated"] = self.generate_audio_overview(max_wait_minutes=15)
+            if download_audio:
+                result["audio_file"] = self.generate_and_download_audio(max_wait_minutes=15,
+                                                                        regenerate=sources_changed)
+                result["audio_generated"] = result["audio_file"] is not None
+            else:
+                result["audio_generated"] = self.generate_audio_overview(max_wait_minutes=15)
 
             if result["audio_generated"]:
-                result["notebook_url"] = self.get_share_link()
+                result["notebook_url"] = self.get_audio_share_link()
                 result["success"] = True
 
             return result
@@ -855,8 +1195,13 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="NotebookLM 오디오 개요 생성")
     parser.add_argument("--test", action="store_true", help="테스트 모드")
     parser.add_argument("--visible", action="store_true", help="브라우저 표시")
+    parser.add_argument("--selector-report", action="store_true", help="셀렉터 적중률/지연 통계 출력 후 종료")
     args = parser.parse_args()
 
+    if args.selector_report:
+        print(SELECTOR_REGISTRY.report())
+        sys.exit(0)
+
     agent = NotebookLMAgent(headless=not args.visible)
 
     if args.test:
@@ -0,0 +1,104 @@
+"""
+NotebookLM Async Agent — 여러 노트북을 동시에 처리
+
+NotebookLMAgent는 실행 한 번에 노트북 하나("Daily new")만 만든다.
+AsyncNotebookLMAgent는 노트북 작업마다 NotebookLMAgent.run()을 워커 스레드에서 돌려
+동시에 진행한다. 단계 구현은 NotebookLMAgent 하나뿐이므로 청크 추가, --sync,
+소스 한도 초과 분할, 대기 기록, 오디오 다운로드가 그대로 적용된다.
+
+sync Playwright 객체는 만든 스레드에 묶이고, Chromium 프로필 폴더는 한 브라우저만 열 수 있으므로
+(한 브라우저 컨텍스트에 페이지 여러 개를 여는 대신) 워커마다 Chromium을 따로 띄우고
+프로필은 data/browser_state/worker_profiles/worker_<n>을 쓴다. 메모리도 워커 수만큼 든다.
+동시 실행 수는 max_concurrency로 제한한다.
+
+주의: 워커 프로필은 기본 프로필(browser_profile)의 로그인 세션을 공유하지 않는다.
+시작할 때마다 state.json 쿠키만 주입되므로, 쿠키가 만료됐거나 Google이 새 프로필을
+새 기기로 보고 재인증을 요구하면 워커 프로필마다 따로 로그인해야 한다
+(auth_manager.py setup으로 state.json을 갱신한 뒤 다시 실행).
+
+각 작업은 run()과 같은 형태의 result dict를 돌려준다 (notebook_name 추가).
+
+사용법:
+    jobs = [
+        {"notebook_name": "Daily us-stocks", "video_urls": [...], "titles": {url: title}},
+        {"notebook_name": "Daily real-estate", "video_urls": [...], "sync": True, "download_audio": True},
+    ]
+    results = asyncio.run(AsyncNotebookLMAgent(max_concurrency=3).run_many(jobs))
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from lib.config import WORKER_PROFILES_DIR
+from notebooklm_agent import NotebookLMAgent
+
+DEFAULT_CONCURRENCY = 3
+
+
+class AsyncNotebookLMAgent:
+    """노트북 작업 여러 개를 NotebookLMAgent 워커로 동시에 실행."""
+
+    def __init__(self, headless: bool = True, max_concurrency: int = DEFAULT_CONCURRENCY):
+        self.headless = headless
+        self.max_concurrency = max(1, max_concurrency)
+
+    def run_job(self, job: dict, profile_dir: Path) -> dict:
+        """
+        노트북 작업 하나를 현재 스레드에서 실행.
+        job: {"notebook_name": str, "video_urls": list[str], "titles": {url: title} (선택),
+              "sync": bool (선택), "download_audio": bool (선택)}
+        """
+        name = job["notebook_name"]
+        started = time.monotonic()
+        agent = NotebookLMAgent(notebook_name=name, headless=self.headless, profile_dir=profile_dir)
+        result = agent.run(
+            job["video_urls"],
+            titles=job.get("titles"),
+            sync=job.get("sync", False),
+            download_audio=job.get("download_audio", False),
+        )
+        print(f"  [{name}] ⏱️ {time.monotonic() - started:.1f}초")
+        return {"notebook_name": name, **result}
+
+    async def run_many(self, jobs: list[dict]) -> list[dict]:
+        """모든 작업을 최대 max_concurrency개씩 동시에 실행하고 작업 순서대로 결과 반환."""
+        print(f"📚 노트북 {len(jobs)}개 동시 처리 (최대 {self.max_concurrency}개씩)")
+        # 워커 슬롯마다 프로필 폴더 하나 — 동시에 같은 폴더를 여는 일이 없다
+        slots: asyncio.Queue[Path] = asyncio.Queue()
+        for n in range(1, min(self.max_concurrency, len(jobs)) + 1):
+            slots.put_nowait(WORKER_PROFILES_DIR / f"worker_{n}")
+
+        async def guarded(job: dict) -> dict:
+            profile_dir = await slots.get()
+            try:
+                return await asyncio.to_thread(self.run_job, job, profile_dir)
+            finally:
+                slots.put_nowait(profile_dir)
+
+        started = time.monotonic()
+        try:
+            return await asyncio.gather(*(guarded(job) for job in jobs))
+        finally:
+            print(f"⏱️ 전체 소요: {time.monotonic() - started:.1f}초")
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="NotebookLM 노트북 여러 개 동시 생성")
+    parser.add_argument("jobs", type=Path, help='작업 JSON 파일 ([{"notebook_name": ..., "video_urls": [...]}])')
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="동시 처리할 노트북 수")
+    parser.add_argument("--visible", action="store_true", help="브라우저 표시")
+    args = parser.parse_args()
+
+    jobs = json.loads(args.jobs.read_text(encoding="utf-8"))
+    agent = AsyncNotebookLMAgent(headless=not args.visible, max_concurrency=args.concurrency)
+    results = asyncio.run(agent.run_many(jobs))
+    for r in results:
+        print(f"  {'✅' if r['success'] else '⚠️'} {r['notebook_name']}: 소스 {r['sources_added']}개 | {r['notebook_url']}")
+    sys.exit(0 if all(r["success"] for r in results) else 1)
@@ -0,0 +1,835 @@
+"""
+NotebookLM Stand-in - 브라우저 단계 오프라인 벤치마크용 로컬 웹앱
+
+notebooklm_agent가 조작하는 NotebookLM 화면을 커밋된 디버그 덤프(debug_*.html)의
+DOM 구조 그대로 흉내낸다:
+- /                      홈 (welcome-page / project-grid, 노트북 카드, 카드 메뉴 → 삭제)
+- /notebook/<id>         노트북 (notebook-header 제목 입력, source-picker 소스 목록,
+                         소스 추가 대화상자의 textarea[formcontrolname="urls"], 스튜디오 패널)
+- /_/LabsTailwindUi/data/batchexecute?rpcids=...   페이지가 호출하는 RPC (JSON)
+- /_standin/audio/<id>.mp3                          생성된 오디오 개요 파일
+
+소스 처리 지연, 소스별 처리 실패율, 제출 오류율(대화상자에 "오류" 표시), 처리 중
+소스 추가 잠금, 오디오 생성 지연/실패율, 페이지·RPC 응답 지연을 조절할 수 있다.
+사용 예는 bench_notebooklm.py 참고. 단독 실행하면 일반 브라우저로 열어 볼 수 있다.
+"""
+
+import html
+import json
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+RPC_PATH = "/_/LabsTailwindUi/data/batchexecute"
+AUDIO_PATH = "/_standin/audio/"
+
+# 처리가 끝난 소스의 제목 (실제처럼 URL/영상 ID가 들어가지 않는다)
+_TITLE_TOPICS = ("미국 주식", "금리 인하", "엔비디아 실적", "부동산 전망", "환율", "반도체", "배당주", "원자재")
+_TITLE_FORMS = ("{} 총정리", "{} 지금 사도 될까?", "오늘의 {} 브리핑", "{} 핵심만 10분 요약", "{}, 전문가 긴급 진단")
+
+# 덤프의 스튜디오 패널 타일 (오디오 외에는 동작하지 않는 장식)
+_STUDIO_TILES = (
+    ("blue", "audio_magic_eraser", "AI 오디오 오버뷰", True),
+    ("green", "subscriptions", "동영상 개요", False),
+    ("pink", "flowchart", "마인드맵", False),
+    ("yellow", "auto_tab_group", "보고서", False),
+)
+
+
+def standin_video_title(url: str) -> str:
+    """url의 소스가 처리된 뒤 목록에 보일 제목 (url마다 고정)."""
+    rng = random.Random(url)
+    return f"{rng.choice(_TITLE_FORMS).format(rng.choice(_TITLE_TOPICS))} #{rng.randrange(1000)}"
+
+
+class NotebookLMStandin:
+    """NotebookLM 화면과 RPC를 흉내내는 로컬 서버 (백그라운드 스레드)."""
+
+    def __init__(
+        self,
+        source_latency_ms: float = 3000,
+        source_jitter_ms: float = 1000,
+        source_error_rate: float = 0.0,
+        submit_error_rate: float = 0.0,
+        lock_while_processing: bool = False,
+        source_limit: int = 50,
+        audio_latency_ms: float = 5000,
+        audio_error_rate: float = 0.0,
+        audio_kb: int = 256,
+        page_latency_ms: float = 50,
+        poll_ms: int = 500,
+        seed: int = 0,
+    ):
+        self.source_latency_ms = source_latency_ms
+        self.source_jitter_ms = source_jitter_ms
+        self.source_error_rate = source_error_rate
+        self.submit_error_rate = submit_error_rate
+        self.lock_while_processing = lock_while_processing
+        self.source_limit = source_limit
+        self.audio_latency_ms = audio_latency_ms
+        self.audio_error_rate = audio_error_rate
+        self.audio_kb = audio_kb
+        self.page_latency_ms = page_latency_ms
+        self.poll_ms = poll_ms
+        self.requests = Counter()
+        self._notebooks: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._rng = random.Random(seed)
+        self._audio_body: bytes | None = None
+        self._server: _Server | None = None
+        self._thread: threading.Thread | None = None
+
+    # ── 서버 수명 ──
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> str:
+        """서버를 임의 포트로 띄우고 base URL을 반환."""
+        self._server = _Server(("127.0.0.1", 0), _Handler)
+        self._server.standin = self
+        self._thread = threading.Thread(target=self._server.serve_forever, name="notebooklm-standin", daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    # ── 상태 ──
+
+    def add_notebook(self, title: str, urls: list[str] = (), failed: list[str] = ()) -> str:
+        """처리가 끝난 소스를 가진 노트북을 미리 만들어 둔다 (벤치마크 시작 상태)."""
+        with self._lock:
+            notebook = self._new_notebook(title)
+            for url in urls:
+                notebook["sources"].append(self._new_source(url, ready_at=0, fail=url in failed))
+            return notebook["id"]
+
+    def notebooks(self) -> list[dict]:
+        """현재 노트북과 소스 상태 (최신 생성 순)."""
+        with self._lock:
+            now = time.monotonic()
+            out = []
+            for notebook in self._ordered():
+                self._refresh(notebook, now)
+                out.append({
+                    "id": notebook["id"],
+                    "title": notebook["title"],
+                    "sources": [{"url": s["url"], "title": s["title"], "state": s["state"]} for s in notebook["sources"]],
+                    "audio": notebook["audio"]["state"] if notebook["audio"] else None,
+                })
+            return out
+
+    def _ordered(self) -> list[dict]:
+        return sorted(self._notebooks.values(), key=lambda n: n["created"], reverse=True)
+
+    def _new_notebook(self, title: str) -> dict:
+        notebook = {"id": str(uuid.uuid4()), "title": title, "created": time.time(), "sources": [], "audio": None}
+        self._notebooks[notebook["id"]] = notebook
+        return notebook
+
+    def _new_source(self, url: str, ready_at: float, fail: bool) -> dict:
+        source = {"id": uuid.uuid4().hex[:12], "url": url, "title": url, "state": "loading",
+                  "ready_at": ready_at, "fail": fail}
+        if ready_at <= time.monotonic():
+            self._settle(source)
+        return source
+
+    @staticmethod
+    def _settle(source: dict):
+        # 실패한 소스는 제목이 URL 그대로 남는다
+        source["state"] = "error" if source["fail"] else "ready"
+        if not source["fail"]:
+            source["title"] = standin_video_title(source["url"])
+
+    def _refresh(self, notebook: dict, now: float):
+        for source in notebook["sources"]:
+            if source["state"] == "loading" and source["ready_at"] <= now:
+                self._settle(source)
+        audio = notebook["audio"]
+        if audio and audio["state"] == "generating" and audio["ready_at"] <= now:
+            audio["state"] = "error" if audio["fail"] else "ready"
+
+    def _delay(self, mean_ms: float, jitter_ms: float = 0.0) -> float:
+        return max(0.0, mean_ms + self._rng.uniform(-jitter_ms, jitter_ms)) / 1000
+
+    def _public(self, notebook: dict) -> dict:
+        audio = notebook["audio"]
+        return {
+            "id": notebook["id"],
+            "title": notebook["title"],
+            "sources": [{"id": s["id"], "title": s["title"], "state": s["state"]} for s in notebook["sources"]],
+            "audio": None if audio is None else {
+                "state": audio["state"],
+                "title": f"{notebook['title']} 오디오 개요",
+                "src": f"{AUDIO_PATH}{audio['id']}.mp3",
+            },
+        }
+
+    # ── RPC ──
+
+    def rpc(self, name: str, payload: dict) -> tuple[int, dict]:
+        with self._lock:
+            now = time.monotonic()
+            if name == "create_notebook":
+                return 200, {"id": self._new_notebook("Untitled notebook")["id"]}
+
+            notebook = self._notebooks.get(payload.get("id", ""))
+            if notebook is None:
+                return 404, {"error": "노트북을 찾을 수 없습니다."}
+            self._refresh(notebook, now)
+
+            if name == "delete_notebook":
+                del self._notebooks[notebook["id"]]
+                return 200, {}
+            if name == "rename_notebook":
+                notebook["title"] = str(payload.get("title") or notebook["title"])
+                return 200, self._public(notebook)
+            if name == "add_sources":
+                urls = [u for u in payload.get("urls", []) if u]
+                if self.submit_error_rate and self._rng.random() < self.submit_error_rate:
+                    self.requests["injected_submit_error"] += 1
+                    return 200, {"error": "일부 URL을 가져올 수 없습니다. 다시 시도하세요."}
+                if len(notebook["sources"]) + len(urls) > self.source_limit:
+                    return 200, {"error": f"소스 한도({self.source_limit}개)를 초과했습니다."}
+                for url in urls:
+                    fail = self.source_error_rate > 0 and self._rng.random() < self.source_error_rate
+                    ready_at = now + self._delay(self.source_latency_ms, self.source_jitter_ms)
+                    notebook["sources"].append(self._new_source(url, ready_at, fail))
+                # 실제 RPC 응답처럼 제출한 URL이 본문에 들어 있다 (SourceTracker의 응답 확인용)
+                return 200, {**self._public(notebook), "urls": urls}
+            if name == "remove_source":
+                notebook["sources"] = [s for s in notebook["sources"] if s["id"] != payload.get("source")]
+                return 200, self._public(notebook)
+            if name == "generate_audio":
+                if not (notebook["audio"] and notebook["audio"]["state"] == "generating"):
+                    fail = self.audio_error_rate > 0 and self._rng.random() < self.audio_error_rate
+                    notebook["audio"] = {"id": uuid.uuid4().hex[:12], "state": "generating",
+                                         "ready_at": now + self._delay(self.audio_latency_ms), "fail": fail}
+                return 200, self._public(notebook)
+            if name == "notebook_state":
+                return 200, self._public(notebook)
+            return 400, {"error": f"unknown rpc: {name}"}
+
+    def audio_body(self) -> bytes:
+        """오디오 개요 파일 (ID3 헤더 + 무음 MP3 프레임을 audio_kb만큼)."""
+        if self._audio_body is None:
+            frame = b"\xff\xfb\x90\x00" + bytes(413)
+            body = b"ID3\x04\x00\x00\x00\x00\x00\x00"
+            body += frame * (self.audio_kb * 1024 // len(frame) + 1)
+            self._audio_body = body[:self.audio_kb * 1024]
+        return self._audio_body
+
+    def has_audio(self, audio_id: str) -> bool:
+        with self._lock:
+            return any(n["audio"] and n["audio"]["id"] == audio_id and n["audio"]["state"] == "ready"
+                       for n in self._notebooks.values())
+
+    # ── 페이지 ──
+
+    def home_html(self) -> str:
+        with self._lock:
+            cards = "".join(_project_card(n) for n in self._ordered())
+        body = (
+            "<welcome-page>"
+            + _page_header("")
+            + '<div class="project-section-title mat-headline-small">최근 노트북</div>'
+            + "<project-grid>"
+            + '<mat-card appearance="outlined" role="button" tabindex="0" '
+              'class="mat-mdc-card mdc-card create-new-action-button mat-mdc-card-outlined">'
+              '<mat-card-content class="mat-mdc-card-content create-new-action-button-content">'
+              '<div class="create-new-action-button-icon-container">'
+              '<mat-icon aria-hidden="true" class="mat-icon google-symbols">add</mat-icon></div>'
+              '<span class="mat-title-large">새 노트 만들기</span></mat-card-content></mat-card>'
+            + cards
+            + "</project-grid></welcome-page>"
+        )
+        return _document("NotebookLM", body, {"page": "home"})
+
+    def notebook_html(self, notebook_id: str) -> str | None:
+        with self._lock:
+            notebook = self._notebooks.get(notebook_id)
+            if notebook is None:
+                return None
+            self._refresh(notebook, time.monotonic())
+            state = self._public(notebook)
+        title = html.escape(state["title"])
+        tiles = "".join(_studio_tile(*tile) for tile in _STUDIO_TILES)
+        body = (
+            "<notebook>"
+            '<notebook-header><div class="notebook-header-container">'
+            + _page_header(
+                '<editable-project-title><div class="title">'
+                f'<div aria-hidden="true" class="title-label"><span class="title-label-inner mat-title-large">{title}</span></div>'
+                f'<input class="title-input mat-title-large" value="{title}"></div></editable-project-title>'
+            )
+            + '<div class="notebook-header-buttons-container second-row-buttons">'
+              '<button mat-flat-button="" aria-label="노트북 만들기" class="mdc-button mat-mdc-button-base create-notebook-button">'
+              '<mat-icon aria-hidden="true" class="mat-icon google-symbols">add</mat-icon>'
+              '<span class="mdc-button__label"><span>노트북 만들기</span></span></button></div>'
+              "</div></notebook-header>"
+            # 3단 레이아웃: 출처 | 채팅 | 스튜디오
+            + '<div class="panels">'
+              '<section class="source-panel"><source-picker><div class="contents"><div class="button-row">'
+              '<button mat-stroked-button="" mattooltip="출처 추가" aria-label="출처 추가" '
+              'class="mdc-button mat-mdc-button-base add-source-button mdc-button--outlined">'
+              '<mat-icon aria-hidden="true" class="mat-icon google-symbols">add</mat-icon>'
+              '<span class="mdc-button__label"> 소스 추가 </span></button></div>'
+              '<div class="scroll-area-desktop"></div></div></source-picker></section>'
+              '<section class="chat-panel-section"><chat-panel><div class="chat-panel-header">'
+              '<span class="mat-title-medium">채팅</span>'
+              '<button mat-icon-button="" mattooltip="노트북 구성" aria-label="노트북 구성" '
+              'class="mdc-icon-button mat-mdc-icon-button configure-settings-button">'
+              '<mat-icon aria-hidden="true" class="mat-icon google-symbols">tune</mat-icon></button></div>'
+              '<query-box><div class="query-box"><textarea class="query-box-input" aria-label="쿼리 상자" '
+              'placeholder="입력을 시작하세요..." rows="1"></textarea></div></query-box></chat-panel></section>'
+              '<section class="studio-panel-section"><studio-panel><div class="panel-content-scrollable">'
+              f'<div class="create-artifact-buttons-container">{tiles}</div>'
+              '<div class="artifact-library"></div></div></studio-panel></section>'
+              "</div></notebook>"
+        )
+        return _document(f"{state['title']} - NotebookLM", body, {
+            "page": "notebook", "notebook": state["id"], "state": state,
+            "poll": self.poll_ms, "lock": self.lock_while_processing,
+        })
+
+    # ── 요청 처리 보조 ──
+
+    def simulate_latency(self):
+        with self._lock:
+            delay = self._delay(self.page_latency_ms, self.page_latency_ms * 0.2)
+        if delay > 0:
+            time.sleep(delay)
+
+    def count(self, kind: str):
+        with self._lock:
+            self.requests[kind] += 1
+
+
+def _page_header(middle: str) -> str:
+    return (
+        '<page-header><div class="container"><div class="logo logo__icon">'
+        '<a routerlink="/" aria-label="NotebookLM 홈페이지" class="logo-link" href="/">'
+        '<labs-tailwind-logo><span class="logo-text">NotebookLM</span></labs-tailwind-logo></a></div>'
+        f'<div class="title-container"><div class="title mat-title-large">{middle}</div></div>'
+        '<div class="notebook-header-buttons-container"><title-bar-settings><div class="container">'
+        '<extendable-button iconname="settings" aria-label="설정" class="settings-button">'
+        '<button matbutton="tonal" class="mdc-button mat-mdc-button-base mat-mdc-menu-trigger extendable-button" '
+        'aria-label="설정" aria-haspopup="menu"><mat-icon aria-hidden="true" class="mat-icon google-symbols">'
+        "settings</mat-icon></button></extendable-button></div></title-bar-settings></div></div></page-header>"
+    )
+
+
+def _project_card(notebook: dict) -> str:
+    # 덤프의 project-button 구조 (제목은 .project-button-title, 메뉴는 .project-button-more)
+    pid = f"project-{notebook['id']}"
+    title = html.escape(notebook["title"])
+    created = datetime.fromtimestamp(notebook["created"])
+    return (
+        f'<project-button class="project-button" data-id="{notebook["id"]}">'
+        '<mat-card class="mat-mdc-card mdc-card project-button-card blue-background">'
+        f'<button matripple="" tabindex="0" class="mat-ripple primary-action-button" aria-labelledby="{pid}-title"></button>'
+        '<div class="project-button-box"><div aria-hidden="true" class="project-button-box-icon">📓</div>'
+        '<project-action-button><button mat-button="" aria-label="프로젝트 작업 메뉴" '
+        'class="mdc-button mat-mdc-button-base mat-mdc-menu-trigger project-button-more mat-mdc-button" '
+        'aria-haspopup="menu" aria-expanded="false">'
+        '<mat-icon aria-hidden="true" class="mat-icon project-button-more-icon google-symbols">more_vert</mat-icon>'
+        "</button></project-action-button></div>"
+        f'<div><span class="project-button-title" id="{pid}-title"> {title} </span></div>'
+        f'<div class="project-button-subtitle" id="{pid}-subtitle">'
+        f'<span class="project-button-subtitle-part">{created.year}. {created.month}. {created.day}.</span>'
+        '<span class="project-button-subtitle-middle-dot">·</span>'
+        f'<span class="project-button-subtitle-part project-button-subtitle-part-sources">소스 {len(notebook["sources"])}개</span>'
+        "</div></mat-card></project-button>"
+    )
+
+
+def _studio_tile(color: str, icon: str, label: str, editable: bool) -> str:
+    edit = (
+        f'<button mat-icon-button="" class="mdc-icon-button mat-mdc-icon-button edit-button" aria-label="{label} 맞춤설정">'
+        '<mat-icon aria-hidden="true" class="mat-icon google-symbols">edit</mat-icon></button>'
+    ) if editable else ""
+    return (
+        "<basic-create-artifact-button>"
+        f'<div role="button" tabindex="0" class="create-artifact-button-container {color} mat-label-medium" aria-label="{label}">'
+        '<span class="default-container"><span class="icon-container"><span class="icon-container-row">'
+        f'<mat-icon aria-hidden="true" class="mat-icon google-symbols"> {icon} </mat-icon></span>'
+        f'<span class="create-label-container mat-label-medium"> {label} </span></span>'
+        f'<div class="option-icon">{edit}</div></span></div></basic-create-artifact-button>'
+    )
+
+
+def _document(title: str, body: str, config: dict) -> str:
+    config_json = json.dumps(config, ensure_ascii=False).replace("</", "<\\/")
+    return (
+        '<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8">'
+        f"<title>{html.escape(title)}</title><style>{_CSS}</style></head>"
+        f'<body class="mat-app-background"><labs-tailwind-root>{body}</labs-tailwind-root>'
+        '<div class="cdk-overlay-container"></div>'
+        f"<script>window.__standin = {config_json};</script><script>{_APP_JS}</script></body></html>"
+    )
+
+
+_CSS = """
+labs-tailwind-root, welcome-page, project-grid, project-button, mat-card, mat-card-content, notebook,
+notebook-header, page-header, editable-project-title, title-bar-settings, extendable-button,
+source-picker, chat-panel, query-box, studio-panel, basic-create-artifact-button, add-sources-dialog,
+mat-dialog-container, mat-form-field, mat-chip-set, artifact-library-item, audio-player { display: block; }
+body { margin: 0; font-family: sans-serif; font-size: 14px; }
+button { cursor: pointer; }
+mat-icon { font-size: 12px; color: #666; }
+page-header .container { display: flex; align-items: center; gap: 12px; padding: 8px 16px; }
+.title-input { font-size: 18px; width: 240px; }
+.title-label { display: none; }
+project-grid { display: flex; flex-wrap: wrap; gap: 16px; padding: 16px; }
+project-grid > mat-card, project-button { width: 220px; }
+mat-card { border: 1px solid #ccc; border-radius: 12px; padding: 12px; cursor: pointer; }
+.primary-action-button { position: absolute; width: 0; height: 0; padding: 0; border: 0; }
+.project-button-box { display: flex; justify-content: space-between; }
+.project-button-title { font-size: 16px; }
+.panels { display: grid; grid-template-columns: 1fr 2fr 1fr; gap: 12px; padding: 12px; }
+.panels > section { border: 1px solid #ddd; border-radius: 12px; padding: 12px; min-height: 300px; }
+.single-source-container { display: flex; align-items: center; gap: 8px; padding: 4px 0; }
+.source-title-column { flex: 1; }
+mat-progress-spinner { display: inline-block; width: 12px; height: 12px; border: 2px solid #999;
+  border-top-color: transparent; border-radius: 50%; }
+query-box textarea { width: 100%; }
+.create-artifact-button-container { border: 1px solid #ddd; border-radius: 8px; padding: 8px; margin: 4px 0;
+  display: flex; justify-content: space-between; cursor: pointer; }
+.artifact-library { margin-top: 12px; }
+.cdk-overlay-container { position: fixed; inset: 0; pointer-events: none; z-index: 1000; }
+.cdk-global-overlay-wrapper { position: absolute; inset: 0; }
+.cdk-overlay-backdrop { position: absolute; inset: 0; pointer-events: auto; }
+.cdk-overlay-dark-backdrop { background: rgba(0, 0, 0, 0.32); }
+.cdk-overlay-pane { position: absolute; top: 15%; left: 50%; transform: translateX(-50%); pointer-events: auto;
+  background: #fff; border-radius: 12px; padding: 16px; min-width: 360px; box-shadow: 0 4px 16px rgba(0,0,0,.3); }
+dialog { position: static; display: block; border: 0; padding: 0; }
+.mat-mdc-menu-item { display: flex; gap: 8px; width: 100%; border: 0; background: none; padding: 8px; text-align: left; }
+.source-type-chip { display: inline-flex; gap: 4px; border: 1px solid #ccc; border-radius: 8px; padding: 6px 10px;
+  margin: 4px; cursor: pointer; }
+textarea[formcontrolname="urls"] { width: 100%; }
+.dialog-error { color: #b3261e; }
+.mat-mdc-dialog-actions { display: flex; justify-content: flex-end; gap: 8px; margin-top: 12px; }
+"""
+
+# 화면 동작: 카드/메뉴/대화상자, 소스 행 갱신(변경된 행만 고친다), 처리 중에는 RPC를 주기적으로 폴링
+_APP_JS = r"""
+(() => {
+  const S = window.__standin || {};
+  const overlayRoot = document.querySelector('.cdk-overlay-container');
+  const esc = (s) => String(s).replace(/[&<>"']/g, (c) => ({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}[c]));
+  const rpc = async (name, payload) => {
+    const res = await fetch('/_/LabsTailwindUi/data/batchexecute?rpcids=' + name, {
+      method: 'POST', headers: {'Content-Type': 'application/json'}, body: JSON.stringify(payload || {}),
+    });
+    return res.json();
+  };
+
+  // ── 오버레이 (메뉴 / 대화상자) ──
+  const overlays = [];
+  const closeOverlay = (entry) => {
+    const i = overlays.indexOf(entry);
+    if (i < 0) return;
+    overlays.splice(i, 1);
+    entry.wrapper.remove();
+  };
+  const openOverlay = (inner, dark) => {
+    const wrapper = document.createElement('div');
+    wrapper.className = 'cdk-global-overlay-wrapper';
+    wrapper.innerHTML = '<div class="cdk-overlay-backdrop ' + (dark ? 'cdk-overlay-dark-backdrop' : 'cdk-overlay-transparent-backdrop')
+      + ' cdk-overlay-backdrop-showing"></div><div class="cdk-overlay-pane' + (dark ? ' mat-mdc-dialog-panel' : '') + '">' + inner + '</div>';
+    overlayRoot.appendChild(wrapper);
+    const entry = {wrapper, pane: wrapper.querySelector('.cdk-overlay-pane')};
+    overlays.push(entry);
+    wrapper.querySelector('.cdk-overlay-backdrop').addEventListener('click', () => closeOverlay(entry));
+    return entry;
+  };
+  document.addEventListener('keydown', (e) => {
+    if (e.key === 'Escape' && overlays.length) closeOverlay(overlays[overlays.length - 1]);
+  });
+  const openMenu = (items) => {
+    const entry = openOverlay('<div class="mat-mdc-menu-panel" role="menu"><div class="mat-mdc-menu-content">'
+      + items.map((item, i) => '<button role="menuitem" class="mat-mdc-menu-item" data-item="' + i + '">'
+        + '<mat-icon aria-hidden="true" class="mat-icon google-symbols">' + item.icon + '</mat-icon>'
+        + '<span class="mat-mdc-menu-item-text">' + esc(item.label) + '</span></button>').join('')
+      + '</div></div>', false);
+    entry.pane.querySelectorAll('[role="menuitem"]').forEach((el) => el.addEventListener('click', () => {
+      closeOverlay(entry);
+      items[Number(el.dataset.item)].action();
+    }));
+  };
+  const openConfirm = (title, message, confirmLabel, action) => {
+    const entry = openOverlay('<mat-dialog-container role="dialog" class="mat-mdc-dialog-container mdc-dialog--open">'
+      + '<dialog open class="confirm-dialog"><h2 class="mat-mdc-dialog-title">' + esc(title) + '</h2>'
+      + '<div class="mat-mdc-dialog-content">' + esc(message) + '</div><div class="mat-mdc-dialog-actions">'
+      + '<button class="mat-mdc-button cancel-button">취소</button>'
+      + '<button class="mat-mdc-unelevated-button mat-primary confirm-button">' + esc(confirmLabel) + '</button>'
+      + '</div></dialog></mat-dialog-container>', true);
+    entry.pane.querySelector('.cancel-button').addEventListener('click', () => closeOverlay(entry));
+    entry.pane.querySelector('.confirm-button').addEventListener('click', async () => {
+      await action();
+      closeOverlay(entry);
+    });
+  };
+
+  // ── 홈 ──
+  if (S.page === 'home') {
+    document.querySelector('.create-new-action-button').addEventListener('click', async () => {
+      const created = await rpc('create_notebook');
+      location.href = '/notebook/' + created.id + '?addSource=true';
+    });
+    document.querySelectorAll('project-button').forEach((card) => {
+      const id = card.dataset.id;
+      card.querySelector('mat-card').addEventListener('click', (e) => {
+        if (!e.target.closest('project-action-button')) location.href = '/notebook/' + id;
+      });
+      card.querySelector('.project-button-more').addEventListener('click', (e) => {
+        e.stopPropagation();
+        const title = card.querySelector('.project-button-title').textContent.trim();
+        openMenu([
+          {icon: 'edit', label: '제목 수정', action: () => {}},
+          {icon: 'delete', label: '삭제', action: () => openConfirm(
+            '노트북을 삭제하시겠습니까?', '"' + title + '" 노트북과 모든 소스가 영구적으로 삭제됩니다.', '삭제',
+            async () => { await rpc('delete_notebook', {id}); card.remove(); })},
+        ]);
+      });
+    });
+    return;
+  }
+
+  // ── 노트북 ──
+  const nb = S.notebook;
+  const rowsEl = document.querySelector('.scroll-area-desktop');
+  const addButton = document.querySelector('.add-source-button');
+  const library = document.querySelector('.artifact-library');
+  const rows = new Map();   // 소스 id → 행
+  let pollTimer = null;
+
+  const createRow = (source) => {
+    const row = document.createElement('div');
+    row.className = 'single-source-container';
+    row.tabIndex = 0;
+    row.innerHTML = '<div class="icon-and-menu-container"><div class="source-item-menu-button-visible">'
+      + '<button mat-icon-button="" type="button" aria-label="더보기" aria-haspopup="menu" '
+      + 'class="mdc-icon-button mat-mdc-icon-button mat-mdc-menu-trigger source-item-more-button"><div>'
+      + '<mat-icon aria-hidden="true" class="mat-icon source-item-more-menu-icon google-symbols">more_vert</mat-icon>'
+      + '<mat-icon aria-hidden="true" class="mat-icon source-item-source-icon icon google-symbols"></mat-icon>'
+      + '</div></button></div></div>'
+      + '<div class="source-title-column"><div class="source-title"><span aria-hidden="true"></span></div></div>'
+      + '<div class="select-checkbox-container"><input type="checkbox" class="mdc-checkbox__native-control" checked></div>';
+    row.querySelector('.source-item-more-button').addEventListener('click', (e) => {
+      e.stopPropagation();
+      openMenu([
+        {icon: 'delete', label: '소스 삭제', action: () => openConfirm(
+          '소스를 삭제하시겠습니까?', row.querySelector('.source-title').getAttribute('aria-label'), '삭제',
+          async () => applySources((await rpc('remove_source', {id: nb, source: source.id})).sources))},
+        {icon: 'edit', label: '소스 이름 바꾸기', action: () => {}},
+      ]);
+    });
+    return row;
+  };
+
+  const updateRow = (row, source) => {
+    const key = source.state + '|' + source.title;
+    if (row.dataset.key === key) return;
+    row.dataset.key = key;
+    const titleEl = row.querySelector('.source-title');
+    titleEl.setAttribute('aria-label', source.title);
+    titleEl.firstElementChild.textContent = source.title;
+    row.querySelector('input[type="checkbox"]').setAttribute('aria-label', source.title);
+    row.querySelector('.source-item-source-icon').textContent =
+      source.state === 'error' ? 'error' : (source.state === 'ready' ? 'video_youtube' : '');
+    row.classList.toggle('single-source-error-container', source.state === 'error');
+    const spinner = row.querySelector('mat-progress-spinner');
+    if (source.state === 'loading' && !spinner) {
+      const el = document.createElement('mat-progress-spinner');
+      el.className = 'mat-mdc-progress-spinner';
+      el.setAttribute('role', 'progressbar');
+      el.setAttribute('mode', 'indeterminate');
+      row.querySelector('.icon-and-menu-container').appendChild(el);
+    } else if (source.state !== 'loading' && spinner) {
+      spinner.remove();
+    }
+  };
+
+  const applySources = (sources) => {
+    const seen = new Set();
+    sources.forEach((source) => {
+      seen.add(source.id);
+      let row = rows.get(source.id);
+      if (!row) {
+        row = createRow(source);
+        rows.set(source.id, row);
+        rowsEl.appendChild(row);
+      }
+      updateRow(row, source);
+    });
+    rows.forEach((row, id) => {
+      if (!seen.has(id)) { row.remove(); rows.delete(id); }
+    });
+    // 처리 중 잠금: 소스가 처리되는 동안 추가 버튼을 막는다
+    addButton.disabled = !!S.lock && sources.some((s) => s.state === 'loading');
+  };
+
+  let audioKey = null;
+  const applyAudio = (audio) => {
+    const key = audio ? audio.state + '|' + audio.src : '';
+    if (key === audioKey) return;
+    audioKey = key;
+    if (!audio) {
+      library.innerHTML = '';
+    } else if (audio.state === 'generating') {
+      library.innerHTML = '<artifact-library-item class="artifact-item audio-generating">'
+        + '<mat-icon aria-hidden="true" class="mat-icon google-symbols">audio_magic_eraser</mat-icon>'
+        + '<span class="artifact-title">AI 오디오 오버뷰 생성 중...</span>'
+        + '<mat-progress-spinner role="progressbar" mode="indeterminate" class="mat-mdc-progress-spinner"></mat-progress-spinner>'
+        + '</artifact-library-item>';
+    } else if (audio.state === 'error') {
+      library.innerHTML = '<artifact-library-item class="artifact-item">'
+        + '<mat-icon aria-hidden="true" class="mat-icon google-symbols">error</mat-icon>'
+        + '<span class="artifact-title">오디오 개요를 생성하지 못했습니다. 다시 시도해 주세요.</span></artifact-library-item>';
+    } else {
+      library.innerHTML = '<audio-player class="artifact-item"><span class="artifact-title">' + esc(audio.title) + '</span>'
+        + '<audio preload="none" src="' + audio.src + '"></audio>'
+        + '<button mat-icon-button="" aria-label="재생" class="mdc-icon-button mat-mdc-icon-button play-button">'
+        + '<mat-icon aria-hidden="true" class="mat-icon google-symbols">play_arrow</mat-icon></button>'
+        + '<button mat-icon-button="" aria-label="더보기" aria-haspopup="menu" class="mdc-icon-button mat-mdc-icon-button mat-mdc-menu-trigger">'
+        + '<mat-icon aria-hidden="true" class="mat-icon google-symbols">more_vert</mat-icon></button></audio-player>';
+      library.querySelector('[aria-label="더보기"]').addEventListener('click', () => openMenu([
+        {icon: 'download', label: '다운로드', action: () => {
+          const link = document.createElement('a');
+          link.href = audio.src + '?download=1';
+          link.download = '';
+          document.body.appendChild(link);
+          link.click();
+          link.remove();
+        }},
+      ]));
+    }
+  };
+
+  const busy = (state) => state.sources.some((s) => s.state === 'loading')
+    || (state.audio && state.audio.state === 'generating');
+  const poll = async () => {
+    pollTimer = null;
+    let state;
+    try {
+      state = await rpc('notebook_state', {id: nb});
+    } catch (e) {
+      schedulePoll();
+      return;
+    }
+    applySources(state.sources);
+    applyAudio(state.audio);
+    if (busy(state)) schedulePoll();
+  };
+  const schedulePoll = () => {
+    if (!pollTimer) pollTimer = setTimeout(poll, S.poll);
+  };
+
+  // 소스 추가 대화상자: 소스 유형 → 웹사이트/YouTube URL 입력 → 삽입
+  const openAddSources = () => {
+    const entry = openOverlay('<mat-dialog-container role="dialog" class="mat-mdc-dialog-container mdc-dialog--open">'
+      + '<add-sources-dialog class="mat-mdc-dialog-component-host"><div class="dialog-container"></div>'
+      + '</add-sources-dialog></mat-dialog-container>', true);
+    const body = entry.pane.querySelector('.dialog-container');
+    const closeButton = '<button aria-label="닫기" mat-icon-button="" class="mdc-icon-button mat-mdc-icon-button close-button">'
+      + '<mat-icon aria-hidden="true" class="mat-icon google-symbols">close</mat-icon></button>';
+    const wireClose = () => body.querySelector('.close-button').addEventListener('click', () => closeOverlay(entry));
+
+    const showUrlForm = () => {
+      body.innerHTML = '<div mat-dialog-content="" class="mat-mdc-dialog-content"><div class="state-header">'
+        + '<button mat-icon-button="" aria-label="뒤로" class="mdc-icon-button mat-mdc-icon-button back-button">'
+        + '<mat-icon aria-hidden="true" class="mat-icon google-symbols">arrow_back</mat-icon></button>'
+        + '<span class="mat-title-large">웹사이트 및 YouTube URL</span></div>'
+        + '<div class="mat-body-large urls-subheader">NotebookLM에 소스로 업로드할 웹사이트 및 YouTube URL을 아래에 붙여넣으세요</div>'
+        + '<div class="urls-container"><mat-form-field appearance="outline" class="mat-mdc-form-field urls-input">'
+        + '<textarea matinput="" rows="7" formcontrolname="urls" aria-label="URL 입력" placeholder="링크를 붙여넣으세요." '
+        + 'class="mat-mdc-input-element mat-mdc-form-field-textarea-control mdc-text-field__input"></textarea></mat-form-field>'
+        + '<div class="mat-body-small urls-notes"><ul><li>여러 URL을 추가하려면 공백이나 줄 바꿈으로 구분하세요.</li>'
+        + '<li>공개 YouTube 동영상만 지원됩니다.</li></ul></div></div>'
+        + '<div class="dialog-error" role="alert"></div></div>'
+        + '<div mat-dialog-actions="" align="end" class="mat-mdc-dialog-actions">'
+        + '<button mat-flat-button="" color="primary" type="button" class="mdc-button mat-mdc-button-base mat-mdc-unelevated-button mat-primary" disabled>'
+        + '<span class="mdc-button__label">삽입</span></button></div>' + closeButton;
+      wireClose();
+      const textarea = body.querySelector('textarea');
+      const insert = body.querySelector('.mat-primary');
+      const errorEl = body.querySelector('.dialog-error');
+      body.querySelector('.back-button').addEventListener('click', showTypes);
+      textarea.addEventListener('input', () => { insert.disabled = !textarea.value.trim(); });
+      insert.addEventListener('click', async () => {
+        insert.disabled = true;
+        const result = await rpc('add_sources', {id: nb, urls: textarea.value.split(/\s+/).filter(Boolean)});
+        if (result.error) {
+          errorEl.textContent = '오류: ' + result.error;
+          insert.disabled = false;
+          return;
+        }
+        closeOverlay(entry);
+        applySources(result.sources);
+        schedulePoll();
+      });
+      textarea.focus();
+    };
+
+    const showTypes = () => {
+      const chips = [['drive', 'Google Drive', ''], ['web', '웹사이트', 'url'], ['video_youtube', 'YouTube', 'url'],
+                     ['content_paste', '복사된 텍스트', '']];
+      body.innerHTML = '<div mat-dialog-content="" class="mat-mdc-dialog-content"><span class="mat-title-large">소스 추가</span>'
+        + '<div class="mat-body-large">소스를 추가하면 NotebookLM이 가장 중요한 정보를 바탕으로 응답을 제공합니다.</div>'
+        + '<mat-chip-set class="source-type-chips">'
+        + chips.map(([icon, label, kind]) => '<mat-chip role="button" tabindex="0" class="mat-mdc-chip source-type-chip" data-kind="' + kind + '">'
+          + '<mat-icon aria-hidden="true" class="mat-icon google-symbols">' + icon + '</mat-icon>'
+          + '<span class="mdc-evolution-chip__text-label">' + label + '</span></mat-chip>').join('')
+        + '</mat-chip-set></div>' + closeButton;
+      wireClose();
+      body.querySelectorAll('.source-type-chip').forEach((chip) => chip.addEventListener('click', () => {
+        if (chip.dataset.kind === 'url') showUrlForm();
+      }));
+    };
+    showTypes();
+  };
+
+  addButton.addEventListener('click', openAddSources);
+
+  const titleInput = document.querySelector('input.title-input');
+  titleInput.addEventListener('keydown', (e) => { if (e.key === 'Enter') titleInput.blur(); });
+  titleInput.addEventListener('change', async () => {
+    const state = await rpc('rename_notebook', {id: nb, title: titleInput.value.trim()});
+    document.title = state.title + ' - NotebookLM';
+  });
+
+  // 채팅의 '노트북 구성' (tune 아이콘) — 스튜디오와 무관한 대화상자
+  document.querySelector('.configure-settings-button').addEventListener('click', () => {
+    const entry = openOverlay('<mat-dialog-container role="dialog" class="mat-mdc-dialog-container mdc-dialog--open">'
+      + '<chat-config-dialog><span class="mat-title-large">노트북 구성</span>'
+      + '<div class="mat-body-medium">대화 목표</div><div class="goal-options">'
+      + '<button class="goal-option">기본값</button><button class="goal-option">학습 가이드</button>'
+      + '<button class="goal-option">사용자 지정</button></div><div class="mat-mdc-dialog-actions">'
+      + '<button class="mat-mdc-unelevated-button mat-primary save-button">저장</button></div>'
+      + '</chat-config-dialog></mat-dialog-container>', true);
+    entry.pane.querySelector('.save-button').addEventListener('click', () => closeOverlay(entry));
+  });
+
+  // 스튜디오: 오디오 타일을 누르면 바로 생성 시작 (연필 버튼은 맞춤설정 — 여기서는 동작 없음)
+  document.querySelector('[aria-label="AI 오디오 오버뷰"]').addEventListener('click', async (e) => {
+    if (e.target.closest('.edit-button')) return;
+    applyAudio((await rpc('generate_audio', {id: nb})).audio);
+    schedulePoll();
+  });
+
+  applySources(S.state.sources);
+  applyAudio(S.state.audio);
+  if (busy(S.state)) schedulePoll();
+  if (new URLSearchParams(location.search).get('addSource') === 'true') openAddSources();
+})();
+"""
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # 브라우저가 페이지를 떠나며 연결을 끊는 것은 정상 동작
+        if isinstance(sys.exc_info()[1], (ConnectionResetError, BrokenPipeError)):
+            return
+        super().handle_error(request, client_address)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: bytes = b"", content_type: str = "text/html; charset=utf-8",
+              headers: dict | None = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if body and self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _dispatch(self):
+        standin: NotebookLMStandin = self.server.standin
+        parts = urlsplit(self.path)
+        query = parse_qs(parts.query)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+
+        if parts.path == RPC_PATH and self.command == "POST":
+            name = query.get("rpcids", [""])[0]
+            standin.count(f"rpc:{name}")
+            standin.simulate_latency()
+            try:
+                payload = json.loads(body or b"{}")
+            except ValueError:
+                self._send(400, b'{"error": "bad json"}', "application/json")
+                return
+            status, result = standin.rpc(name, payload)
+            self._send(status, json.dumps(result, ensure_ascii=False).encode("utf-8"), "application/json; charset=utf-8")
+        elif parts.path.startswith(AUDIO_PATH):
+            standin.count("audio")
+            audio_id = parts.path[len(AUDIO_PATH):].removesuffix(".mp3")
+            if not standin.has_audio(audio_id):
+                self._send(404, b"no such audio")
+                return
+            headers = {"Content-Disposition": 'attachment; filename="Audio_Overview.mp3"'} if "download" in query else None
+            self._send(200, standin.audio_body(), "audio/mpeg", headers)
+        elif parts.path == "/":
+            standin.count("page:home")
+            standin.simulate_latency()
+            self._send(200, standin.home_html().encode("utf-8"))
+        elif parts.path.startswith("/notebook/"):
+            standin.count("page:notebook")
+            standin.simulate_latency()
+            page = standin.notebook_html(parts.path[len("/notebook/"):].strip("/"))
+            if page is None:
+                self._send(302, headers={"Location": "/"})
+                return
+            self._send(200, page.encode("utf-8"))
+        else:
+            standin.count("not_found")
+            self._send(404, b"not found")
+
+    do_GET = _dispatch
+    do_POST = _dispatch
+    do_HEAD = _dispatch
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="NotebookLM stand-in 서버 단독 실행")
+    parser.add_argument("--source-latency-ms", type=float, default=3000)
+    parser.add_argument("--source-error-rate", type=float, default=0.0)
+    parser.add_argument("--audio-latency-ms", type=float, default=5000)
+    parser.add_argument("--notebooks", type=int, default=3, help="미리 만들어 둘 노트북 수")
+    args = parser.parse_args()
+
+    standin = NotebookLMStandin(source_latency_ms=args.source_latency_ms, source_error_rate=args.source_error_rate,
+                                audio_latency_ms=args.audio_latency_ms)
+    for n in range(args.notebooks):
+        standin.add_notebook(f"Stand-in notebook {n + 1}",
+                             [f"https://www.youtube.com/watch?v=sn{n:02d}v{i:06d}" for i in range(3)])
+    print(f"🧪 NotebookLM stand-in: {standin.start()}  (종료: Ctrl+C)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        standin.stop()
@@ -13,16 +13,18 @@ import json
 import re
 import sys
 import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
+from urllib.parse import urlsplit
 
 # Windows 콘솔 인코딩 문제 방지 (cp949 → utf-8)
 if sys.platform == "win32":
     sys.stdout.reconfigure(encoding="utf-8", errors="replace")
     sys.stderr.reconfigure(encoding="utf-8", errors="replace")
 
-import feedparser
-import requests
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api._errors import (
     TranscriptsDisabled,
@@ -30,18 +32,38 @@ from youtube_transcript_api._errors import (
     VideoUnavailable,
 )
 
-# v1.2.4: 인스턴스 기반 API
-ytt_api = YouTubeTranscriptApi()
+from lib.atom_parser import parse_recent_entries
+from lib.cache import ChannelIdCache, FeedCache
+from lib.channel_registry import ChannelRegistry
+from lib.http_session import get_session, pooled_session
+from lib.transcript_store import TranscriptStore
+from lib.video_index import VideoIndex
+
+# 모든 연구 단계 HTTP 호출(채널 페이지, RSS, 자막)이 공유하는 연결 풀 세션
+# keep-alive/TLS 세션 재사용 + 공통 타임아웃/재시도 정책
+http = get_session()
+
+# v1.2.4: 인스턴스 기반 API — 스레드 안전하지 않고 생성자가 세션 헤더(Accept-Language)를 바꾸므로
+# 스레드마다 따로 만들고, 공유 세션의 연결 풀만 쓰는 자기 세션을 준다 (_transcript_api 참고)
+_ytt_local = threading.local()
+
+# 피드 조건부 요청(ETag/Last-Modified) 캐시 — data/feed_cache.json
+FEED_CACHE = FeedCache()
+
+# 핸들 → channel_id 캐시 (TTL 30일) — data/channel_ids.json
+CHANNEL_ID_CACHE = ChannelIdCache()
+
+# 처리 완료 영상 인덱스 (증분 수집용) — data/video_index.db
+VIDEO_INDEX = VideoIndex()
+
+# 압축 자막 저장소 (synthesis_agent가 읽음) — data/transcripts/
+TRANSCRIPT_STORE = TranscriptStore()
 
 # ──────────────────────────────────────────────
-# 대상 채널 설정
-# channel_id는 YouTube RSS 피드에서 필요 (핸들 → ID 변환)
+# 대상 채널 설정 — channels.toml (그룹/태그/조회 간격/사용 여부)
+# channel_id는 YouTube RSS 피드에서 필요 (없으면 핸들 → ID 변환)
 # ──────────────────────────────────────────────
-CHANNELS = [
-    {"handle": "@sosumonkey", "name": "소수몽키", "channel_id": "UCC3yfxS5qC6PCwDzetUuEWg"},
-    {"handle": "@orlandocampus", "name": "올랜도 킴 미국주식", "channel_id": "UCwSSqi-s0wcH6pJbH3YPZqQ"},
-    {"handle": "@buiknam_tv", "name": "부읽나TV_내집마련부터건물주까지", "channel_id": "UC2QeHNJFfuQWB4cy3M-745g"},
-]
+REGISTRY = ChannelRegistry()
 
 # 자막 우선순위: 한국어 > 영어
 TRANSCRIPT_LANGUAGES = ["ko", "en"]
@@ -49,61 +71,219 @@ TRANSCRIPT_LANGUAGES = ["ko", "en"]
 # 몇 시간 이내 영상을 "최근"으로 볼 것인지
 RECENT_HOURS = 24
 
+# 피드 1개에서 확인할 최대 영상 수 (최신순)
+MAX_FEED_ENTRIES = 10
+
+# 증분 수집 시 워터마크가 아무리 오래됐어도 이 시간 이전은 보지 않음 (밀린 날 보충 상한)
+MAX_CATCHUP_HOURS = 24 * 7
+
+# --sync 노트북에 남겨 둘 기간 — 이 시간 안에 게시된, 이미 처리한 영상은 소스로 유지
+SYNC_WINDOW_HOURS = 72
+
+# 동시 수집 설정 — 채널이 늘어도 전체 소요 시간은 가장 느린 피드에 수렴
+FETCH_MAX_WORKERS = 16      # 전체 동시 요청 수
+FETCH_PER_HOST_LIMIT = 8    # 호스트(youtube.com)당 동시 요청 상한
+FEED_TIMEOUT = 10           # 피드/채널 페이지 1개당 타임아웃(초)
+
+# 자막 병렬 추출 설정 — YouTube 쓰로틀링을 피하도록 토큰 버킷으로 속도 제한
+TRANSCRIPT_WORKERS = 8      # 동시 자막 추출 수
+TRANSCRIPT_RATE = 2.0       # 초당 자막 요청 시작 수 (토큰 충전 속도)
+TRANSCRIPT_BURST = 4        # 한 번에 몰아서 시작할 수 있는 요청 수 (버킷 크기)
+TRANSCRIPT_TIMEOUT = 60     # 영상 1개당 타임아웃(초)
+
+_host_slots: dict[str, threading.BoundedSemaphore] = {}
+_host_slots_lock = threading.Lock()
+
+
+def _host_slot(url: str) -> threading.BoundedSemaphore:
+    """URL의 호스트별 동시 요청 상한 세마포어를 반환한다."""
+    host = urlsplit(url).netloc
+    with _host_slots_lock:
+        slot = _host_slots.get(host)
+        if slot is None:
+            slot = _host_slots[host] = threading.BoundedSemaphore(FETCH_PER_HOST_LIMIT)
+    return slot
+
+
+class TokenBucket:
+    """
+    스레드 안전 토큰 버킷.
+    rate개/초로 토큰이 차고, 최대 capacity개까지 쌓인다.
+    acquire()는 토큰이 생길 때까지 대기한다.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_seconds = (1 - self._tokens) / self.rate
+            time.sleep(wait_seconds)
+
+
+# 채널 페이지 HTML에서 channel_id를 찾는 패턴 (바이트 단위로 스트리밍 검색)
+_CHANNEL_ID_PATTERNS = [
+    re.compile(rb'"channelId":"(UC[^"]+)"'),
+    # externalId (최신 YouTube 페이지 구조)
+    re.compile(rb'externalId.{0,5}(UC[a-zA-Z0-9_-]{22})'),
+    # meta 태그
+    re.compile(rb'<meta\s+itemprop="channelId"\s+content="(UC[^"]+)"'),
+]
+_STREAM_CHUNK_SIZE = 16 * 1024
+_STREAM_OVERLAP = 256   # 청크 경계에 걸친 매치를 놓치지 않도록 남겨두는 바이트 수
+
 
-def resolve_channel_id(handle: str) -> str | None:
+def _scan_for_channel_id(chunks) -> str | None:
+    """바이트 청크를 순서대로 훑다가 channel_id가 처음 나오는 즉시 반환."""
+    window = b""
+    for chunk in chunks:
+        window = window[-_STREAM_OVERLAP:] + chunk
+        for pattern in _CHANNEL_ID_PATTERNS:
+            match = pattern.search(window)
+            if match:
+                return match.group(1).decode("ascii", errors="replace")
+    return None
+
+
+def resolve_channel_id(handle: str, use_cache: bool = True) -> str | None:
     """
     YouTube 핸들(@이름)에서 channel_id를 가져온다.
     방법: 채널 페이지 HTML에서 'channel_id' 메타 태그를 파싱.
+
+    CHANNEL_ID_CACHE에 유효한 값이 있으면 네트워크 없이 반환한다.
+    페이지는 iter_content로 스트리밍하며, 매치가 나오면 나머지는 받지 않는다.
     """
+    if use_cache:
+        cached = CHANNEL_ID_CACHE.lookup(handle)
+        if cached:
+            return cached
+
     url = f"https://www.youtube.com/{handle}"
     try:
-        resp = requests.get(url, headers={"Accept-Language": "ko-KR"}, timeout=10)
-        resp.raise_for_status()
-        # HTML에서 channel_id 추출
-        match = re.search(r'"channelId":"(UC[^"]+)"', resp.text)
-        if match:
-            return match.group(1)
-        # externalId에서 시도 (최신 YouTube 페이지 구조)
-        match = re.search(r'externalId.{0,5}(UC[a-zA-Z0-9_-]{22})', resp.text)
-        if match:
-            return match.group(1)
-        # meta 태그에서도 시도
-        match = re.search(r'<meta\s+itemprop="channelId"\s+content="(UC[^"]+)"', resp.text)
-        if match:
-            return match.group(1)
+        with _host_slot(url):
+            with http.get(
+                url,
+                headers={"Accept-Language": "ko-KR"},
+                timeout=FEED_TIMEOUT,
+                stream=True,
+            ) as resp:
+                resp.raise_for_status()
+                channel_id = _scan_for_channel_id(resp.iter_content(chunk_size=_STREAM_CHUNK_SIZE))
+        if channel_id:
+            CHANNEL_ID_CACHE.remember(handle, channel_id)
+            return channel_id
     except Exception as e:
         print(f"  [WARN] 채널 ID 조회 실패 ({handle}): {e}")
     return None
 
 
-def get_recent_videos_from_rss(channel_id: str, channel_name: str, hours: int = RECENT_HOURS) -> list[dict]:
+def resolve_channel_ids(handles: list[str]) -> dict[str, str | None]:
+    """
+    여러 핸들의 channel_id를 한 번에 조회한다 (채널 대량 등록용).
+    캐시에 있는 핸들은 건너뛰고, 나머지는 fetch_channels와 같은 동시성 제한으로 조회.
+
+    Returns:
+        dict[str, str | None]: 핸들 → channel_id (실패 시 None), 입력 순서 유지
+    """
+    if not handles:
+        return {}
+    workers = min(FETCH_MAX_WORKERS, len(handles))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="resolve") as pool:
+        resolved = list(pool.map(resolve_channel_id, handles))
+    _save_caches()
+    return dict(zip(handles, resolved))
+
+
+def _save_caches():
+    """피드/채널 ID 캐시를 디스크에 기록 (실패해도 수집은 계속)."""
+    for cache in (FEED_CACHE, CHANNEL_ID_CACHE):
+        try:
+            cache.save()
+        except OSError as e:
+            print(f"  [WARN] 캐시 저장 실패 ({cache.path.name}): {e}")
+
+
+def get_recent_videos_from_rss(
+    channel_id: str,
+    channel_name: str,
+    hours: int = RECENT_HOURS,
+    timeout: float = FEED_TIMEOUT,
+    since: datetime | None = None,
+) -> list[dict]:
     """
     YouTube RSS 피드에서 최근 N시간 이내 영상 목록을 가져온다.
     RSS 피드 URL: https://www.youtube.com/feeds/videos.xml?channel_id=CHANNEL_ID
+    since가 주어지면 hours 대신 그 시각 이후 영상을 가져온다.
+
+    공유 세션(http)으로 받아온 바이트를 lib.atom_parser로 파싱한다.
+    피드는 최신순이므로 cutoff보다 오래된 첫 항목에서 파싱을 멈춘다.
+    조회 실패 시 빈 목록.
+
+    FEED_CACHE에 저장된 ETag/Last-Modified로 조건부 요청을 보내고,
+    304(변경 없음)이면 파싱 없이 캐시된 항목을 그대로 사용한다.
     """
     feed_url = f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
-    feed = feedparser.parse(feed_url)
+    cutoff = since or datetime.now(timezone.utc) - timedelta(hours=hours)
+    try:
+        with _host_slot(feed_url):
+            resp = http.get(
+                feed_url,
+                headers=FEED_CACHE.conditional_headers(feed_url, cutoff),
+                timeout=timeout,
+            )
+        entries = FEED_CACHE.entries(feed_url) if resp.status_code == 304 else None
+        if entries is None:
+            resp.raise_for_status()
+            entries = parse_recent_entries(resp.content, cutoff, limit=MAX_FEED_ENTRIES)
+            FEED_CACHE.store(
+                feed_url,
+                resp.headers.get("ETag"),
+                resp.headers.get("Last-Modified"),
+                entries,
+                parsed_until=cutoff,
+            )
+    except Exception as e:
+        print(f"  [WARN] RSS 피드 조회 실패 ({channel_name}): {e}")
+        return []
     
-    cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
     recent = []
     
-    for entry in feed.entries[:10]:  # 최근 10개만 확인
-        # RSS의 published 시간 파싱
-        published = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
+    for entry in entries:
+        published = datetime.fromisoformat(entry["published"])
         
         if published >= cutoff:
-            video_id = entry.yt_videoid
+            video_id = entry["video_id"]
             recent.append({
-                "title": entry.title,
+                "title": entry["title"],
                 "url": f"https://www.youtube.com/watch?v={video_id}",
                 "video_id": video_id,
-                "published": published.isoformat(),
+                "published": entry["published"],
                 "channel": channel_name,
+                "channel_id": channel_id,
             })
     
     return recent
 
 
+def _transcript_api() -> YouTubeTranscriptApi:
+    """현재 스레드의 YouTubeTranscriptApi (처음 부를 때 생성)"""
+    api = getattr(_ytt_local, "api", None)
+    if api is None:
+        api = _ytt_local.api = YouTubeTranscriptApi(http_client=pooled_session())
+    return api
+
+
 def extract_transcript(video_id: str) -> str | None:
     """
     YouTube 영상에서 자막(transcript)을 추출한다.
@@ -111,7 +291,7 @@ def extract_transcript(video_id: str) -> str | None:
     v1.2.4: 인스턴스 기반 fetch() 메서드 사용
     """
     try:
-        transcript = ytt_api.fetch(video_id, languages=TRANSCRIPT_LANGUAGES)
+        transcript = _transcript_api().fetch(video_id, languages=TRANSCRIPT_LANGUAGES)
         # 자막 세그먼트를 하나의 텍스트로 합침
         full_text = " ".join([snippet.text for snippet in transcript.snippets])
         return full_text
@@ -126,71 +306,238 @@ def extract_transcript(video_id: str) -> str | None:
     return None
 
 
-def get_recent_videos_with_transcripts(hours: int = RECENT_HOURS) -> list[dict]:
+def iter_transcripts(
+    videos: list[dict],
+    max_workers: int | None = None,
+    rate: float | None = None,
+    timeout: float | None = None,
+):
+    """
+    여러 영상의 자막을 워커 풀에서 병렬로 추출하고, 끝나는 순서대로 내보낸다.
+
+    요청 시작은 TokenBucket(rate, TRANSCRIPT_BURST)으로 제한하고,
+    시작 후 timeout초가 지나도 끝나지 않은 영상은 실패(None)로 처리한다.
+    (타임아웃된 요청은 결과만 버리고, 워커는 HTTP 타임아웃으로 정리된다)
+    인자를 생략하면 호출 시점의 TRANSCRIPT_WORKERS/RATE/TIMEOUT 값을 쓴다.
+
+    Yields:
+        tuple[dict, str | None]: (영상, 자막 텍스트 또는 None)
+    """
+    if not videos:
+        return
+    max_workers = max_workers or TRANSCRIPT_WORKERS
+    rate = rate or TRANSCRIPT_RATE
+    timeout = timeout or TRANSCRIPT_TIMEOUT
+    bucket = TokenBucket(rate, TRANSCRIPT_BURST)
+    started: dict[int, float] = {}
+
+    def work(index: int) -> str | None:
+        bucket.acquire()
+        started[index] = time.monotonic()
+        return extract_transcript(videos[index]["video_id"])
+
+    pool = ThreadPoolExecutor(max_workers=min(max_workers, len(videos)), thread_name_prefix="transcript")
+    pending = {pool.submit(work, i): i for i in range(len(videos))}
+    try:
+        while pending:
+            done, _ = wait(pending, timeout=1.0, return_when=FIRST_COMPLETED)
+            for fut in done:
+                index = pending.pop(fut)
+                yield videos[index], fut.result()
+
+            now = time.monotonic()
+            for fut, index in list(pending.items()):
+                if index in started and now - started[index] > timeout:
+                    del pending[fut]
+                    print(f"    [WARN] 자막 추출 타임아웃 ({timeout:.0f}초): {videos[index]['video_id']}")
+                    yield videos[index], None
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _incremental_cutoff(watermark: datetime | None, hours: int) -> datetime:
+    """
+    증분 수집 기준 시각.
+    마지막으로 처리한 영상(워터마크)이 최근 N시간보다 오래됐으면 그 시점부터
+    다시 훑어 밀린 날을 보충한다. 단, MAX_CATCHUP_HOURS보다 과거로는 가지 않는다.
+    이미 처리한 영상은 이후 VIDEO_INDEX로 걸러진다.
+    """
+    now = datetime.now(timezone.utc)
+    cutoff = now - timedelta(hours=hours)
+    if watermark is not None and watermark < cutoff:
+        cutoff = max(watermark, now - timedelta(hours=MAX_CATCHUP_HOURS))
+    return cutoff
+
+
+def _fetch_channel(ch: dict, hours: int, watermarks: dict[str, datetime] | None = None) -> list[dict] | None:
+    """
+    채널 1개의 최근 영상 목록을 가져온다 (워커 스레드에서 실행).
+    channel_id를 찾지 못하면 None.
+    watermarks가 주어지면(증분 모드) 채널 워터마크 기준으로 조회 범위를 정한다.
+    """
+    channel_id = ch.get("channel_id")
+    if not channel_id:
+        channel_id = resolve_channel_id(ch["handle"])
+        if not channel_id:
+            return None
+        ch["channel_id"] = channel_id
+    since = None
+    if watermarks is not None:
+        since = _incremental_cutoff(watermarks.get(channel_id), hours)
+    videos = get_recent_videos_from_rss(channel_id, ch["name"], hours, since=since)
+    for v in videos:
+        v["group"] = ch.get("group", "default")
+    return videos
+
+
+def select_channels(group: str | None = None) -> list[dict]:
+    """
+    REGISTRY에서 수집 대상 채널을 고른다.
+    channels.toml이 바뀌었으면 먼저 다시 읽는다 (루프 모드에서 재시작 불필요).
+    """
+    REGISTRY.reload_if_changed()
+    return REGISTRY.channels(group=group)
+
+
+def _due_channels(channels: list[dict]) -> list[dict]:
+    """poll_hours가 아직 지나지 않은 채널을 제외한다."""
+    last_polled = VIDEO_INDEX.last_polled()
+    now = datetime.now(timezone.utc)
+    due = []
+    for ch in channels:
+        polled_at = last_polled.get(ch["handle"].lower())
+        interval = timedelta(hours=ch.get("poll_hours", 0))
+        if polled_at is None or now - polled_at >= interval:
+            due.append(ch)
+    return due
+
+
+def fetch_channels(
+    channels: list[dict],
+    hours: int = RECENT_HOURS,
+    incremental: bool = False,
+) -> list[tuple[dict, list[dict] | None]]:
+    """
+    여러 채널의 RSS 피드를 동시에 조회한다.
+
+    스레드 풀(FETCH_MAX_WORKERS)과 호스트별 상한(FETCH_PER_HOST_LIMIT)으로
+    요청 수를 제한하고, 피드마다 FEED_TIMEOUT을 적용한다.
+    결과는 완료 순서와 무관하게 channels와 같은 순서로 반환된다.
+
+    incremental=True이면 VIDEO_INDEX에 없는(처리한 적 없는) 영상만 남기고,
+    poll_hours가 지나지 않은 채널은 조회하지 않는다 (결과에서도 빠짐).
+    SQLite 접근은 호출 스레드에서만 한다.
+
+    Returns:
+        list[tuple[dict, list[dict] | None]]: (채널, 영상 목록 또는 None)
+    """
+    if incremental:
+        channels = _due_channels(channels)
+    if not channels:
+        return []
+    watermarks = VIDEO_INDEX.watermarks() if incremental else None
+    workers = min(FETCH_MAX_WORKERS, len(channels))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rss") as pool:
+        fetched = list(pool.map(lambda ch: _fetch_channel(ch, hours, watermarks), channels))
+    _save_caches()
+
+    if incremental:
+        VIDEO_INDEX.mark_polled(ch["handle"] for ch, videos in zip(channels, fetched) if videos is not None)
+        unseen = VIDEO_INDEX.unseen(v["video_id"] for videos in fetched if videos for v in videos)
+        fetched = [
+            [v for v in videos if v["video_id"] in unseen] if videos is not None else None
+            for videos in fetched
+        ]
+    return list(zip(channels, fetched))
+
+
+def mark_processed(videos: list[dict]):
+    """
+    처리 완료된 영상을 VIDEO_INDEX에 기록하여 다음 증분 수집에서 제외한다.
+    NotebookLM 반영이 끝난 뒤 호출해야 실패한 날의 영상이 다음 실행에서 다시 수집된다.
+    """
+    VIDEO_INDEX.mark_seen(videos)
+
+
+def sync_targets(new_videos: list[dict], window_hours: int = SYNC_WINDOW_HOURS,
+                 index: VideoIndex | None = None) -> list[dict]:
+    """
+    --sync 노트북에 있어야 할 전체 영상 = 최근 window_hours 안에 게시된 처리 완료 영상 + 새 영상.
+    증분 수집 결과(새 영상)만 넘기면 어제 넣은 소스가 모두 삭제 대상이 된다.
+    """
+    index = index or VIDEO_INDEX
+    since = datetime.now(timezone.utc) - timedelta(hours=window_hours)
+    new_ids = {v["video_id"] for v in new_videos}
+    kept = [v for v in index.processed_since(since) if v["video_id"] not in new_ids]
+    return kept + new_videos
+
+
+def get_recent_videos_with_transcripts(
+    hours: int = RECENT_HOURS,
+    incremental: bool = False,
+    group: str | None = None,
+) -> list[dict]:
     """
     모든 대상 채널에서 최근 영상을 수집하고, 자막을 추출한다.
+    incremental=True이면 이전에 처리하지 않은 영상만 수집한다 (mark_processed 참고).
+    group을 주면 channels.toml에서 해당 그룹 채널만 수집한다.
     
     Returns:
         list[dict]: 각 영상의 제목, URL, 자막 텍스트 등
     """
-    results = []
+    collected = []
     
-    for ch in CHANNELS:
+    # 1~2. 채널 ID 조회 + RSS 조회 (채널 간 동시 실행)
+    for ch, videos in fetch_channels(select_channels(group), hours, incremental):
         print(f"📡 채널 확인: {ch['name']} ({ch['handle']})")
-        
-        # 1. 채널 ID 조회
-        channel_id = ch.get("channel_id")
-        if not channel_id:
-            channel_id = resolve_channel_id(ch["handle"])
-            if not channel_id:
-                print(f"  [ERROR] 채널 ID를 찾을 수 없음: {ch['handle']}")
-                continue
-            ch["channel_id"] = channel_id
-            print(f"  채널 ID: {channel_id}")
-        
-        # 2. RSS에서 최근 영상 목록 가져오기
-        videos = get_recent_videos_from_rss(channel_id, ch["name"], hours)
-        print(f"  최근 {hours}시간 내 영상: {len(videos)}개")
-        
-        # 3. 각 영상에서 자막 추출
-        for video in videos:
-            print(f"  📹 {video['title']}")
-            transcript = extract_transcript(video["video_id"])
-            if transcript:
-                video["transcript"] = transcript
-                video["transcript_length"] = len(transcript)
-                print(f"    ✅ 자막 추출 완료 ({len(transcript)}자)")
-                results.append(video)
-            else:
-                print(f"    ⚠️ 자막 없이 건너뜀")
+        if videos is None:
+            print(f"  [ERROR] 채널 ID를 찾을 수 없음: {ch['handle']}")
+            continue
+        print(f"  {'새' if incremental else f'최근 {hours}시간 내'} 영상: {len(videos)}개")
+        collected.extend(videos)
     
-    return results
+    # 3. 각 영상에서 자막 추출 (영상 간 병렬, 완료 순서대로 보고)
+    print(f"📝 자막 추출: {len(collected)}개 영상")
+    extracted = set()
+    for video, transcript in iter_transcripts(collected):
+        print(f"  📹 {video['title']}")
+        if transcript:
+            video["transcript"] = transcript
+            video["transcript_length"] = len(transcript)
+            TRANSCRIPT_STORE.put(video["video_id"], transcript)
+            print(f"    ✅ 자막 추출 완료 ({len(transcript)}자)")
+            extracted.add(video["video_id"])
+        else:
+            print(f"    ⚠️ 자막 없이 건너뜀")
+    
+    # 반환 순서는 채널/피드 순서로 고정
+    return [v for v in collected if v["video_id"] in extracted]
 
 
-def get_recent_video_urls(hours: int = RECENT_HOURS) -> list[dict]:
+def get_recent_video_urls(
+    hours: int = RECENT_HOURS,
+    incremental: bool = False,
+    group: str | None = None,
+) -> list[dict]:
     """
     모든 대상 채널에서 최근 영상 URL만 수집한다.
     자막 추출 없이 URL만 가져오므로 훨씬 빠르다.
     NotebookLM이 YouTube URL에서 직접 내용을 처리하므로 자막 불필요.
+    incremental=True이면 이전에 처리하지 않은 영상만 수집한다 (mark_processed 참고).
+    group을 주면 channels.toml에서 해당 그룹 채널만 수집한다.
     
     Returns:
         list[dict]: 각 영상의 제목, URL, video_id 등
     """
     results = []
     
-    for ch in CHANNELS:
+    for ch, videos in fetch_channels(select_channels(group), hours, incremental):
         print(f"📡 채널 확인: {ch['name']} ({ch['handle']})")
+        if videos is None:
+            print(f"  [ERROR] 채널 ID를 찾을 수 없음: {ch['handle']}")
+            continue
         
-        channel_id = ch.get("channel_id")
-        if not channel_id:
-            channel_id = resolve_channel_id(ch["handle"])
-            if not channel_id:
-                print(f"  [ERROR] 채널 ID를 찾을 수 없음: {ch['handle']}")
-                continue
-            ch["channel_id"] = channel_id
-        
-        videos = get_recent_videos_from_rss(channel_id, ch["name"], hours)
-        print(f"  최근 {hours}시간 내 영상: {len(videos)}개")
+        print(f"  {'새' if incremental else f'최근 {hours}시간 내'} 영상: {len(videos)}개")
         
         for video in videos:
             print(f"  📹 {video['title']}")
@@ -12,9 +12,15 @@ Synthesis Agent - 자막 기반 팟캐스트 스크립트 생성
 
 import json
 import os
+import sys
 from datetime import datetime
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+from lib.transcript_store import TranscriptStore
+
+# research_agent가 자막을 저장하는 압축 저장소
+TRANSCRIPT_STORE = TranscriptStore()
 
 # ──────────────────────────────────────────────
 # 팟캐스트 스크립트 생성 프롬프트
@@ -44,20 +50,34 @@ PODCAST_PROMPT_TEMPLATE = """당신은 한국의 인기 경제/투자 팟캐스
 """
 
 
+def _stored_transcript(video_id: str) -> dict | None:
+    """
+    저장소의 자막 메타데이터(chars 등)를 반환. 없으면 None.
+    예전 방식의 transcript_{video_id}.txt가 남아 있으면 저장소로 옮긴 뒤 반환.
+    """
+    info = TRANSCRIPT_STORE.info(video_id)
+    if info is None:
+        legacy_path = Path(__file__).parent / f"transcript_{video_id}.txt"
+        if legacy_path.exists():
+            with open(legacy_path, "r", encoding="utf-8") as f:
+                TRANSCRIPT_STORE.put(video_id, f.read())
+            info = TRANSCRIPT_STORE.info(video_id)
+    return info
+
+
 def build_video_sections(videos: list[dict]) -> str:
     """
     영상 목록과 자막을 프롬프트 삽입용 섹션으로 변환.
     """
     sections = []
     for i, video in enumerate(videos, 1):
-        transcript_path = Path(__file__).parent / f"transcript_{video['video_id']}.txt"
         transcript = ""
-        if transcript_path.exists():
-            with open(transcript_path, "r", encoding="utf-8") as f:
-                transcript = f.read()
-            # 너무 긴 자막은 앞부분만 사용 (토큰 제한 고려)
-            if len(transcript) > 8000:
-                transcript = transcript[:8000] + "\n... (이하 생략)"
+        info = _stored_transcript(video['video_id'])
+        if info:
+            # 너무 긴 자막은 앞부분만 사용 (토큰 제한 고려) — 필요한 청크만 압축 해제
+            transcript = TRANSCRIPT_STORE.head(video['video_id'], 8000)
+            if info["chars"] > 8000:
+                transcript += "\n... (이하 생략)"
         
         section = f"""### 영상 {i}: {video['title']}
 - **채널**: {video.get('channel', 'N/A')}
@@ -101,16 +121,17 @@ def generate_local_script(videos: list[dict]) -> str:
         script_parts.append(f"---\n## 📊 영상 {i}: {video['title']}")
         script_parts.append(f"*채널: {video.get('channel', 'N/A')} | [영상 링크]({video['url']})*\n")
         
-        transcript_path = Path(__file__).parent / f"transcript_{video['video_id']}.txt"
-        if transcript_path.exists():
-            with open(transcript_path, "r", encoding="utf-8") as f:
-                transcript = f.read()
-            
+        info = _stored_transcript(video['video_id'])
+        if info:
             # 핵심 문장 추출 (첫 500자 + 마지막 300자)
-            if len(transcript) > 1000:
-                summary = transcript[:500] + "\n\n... (중략) ...\n\n" + transcript[-300:]
+            if info["chars"] > 1000:
+                summary = (
+                    TRANSCRIPT_STORE.head(video['video_id'], 500)
+                    + "\n\n... (중략) ...\n\n"
+                    + TRANSCRIPT_STORE.tail(video['video_id'], 300)
+                )
             else:
-                summary = transcript
+                summary = TRANSCRIPT_STORE.get(video['video_id'])
             
             script_parts.append(f"**A**: 이 영상의 핵심 내용을 정리해보면...")
             script_parts.append(f"\n> {summary}\n")
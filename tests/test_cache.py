@@ -0,0 +1,70 @@
+"""
+lib.cache 테스트: FeedCache의 조건부 요청 헤더는 캐시가 요청 범위를 덮을 때만 만든다.
+"""
+
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.cache import FeedCache, JsonCache
+
+URL = "https://www.youtube.com/feeds/videos.xml?channel_id=UC_test"
+PARSED_UNTIL = datetime(2026, 10, 10, tzinfo=timezone.utc)
+
+
+def _cache(tmp_path, **kwargs) -> FeedCache:
+    cache = FeedCache(tmp_path / "feed_cache.json")
+    defaults = {"etag": '"v1"', "last_modified": "Sat, 10 Oct 2026 00:00:00 GMT", "parsed_until": PARSED_UNTIL}
+    cache.store(URL, entries=[{"video_id": "a"}], **{**defaults, **kwargs})
+    return cache
+
+
+def test_headers_when_cache_covers_cutoff(tmp_path):
+    cache = _cache(tmp_path)
+    expected = {"If-None-Match": '"v1"', "If-Modified-Since": "Sat, 10 Oct 2026 00:00:00 GMT"}
+    assert cache.conditional_headers(URL) == expected
+    assert cache.conditional_headers(URL, cutoff=PARSED_UNTIL) == expected
+    assert cache.conditional_headers(URL, cutoff=PARSED_UNTIL + timedelta(days=1)) == expected
+
+
+def test_no_headers_when_cutoff_is_older_than_parsed_range(tmp_path):
+    # 더 오래된 항목이 필요하면 304를 받아도 캐시로 답할 수 없다
+    cache = _cache(tmp_path)
+    assert cache.conditional_headers(URL, cutoff=PARSED_UNTIL - timedelta(seconds=1)) == {}
+
+
+def test_fully_parsed_feed_serves_any_cutoff(tmp_path):
+    cache = _cache(tmp_path, parsed_until=None)
+    assert cache.conditional_headers(URL, cutoff=PARSED_UNTIL - timedelta(days=365))
+
+
+def test_only_available_validators_are_sent(tmp_path):
+    cache = _cache(tmp_path, etag=None)
+    assert cache.conditional_headers(URL) == {"If-Modified-Since": "Sat, 10 Oct 2026 00:00:00 GMT"}
+    assert cache.conditional_headers("https://example.com/unknown") == {}
+
+
+def test_round_trip_through_disk(tmp_path):
+    _cache(tmp_path).save()
+    reloaded = FeedCache(tmp_path / "feed_cache.json")
+    assert reloaded.entries(URL) == [{"video_id": "a"}]
+    assert reloaded.conditional_headers(URL, cutoff=PARSED_UNTIL - timedelta(days=1)) == {}
+
+
+def test_update_does_not_lose_concurrent_increments(tmp_path):
+    cache = JsonCache(tmp_path / "counts.json")
+
+    def bump():
+        for _ in range(500):
+            cache.update("n", lambda n: (n or 0) + 1)
+
+    threads = [threading.Thread(target=bump) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    cache.save()
+    assert JsonCache(tmp_path / "counts.json").get("n") == 2000
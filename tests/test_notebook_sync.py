@@ -0,0 +1,103 @@
+"""
+--sync 대상 계산 테스트: 어제 넣은 소스는 유지되고, 창을 벗어난 소스만 삭제 대상이 된다.
+"""
+
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import research_agent
+from lib.notebook_sync import plan_sync
+from lib.video_index import VideoIndex
+
+
+def _video(video_id: str, title: str, published: datetime) -> dict:
+    return {
+        "video_id": video_id,
+        "channel_id": "UC_test",
+        "title": title,
+        "url": f"https://www.youtube.com/watch?v={video_id}",
+        "published": published.isoformat(),
+    }
+
+
+def _plan(index: VideoIndex, new_videos: list[dict], rows: list[dict]):
+    targets = research_agent.sync_targets(new_videos, index=index)
+    return plan_sync(rows, [v["url"] for v in targets], {v["url"]: v["title"] for v in targets})
+
+
+def test_yesterdays_sources_are_kept(tmp_path):
+    index = VideoIndex(tmp_path / "video_index.db")
+    now = datetime.now(timezone.utc)
+    yesterday = _video("old0000001", "어제 영상", now - timedelta(hours=30))
+    index.mark_seen([yesterday])
+    today = _video("new0000001", "오늘 영상", now - timedelta(hours=2))
+
+    plan = _plan(index, [today], [{"index": 0, "title": "어제 영상", "state": "ready"}])
+
+    assert plan.keep == {yesterday["url"]: "어제 영상"}
+    assert plan.stale == []
+    assert plan.missing == [today["url"]]
+    index.close()
+
+
+def test_sources_outside_window_are_stale(tmp_path):
+    index = VideoIndex(tmp_path / "video_index.db")
+    now = datetime.now(timezone.utc)
+    expired = _video("old0000002", "지난주 영상", now - timedelta(hours=research_agent.SYNC_WINDOW_HOURS + 1))
+    index.mark_seen([expired])
+    today = _video("new0000002", "오늘 영상", now - timedelta(hours=2))
+
+    rows = [{"index": 0, "title": "지난주 영상", "state": "ready"}]
+    plan = _plan(index, [today], rows)
+
+    assert plan.keep == {}
+    assert plan.stale == rows
+    assert plan.missing == [today["url"]]
+    index.close()
+
+
+A = "https://www.youtube.com/watch?v=aaaaaaaaaaa"
+B = "https://www.youtube.com/watch?v=bbbbbbbbbbb"
+
+
+def test_failed_row_is_stale_and_resubmitted():
+    rows = [{"index": 0, "title": A, "state": "error"}]
+    plan = plan_sync(rows, [A])
+    assert plan.keep == {}
+    assert plan.stale == rows
+    assert plan.missing == [A]
+
+
+def test_duplicate_rows_keep_the_first():
+    rows = [{"index": 0, "title": "영상 A", "state": "ready"},
+            {"index": 1, "title": "영상 A", "state": "ready"}]
+    plan = plan_sync(rows, [A], {A: "영상 A"})
+    assert plan.keep == {A: "영상 A"}
+    assert plan.stale == [rows[1]]
+    assert plan.missing == []
+
+
+def test_matches_video_id_and_manifest_title():
+    rows = [{"index": 0, "title": "https://youtu.be/aaaaaaaaaaa", "state": "loading"},
+            {"index": 1, "title": "  Video   B ", "state": "ready"}]
+    # 매니페스트 제목은 공백/대소문자 차이를 무시하고 비교
+    plan = plan_sync(rows, [A, B], known={B: "video b"})
+    assert plan.keep == {A: rows[0]["title"], B: rows[1]["title"]}
+    assert plan.unchanged
+
+
+def test_empty_notebook_adds_everything():
+    plan = plan_sync([], [A, B])
+    assert plan.keep == {} and plan.stale == []
+    assert plan.missing == [A, B]
+    assert not plan.unchanged
+
+
+def test_unmatched_rows_are_stale_without_titles():
+    rows = [{"index": 0, "title": "알 수 없는 영상", "state": "ready"}]
+    plan = plan_sync(rows, [A])
+    assert plan.stale == rows
+    assert plan.missing == [A]
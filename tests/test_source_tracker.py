@@ -0,0 +1,111 @@
+"""
+SourceTracker 매칭 테스트 — 브라우저 없이 binding 이벤트를 직접 넣는다.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.source_tracker import SourceTracker, video_id
+
+
+class FakePage:
+    """install()/_observe()가 부르는 메서드만 있는 페이지"""
+
+    def expose_binding(self, name, callback):
+        pass
+
+    def on(self, event, handler):
+        pass
+
+    def evaluate(self, script, arg=None):
+        return None
+
+
+def _url(vid: str) -> str:
+    return f"https://www.youtube.com/watch?v={vid}"
+
+
+A, B, C = _url("aaaaaaaaaaa"), _url("bbbbbbbbbbb"), _url("ccccccccccc")
+
+
+def _row(tracker: SourceTracker, title: str, state: str):
+    tracker._on_binding(None, {"title": title, "state": state})
+
+
+def test_video_id():
+    assert video_id(A) == "aaaaaaaaaaa"
+    assert video_id("https://youtu.be/bbbbbbbbbbb?t=3") == "bbbbbbbbbbb"
+    assert video_id("https://www.youtube.com/shorts/ccccccccccc") == "ccccccccccc"
+    assert video_id("https://example.com/") is None
+
+
+def test_matches_url_in_title_then_expected_title():
+    tracker = SourceTracker(FakePage())
+    tracker.begin([A, B], titles={B: "Video  B"})
+    _row(tracker, A, "error")             # 실패한 소스는 URL이 제목으로 남는다
+    _row(tracker, "video b", "loading")    # 공백/대소문자 차이는 무시
+    assert tracker.status == {A: "failed", B: "loading"}
+    assert tracker.reasons[A] == "source_error"
+    _row(tracker, "video b", "ready")
+    assert tracker.succeeded([A, B]) == [B]
+    assert tracker.row_titles([A, B]) == {A: A, B: "video b"}
+
+
+def test_order_assignment_keeps_submission_order():
+    tracker = SourceTracker(FakePage())
+    tracker.begin([A, B, C])
+    _row(tracker, "first", "ready")
+    _row(tracker, "second", "error")
+    _row(tracker, "third", "ready")
+    # 응답 확인이 제출 순서와 다르게 도착해도 행 N은 N번째 URL의 것
+    tracker.acknowledged.update({C, A})
+    tracker.assign_by_order([A, B, C])
+    assert tracker.status == {A: "ok", B: "failed", C: "ok"}
+
+
+def test_order_assignment_waits_for_settled_rows():
+    tracker = SourceTracker(FakePage())
+    tracker.begin([A, B])
+    _row(tracker, "first", "ready")
+    _row(tracker, "second", "loading")
+    tracker.assign_by_order([A, B])
+    assert tracker.status == {A: "pending", B: "pending"}
+    tracker.assign_by_order([A, B], force=True)
+    assert tracker.status == {A: "ok", B: "loading"}
+
+
+def test_fewer_rows_than_urls_go_to_acknowledged_urls():
+    tracker = SourceTracker(FakePage())
+    tracker.begin([A, B, C])
+    _row(tracker, "first", "ready")
+    _row(tracker, "second", "ready")
+    tracker.acknowledged.update({A, C})   # B는 제출 응답에 없었다
+    tracker.finalize([A, B, C])
+    assert tracker.status == {A: "ok", B: "failed", C: "ok"}
+    assert tracker.reasons[B] == "timeout"
+
+
+def test_retry_ignores_the_old_error_row():
+    tracker = SourceTracker(FakePage())
+    tracker.begin([A])
+    _row(tracker, A, "error")
+    assert tracker.status[A] == "failed"
+
+    tracker.begin([A])
+    _row(tracker, A, "error")              # 목록이 다시 그려지며 옛 오류 행이 다시 보고됨
+    assert tracker.status[A] == "pending"
+    _row(tracker, A, "loading")            # 재시도한 새 행
+    _row(tracker, A, "ready")
+    assert tracker.status[A] == "ok"
+
+
+def test_retry_failing_again_is_reported():
+    tracker = SourceTracker(FakePage())
+    tracker.begin([A])
+    _row(tracker, A, "error")
+    tracker.begin([A])
+    _row(tracker, A, "loading")
+    _row(tracker, A, "error")
+    assert tracker.status[A] == "failed"
@@ -0,0 +1,67 @@
+"""
+research_agent.TokenBucket 테스트: 처음 capacity개는 바로 나가고, 그 뒤로는 rate에 맞춰 기다린다.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import research_agent
+from research_agent import TokenBucket
+
+
+class FakeClock:
+    """time 모듈 대신 — sleep()은 시계만 앞으로 돌리고 기록한다 (2의 거듭제곱 rate만 써서 오차 없게)"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_burst_then_rate(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(research_agent, "time", clock)
+    bucket = TokenBucket(rate=4, capacity=2)
+
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.sleeps == []
+    bucket.acquire()
+    assert clock.sleeps == [0.25]
+
+
+def test_refill_is_capped_at_capacity(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(research_agent, "time", clock)
+    bucket = TokenBucket(rate=8, capacity=3)
+    for _ in range(3):
+        bucket.acquire()
+
+    clock.now += 60  # 오래 쉬어도 capacity개까지만 쌓인다
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.sleeps == []
+    bucket.acquire()
+    assert clock.sleeps == [0.125]
+
+
+def test_threads_share_the_rate():
+    bucket = TokenBucket(rate=200, capacity=1)
+    started = time.monotonic()
+    threads = [threading.Thread(target=lambda: [bucket.acquire() for _ in range(5)]) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # 20개 중 첫 1개만 즉시, 나머지 19개는 1/200초 간격
+    assert time.monotonic() - started >= 19 / 200 * 0.9
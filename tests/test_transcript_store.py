@@ -0,0 +1,110 @@
+"""
+lib.transcript_store 테스트: 저장/복원, 블롭 공유, 사전 학습, 필요한 청크만 푸는 head/tail.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.transcript_store import CHUNK_CHARS, TranscriptStore, train_dictionary
+
+
+def _caption(n: int, lines: int = 400) -> str:
+    return "\n".join(f"[{i:04d}] 오늘은 영상 {n}번에서 시장 전망과 금리 이야기를 해보겠습니다 ({i * n})"
+                     for i in range(lines))
+
+
+def test_round_trip_across_chunks(tmp_path):
+    store = TranscriptStore(tmp_path, train_after=None)
+    text = _caption(1)
+    assert len(text) > 2 * CHUNK_CHARS
+    digest = store.put("vid1", text)
+
+    assert store.get("vid1") == text
+    assert store.info("vid1")["hash"] == digest
+    assert store.info("vid1")["chunks"] == -(-len(text) // CHUNK_CHARS)
+    assert "vid1" in store and "missing" not in store
+    assert store.get("missing") is None
+    store.close()
+
+    reopened = TranscriptStore(tmp_path, train_after=None)
+    assert reopened.get("vid1") == text
+    reopened.close()
+
+
+def test_same_text_shares_one_blob(tmp_path):
+    store = TranscriptStore(tmp_path, train_after=None)
+    text = _caption(2)
+    store.put("a", text)
+    store.put("b", text)
+    assert len(list((tmp_path / "objects").rglob("*.z"))) == 1
+
+    store.delete("a")
+    assert store.get("b") == text       # 남은 참조가 있으면 블롭은 유지
+    store.delete("b")
+    assert list((tmp_path / "objects").rglob("*.z")) == []
+    store.close()
+
+
+def test_head_and_tail(tmp_path):
+    store = TranscriptStore(tmp_path, train_after=None)
+    text = _caption(3)
+    store.put("vid", text)
+
+    for n in (0, 1, CHUNK_CHARS - 1, CHUNK_CHARS, CHUNK_CHARS + 1, len(text), len(text) + 10):
+        assert store.head("vid", n) == text[:n]
+        assert store.tail("vid", n) == (text[-n:] if n else "")
+    assert store.head("missing", 10) is None
+    assert store.tail("missing", 10) is None
+    store.close()
+
+
+def test_dictionary_trained_after_threshold(tmp_path):
+    store = TranscriptStore(tmp_path, train_after=3)
+    texts = {f"v{n}": _caption(n, lines=60) for n in range(1, 4)}
+    for video_id, text in texts.items():
+        store.put(video_id, text)
+    dict_id = store.stats()["dict_id"]
+    assert dict_id is not None
+    assert all(store.info(v)["dict_id"] is None for v in texts)   # 기존 블롭은 사전 없이 그대로
+
+    fresh = _caption(7, lines=60)
+    store.put("v7", fresh)
+    assert store.info("v7")["dict_id"] == dict_id
+    assert store.get("v7") == fresh
+    store.close()
+
+    # 사전은 디스크에서 다시 읽는다
+    reopened = TranscriptStore(tmp_path, train_after=3)
+    assert reopened.get("v7") == fresh
+    assert all(reopened.get(v) == t for v, t in texts.items())
+    reopened.close()
+
+
+def test_dictionary_improves_compression(tmp_path):
+    samples = [_caption(n, lines=60) for n in range(1, 20)]
+    zdict = train_dictionary(samples, size=8 * 1024)
+    assert 0 < len(zdict) <= 8 * 1024
+
+    plain = TranscriptStore(tmp_path / "plain", train_after=None)
+    trained = TranscriptStore(tmp_path / "trained", train_after=None)
+    trained.train(samples)
+    text = _caption(99, lines=60)
+    plain.put("v", text)
+    trained.put("v", text)
+    assert trained.stats()["stored_bytes"] < plain.stats()["stored_bytes"]
+    assert trained.get("v") == text
+    plain.close()
+    trained.close()
+
+
+def test_prune_evicts_least_recently_used(tmp_path):
+    store = TranscriptStore(tmp_path, max_entries=2, train_after=None)
+    store.put("old", _caption(1, lines=10))
+    store.put("mid", _caption(2, lines=10))
+    store.get("old")                       # old를 최근에 읽음 → mid가 가장 오래됨
+    store.put("new", _caption(3, lines=10))
+    assert "mid" not in store
+    assert "old" in store and "new" in store
+    store.close()
@@ -0,0 +1,300 @@
+"""
+YouTube Stand-in - 연구 단계 오프라인 벤치마크용 로컬 HTTP 서버
+
+research_agent가 호출하는 YouTube 엔드포인트를 합성 데이터로 흉내낸다:
+- /feeds/videos.xml?channel_id=...   Atom 피드 (ETag / 304 지원)
+- /@handle                           채널 페이지 (channelId 포함)
+- /watch?v=...                       영상 페이지 (INNERTUBE_API_KEY 포함)
+- /youtubei/v1/player                자막 트랙 목록 (JSON)
+- /api/timedtext                     자막 XML
+
+응답 지연(latency/jitter), 오류율(503), 채널 수를 조절할 수 있다.
+사용 예는 bench_research.py 참고.
+"""
+
+import json
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from xml.sax.saxutils import escape
+
+# 합성 자막에 쓰는 문장 (한국어 경제 유튜브 말투)
+_CAPTION_WORDS = (
+    "여러분 안녕하세요 오늘은 미국 주식 시장 금리 인하 가능성 엔비디아 실적 발표 "
+    "그래서 포트폴리오 리밸런싱 이야기를 해보겠습니다 부동산 전세 대출 규제 환율"
+).split()
+
+
+def standin_channel_id(index: int) -> str:
+    """index번째 합성 채널의 channel_id (UC + 22자)."""
+    return f"UC{index:022d}"
+
+
+def standin_handle(index: int) -> str:
+    return f"@standin{index}"
+
+
+class YouTubeStandin:
+    """합성 YouTube 응답을 내주는 로컬 서버 (백그라운드 스레드)."""
+
+    def __init__(
+        self,
+        channels: int = 200,
+        videos_per_feed: int = 15,
+        recent_per_feed: int = 2,
+        latency_ms: float = 50,
+        jitter_ms: float = 20,
+        error_rate: float = 0.0,
+        transcript_lines: int = 200,
+        seed: int = 0,
+    ):
+        self.channel_count = channels
+        self.videos_per_feed = videos_per_feed
+        self.recent_per_feed = recent_per_feed
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.transcript_lines = transcript_lines
+        self.seed = seed
+        self.started_at = datetime.now(timezone.utc).replace(microsecond=0)
+        self.requests = Counter()
+        self._lock = threading.Lock()
+        self._rng = random.Random(seed)
+        self._server: _Server | None = None
+        self._thread: threading.Thread | None = None
+
+    # ── 서버 수명 ──
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> str:
+        """서버를 임의 포트로 띄우고 base URL을 반환."""
+        self._server = _Server(("127.0.0.1", 0), _Handler)
+        self._server.standin = self
+        self._thread = threading.Thread(target=self._server.serve_forever, name="youtube-standin", daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    # ── 합성 데이터 ──
+
+    def channels(self) -> list[dict]:
+        """channels.toml 항목 형태의 합성 채널 목록."""
+        return [
+            {"handle": standin_handle(i), "name": f"Stand-in {i}", "channel_id": standin_channel_id(i)}
+            for i in range(self.channel_count)
+        ]
+
+    def _channel_index(self, channel_id: str) -> int | None:
+        if not channel_id.startswith("UC") or not channel_id[2:].isdigit():
+            return None
+        index = int(channel_id[2:])
+        return index if index < self.channel_count else None
+
+    def _published(self, entry: int) -> datetime:
+        """최신순: 앞의 recent_per_feed개는 최근 24시간 이내, 나머지는 하루 이상 전."""
+        if entry < self.recent_per_feed:
+            return self.started_at - timedelta(hours=entry + 1)
+        return self.started_at - timedelta(days=entry + 1)
+
+    def feed_etag(self, index: int) -> str:
+        return f'"standin-{self.seed}-{index}-{self.started_at.timestamp():.0f}"'
+
+    def feed_xml(self, index: int) -> bytes:
+        channel_id = standin_channel_id(index)
+        entries = []
+        for n in range(self.videos_per_feed):
+            video_id = f"s{index:05d}v{n:04d}"
+            published = self._published(n).isoformat()
+            entries.append(
+                "<entry>"
+                f"<id>yt:video:{video_id}</id>"
+                f"<yt:videoId>{video_id}</yt:videoId>"
+                f"<yt:channelId>{channel_id}</yt:channelId>"
+                f"<title>{escape(f'합성 영상 {index}-{n}')}</title>"
+                f'<link rel="alternate" href="https://www.youtube.com/watch?v={video_id}"/>'
+                f"<published>{published}</published><updated>{published}</updated>"
+                "<media:group>"
+                f"<media:title>{escape(f'합성 영상 {index}-{n}')}</media:title>"
+                f"<media:description>{escape(' '.join(_CAPTION_WORDS) * 4)}</media:description>"
+                "</media:group>"
+                "</entry>"
+            )
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015" '
+            'xmlns:media="http://search.yahoo.com/mrss/" xmlns="http://www.w3.org/2005/Atom">'
+            f"<title>Stand-in {index}</title>"
+            + "".join(entries)
+            + "</feed>"
+        ).encode("utf-8")
+
+    def channel_page(self, index: int) -> bytes:
+        # 실제 채널 페이지처럼 앞부분에 큰 덩어리를 두고 뒤쪽에 channelId를 둔다
+        filler = "<script>var ytcfg = {};</script>" * 2000
+        return (
+            f"<html><head><title>Stand-in {index}</title></head><body>{filler}"
+            f'<script>var ytInitialData = {{"channelId":"{standin_channel_id(index)}"}};</script>'
+            f"{filler}</body></html>"
+        ).encode("utf-8")
+
+    def transcript_xml(self, video_id: str) -> bytes:
+        rng = random.Random(f"{self.seed}-{video_id}")
+        lines = []
+        for n in range(self.transcript_lines):
+            text = " ".join(rng.choice(_CAPTION_WORDS) for _ in range(8))
+            lines.append(f'<text start="{n * 3}.0" dur="3.0">{escape(text)}</text>')
+        return ('<?xml version="1.0" encoding="utf-8" ?><transcript>' + "".join(lines) + "</transcript>").encode("utf-8")
+
+    def player_json(self, video_id: str) -> bytes:
+        return json.dumps({
+            "playabilityStatus": {"status": "OK"},
+            "captions": {
+                "playerCaptionsTracklistRenderer": {
+                    "captionTracks": [{
+                        "baseUrl": f"https://www.youtube.com/api/timedtext?v={video_id}&lang=ko",
+                        "name": {"runs": [{"text": "한국어 (자동 생성됨)"}]},
+                        "languageCode": "ko",
+                        "kind": "asr",
+                        "isTranslatable": False,
+                    }],
+                },
+            },
+        }).encode("utf-8")
+
+    # ── 요청 처리 보조 ──
+
+    def simulate_latency(self):
+        with self._lock:
+            delay = self.latency_ms + self._rng.uniform(-self.jitter_ms, self.jitter_ms)
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+    def should_fail(self) -> bool:
+        if self.error_rate <= 0:
+            return False
+        with self._lock:
+            return self._rng.random() < self.error_rate
+
+    def count(self, kind: str):
+        with self._lock:
+            self.requests[kind] += 1
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # 채널 페이지를 끝까지 읽지 않고 끊는 것(스트리밍 조기 종료)은 정상 동작
+        if isinstance(sys.exc_info()[1], (ConnectionResetError, BrokenPipeError)):
+            return
+        super().handle_error(request, client_address)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive (연결 재사용 측정용)
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: bytes = b"", content_type: str = "text/html; charset=utf-8",
+              headers: dict | None = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if body and self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _dispatch(self):
+        standin: YouTubeStandin = self.server.standin
+        parts = urlsplit(self.path)
+        query = parse_qs(parts.query)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+
+        if parts.path == "/feeds/videos.xml":
+            kind = "feed"
+        elif parts.path.startswith("/@"):
+            kind = "channel"
+        elif parts.path == "/watch":
+            kind = "watch"
+        elif parts.path == "/youtubei/v1/player":
+            kind = "player"
+        elif parts.path == "/api/timedtext":
+            kind = "timedtext"
+        else:
+            standin.count("not_found")
+            self._send(404, b"not found")
+            return
+
+        standin.count(kind)
+        standin.simulate_latency()
+        if standin.should_fail():
+            standin.count("error")
+            self._send(503, b"injected error", headers={"Retry-After": "0"})
+            return
+
+        if kind == "feed":
+            index = standin._channel_index(query.get("channel_id", [""])[0])
+            if index is None:
+                self._send(404, b"unknown channel")
+                return
+            etag = standin.feed_etag(index)
+            if self.headers.get("If-None-Match") == etag:
+                standin.count("not_modified")
+                self._send(304, headers={"ETag": etag})
+                return
+            self._send(200, standin.feed_xml(index), "application/atom+xml; charset=utf-8", {"ETag": etag})
+        elif kind == "channel":
+            handle = parts.path[1:]
+            suffix = handle[len("@standin"):]
+            if not handle.startswith("@standin") or not suffix.isdigit() or int(suffix) >= standin.channel_count:
+                self._send(404, b"unknown handle")
+                return
+            self._send(200, standin.channel_page(int(suffix)))
+        elif kind == "watch":
+            video_id = query.get("v", [""])[0]
+            html = f'<html><script>ytcfg.set({{"INNERTUBE_API_KEY": "standin-key", "VIDEO_ID": "{video_id}"}});</script></html>'
+            self._send(200, html.encode("utf-8"))
+        elif kind == "player":
+            video_id = json.loads(body or b"{}").get("videoId", "")
+            self._send(200, standin.player_json(video_id), "application/json")
+        elif kind == "timedtext":
+            self._send(200, standin.transcript_xml(query.get("v", [""])[0]), "text/xml; charset=utf-8")
+
+    do_GET = _dispatch
+    do_POST = _dispatch
+    do_HEAD = _dispatch
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="YouTube stand-in 서버 단독 실행")
+    parser.add_argument("--channels", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    standin = YouTubeStandin(channels=args.channels, latency_ms=args.latency_ms, error_rate=args.error_rate)
+    print(f"🧪 YouTube stand-in: {standin.start()}  (종료: Ctrl+C)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        standin.stop()